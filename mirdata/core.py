@@ -1,10 +1,19 @@
 # -*- coding: utf-8 -*-
 """core mirdata classes
 """
+from collections import deque, OrderedDict
+from concurrent import futures
+import hashlib
+import heapq
 import importlib
+import logging
+import operator
 import os
 import random
+import threading
+import time
 import types
+import weakref
 import numpy as np
 
 import mirdata
@@ -36,9 +45,37 @@ class Dataset(object):
         readme (str): information about the dataset
         data_home (str): path where mirdata will look for the dataset
 
+    Args:
+        dataset (str): the identifier of the dataset
+        data_home (str or None): path where mirdata will look for the dataset.
+            If None, uses `default_path`
+        cache_tracks (bool): if True, `track` returns the same Track object
+            for a track_id as long as it is alive, so its cached annotations
+            are kept between lookups
+        track_cache_size (int): if cache_tracks is True, number of most
+            recently looked up tracks kept alive by the dataset, so they are
+            reused even if nothing else holds them
+        transform (function or None): function applied to the Track returned
+            by `dataset[i]`, e.g. to return arrays for a training framework.
+            Must be picklable (e.g. a module-level function) for the dataset
+            to be sent to worker processes
+
+    A dataset can be indexed like a sequence of tracks: `len(dataset)` is
+    the number of tracks and `dataset[i]` is the track (or transformed track)
+    with the i-th track_id in sorted order. Slices return lists.
+    Pickling a dataset only stores its name, data_home and options, not its
+    index, which is loaded again when it is unpickled.
+
     """
 
-    def __init__(self, dataset, data_home=None):
+    def __init__(
+        self,
+        dataset,
+        data_home=None,
+        cache_tracks=False,
+        track_cache_size=0,
+        transform=None,
+    ):
         """Inits a dataset by name and data location"""
         if dataset not in DATASETS:
             raise ValueError(
@@ -51,10 +88,18 @@ class Dataset(object):
         self.bibtex = getattr(module, "BIBTEX", None)
         self._remotes = getattr(module, "REMOTES", None)
         self._index = module.DATA.index
+        self._data = module.DATA
         self._download_info = getattr(module, "DOWNLOAD_INFO", None)
         self._track_object = getattr(module, "Track", None)
         self._download_fn = getattr(module, "_download", download_utils.downloader)
+        self._index_metadata_fn = getattr(module, "_index_metadata", None)
+        self._metadata_table = None
         self._readme_str = module.__doc__
+        self._tracks = weakref.WeakValueDictionary() if cache_tracks else None
+        self._recent_tracks = OrderedDict()
+        self._tracks_lock = threading.Lock()
+        self.track_cache_size = track_cache_size
+        self.transform = transform
 
         if data_home is None:
             self.data_home = self.default_path
@@ -89,6 +134,75 @@ class Dataset(object):
 
         return repr_string
 
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (
+                self.name,
+                self.data_home,
+                self._tracks is not None,
+                self.track_cache_size,
+                self.transform,
+            ),
+        )
+
+    def __len__(self):
+        return len(self._sorted_track_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(track_id) for track_id in self._sorted_track_ids[index]]
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(
+                "dataset indices must be integers or slices, not {}".format(
+                    type(index).__name__
+                )
+            )
+        return self._item(self._sorted_track_ids[index])
+
+    def _item(self, track_id):
+        track = self.track(track_id)
+        if self.transform is not None:
+            return self.transform(track)
+        return track
+
+    @utils.cached_property
+    def _sorted_track_ids(self):
+        return sorted(self.track_ids)
+
+    @property
+    def metadata(self):
+        """Get the dataset's metadata, loaded in a single pass and cached
+
+        Returns:
+            metadata (dict): metadata keyed by track_id, or None if the
+                metadata files are not found in data_home
+
+        Raises:
+            NotImplementedError: if the dataset has no metadata
+        """
+        return self._data.metadata(self.data_home)
+
+    def audio_info(self, workers=8, recompute=False):
+        """Get the duration, sample rate, number of channels and frames and
+        the codec of the tracks' audio files. Computed once from the files'
+        headers and saved in data_home (see `utils.LargeData.audio_info`).
+
+        Args:
+            workers (int): number of threads reading the files' headers
+            recompute (bool): if True, the table is computed again, e.g.
+                after downloading more files
+
+        Returns:
+            (dict): {track_id: {index key: utils.AudioInfo}}
+
+        """
+        return self._data.audio_info(
+            self.data_home, workers=workers, recompute=recompute
+        )
+
     @property
     def default_path(self):
         """Get the default path for the dataset
@@ -111,9 +225,24 @@ class Dataset(object):
         """
         if self._track_object is None:
             raise NotImplementedError
-        else:
+        if self._tracks is None:
             return self._track_object(track_id, self.data_home)
 
+        # data_home can be changed after the dataset is created
+        key = (track_id, self.data_home)
+        track = self._tracks.get(key)
+        if track is None:
+            track = self._track_object(track_id, self.data_home)
+        with self._tracks_lock:
+            # another thread may have created the track meanwhile
+            track = self._tracks.setdefault(key, track)
+            if self.track_cache_size > 0:
+                self._recent_tracks[key] = track
+                self._recent_tracks.move_to_end(key)
+                while len(self._recent_tracks) > self.track_cache_size:
+                    self._recent_tracks.popitem(last=False)
+        return track
+
     def load_tracks(self):
         """Load all tracks in the dataset
 
@@ -133,6 +262,278 @@ class Dataset(object):
         """
         return self.track(random.choice(self.track_ids))
 
+    def prefetch_iter(
+        self, fields, track_ids=None, prefetch=8, workers=4, processes=False
+    ):
+        """Iterate over tracks while their data is loaded ahead of time in the
+        background, e.g. to keep a training loop from waiting on disk.
+
+        Usage example:
+        for track_id, data in dataset.prefetch_iter(['audio', 'melody']):
+            audio, sr = data['audio']
+
+        Args:
+            fields (list): names of the Track attributes and properties to load
+            track_ids (list or None): track ids to iterate over, in order.
+                If None, uses `track_ids`
+            prefetch (int): maximum number of tracks loaded or being loaded
+                and not consumed yet. Loading pauses when it is reached.
+            workers (int): number of threads or processes loading tracks
+            processes (bool): if True, tracks are loaded in worker processes
+                (the dataset is pickled to them), which avoids the GIL when
+                decoding, but the loaded data must be pickled back
+
+        Returns:
+            (PrefetchIterator): yields (track_id, {field: value}) tuples
+
+        """
+        if track_ids is None:
+            track_ids = self.track_ids
+        return PrefetchIterator(
+            self,
+            fields,
+            track_ids,
+            prefetch=prefetch,
+            workers=workers,
+            processes=processes,
+        )
+
+    def iter_batches(
+        self,
+        batch_size,
+        bucket_boundaries,
+        pad=True,
+        audio_property="audio",
+        track_ids=None,
+        shuffle=False,
+        seed=None,
+        drop_last=False,
+        workers=4,
+    ):
+        """Iterate over batches of tracks of similar durations, so that
+        little padding is needed to batch their audio together. The audio is
+        loaded in the background by the tracks' audio loaders (see
+        `prefetch_iter`).
+
+        Usage example:
+        for batch in dataset.iter_batches(16, [30, 60, 120]):
+            audio, mask = batch['audio'], batch['mask']
+
+        Args:
+            batch_size (int): maximum number of tracks per batch
+            bucket_boundaries (list): increasing durations in seconds
+                separating the buckets: tracks are only batched with tracks
+                in the same bucket
+            pad (bool): if True, the audio of a batch is padded with zeros to
+                the longest track and stacked. Otherwise it is a list of arrays
+            audio_property (str): name of the Track property returning
+                (audio, sample rate)
+            track_ids (list or None): track ids to batch. If None, uses
+                `track_ids`. Tracks whose audio files are missing (e.g. in a
+                partially downloaded dataset) are left out. Durations are
+                read from `audio_info`, which is computed from the audio
+                files' headers by `workers` threads if it was not saved yet.
+            shuffle (bool): if True, the tracks in each bucket and the order
+                of the batches are shuffled
+            seed (int or None): random seed used when shuffling
+            drop_last (bool): if True, the last batch of each bucket is
+                dropped if it has less than batch_size tracks
+            workers (int): number of threads loading the audio
+
+        Yields:
+            (dict): a batch, with
+                - `track_ids` (list): the batch's track ids
+                - `audio` (np.ndarray or list): the audio, with shape
+                  (batch, [channels,] samples) if pad is True
+                - `lengths` (np.ndarray): number of samples of each track
+                - `mask` (np.ndarray): if pad is True, boolean array with
+                  the shape of the audio without channels, True for samples
+                  which are not padding
+                - `sr` (float): the sample rate
+
+        Raises:
+            ValueError: if the tracks of a batch have different sample
+                rates or numbers of channels
+
+        """
+        batches = self._bucket_batches(
+            batch_size, bucket_boundaries, track_ids, shuffle, seed, drop_last, workers
+        )
+        iterator = self.prefetch_iter(
+            [audio_property],
+            track_ids=[track_id for batch in batches for track_id in batch],
+            prefetch=2 * batch_size,
+            workers=workers,
+        )
+        with iterator:
+            for batch in batches:
+                audio = [next(iterator)[1][audio_property] for _ in batch]
+                yield _make_batch(batch, audio, pad)
+
+    def _bucket_batches(
+        self,
+        batch_size,
+        bucket_boundaries,
+        track_ids,
+        shuffle,
+        seed,
+        drop_last,
+        workers,
+    ):
+        """Group track ids in batches of tracks from the same duration bucket"""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if list(bucket_boundaries) != sorted(bucket_boundaries):
+            raise ValueError("bucket_boundaries must be increasing")
+        if track_ids is None:
+            track_ids = self.track_ids
+
+        audio_info = self.audio_info(workers=workers)
+        buckets = [[] for _ in range(len(bucket_boundaries) + 1)]
+        for track_id in track_ids:
+            # like Track.duration, the track's first existing audio file
+            track_info = audio_info.get(track_id)
+            if track_info:
+                duration = next(iter(track_info.values())).duration
+                buckets[np.searchsorted(bucket_boundaries, duration)].append(track_id)
+
+        random_state = np.random.RandomState(seed)
+        batches = []
+        for bucket in buckets:
+            if shuffle:
+                random_state.shuffle(bucket)
+            for start in range(0, len(bucket), batch_size):
+                batch = bucket[start : start + batch_size]
+                if len(batch) == batch_size or not drop_last:
+                    batches.append(batch)
+        if shuffle:
+            random_state.shuffle(batches)
+        return batches
+
+    def random_crops(
+        self,
+        crop_duration,
+        fields=(),
+        track_ids=None,
+        audio_attribute="audio_path",
+        sr=None,
+        mono=True,
+        seed=None,
+        worker=0,
+        n_crops=None,
+    ):
+        """Sample random crops of the tracks' audio and annotations, e.g. to
+        train a model on fixed length excerpts. Only the cropped window of
+        the audio is read and decoded when the format allows it.
+
+        Usage example:
+        sampler = dataset.random_crops(5.0, fields=['melody'], seed=0, n_crops=1000)
+        for epoch in range(n_epochs):
+            sampler.set_epoch(epoch)
+            for crop in sampler:
+                audio, sr = crop['audio']
+                melody = crop['melody']
+
+        Args:
+            crop_duration (float): duration of the crops in seconds
+            fields (list): names of the Track annotations to crop along with
+                the audio (see `utils.crop_annotation`)
+            track_ids (list or None): track ids to sample from.
+                If None, uses `track_ids`
+            audio_attribute (str): name of the Track attribute with the path
+                of the audio to crop
+            sr (float or None): sample rate to resample the audio to.
+                If None, uses the audio's sample rate
+            mono (bool): if True, the audio is mixed down to mono
+            seed (int or None): random seed. Crops are drawn from a random
+                state seeded with (seed, epoch, worker). If None, crops are
+                not reproducible.
+            worker (int): index of the worker using the sampler, so that
+                parallel workers draw different crops
+            n_crops (int or None): number of crops per epoch. If None,
+                iterating over the sampler never stops
+
+        Returns:
+            (RandomCropSampler): the sampler
+
+        """
+        if track_ids is None:
+            track_ids = self.track_ids
+        return RandomCropSampler(
+            self,
+            crop_duration,
+            fields=fields,
+            track_ids=track_ids,
+            audio_attribute=audio_attribute,
+            sr=sr,
+            mono=mono,
+            seed=seed,
+            worker=worker,
+            n_crops=n_crops,
+        )
+
+    def shard(self, num_shards, shard_index, strategy="contiguous"):
+        """Split the dataset's track ids into num_shards disjoint shards, e.g.
+        to process it on several machines. Shards only depend on the track
+        ids (and, for `balanced`, on the durations of the track's audio), so
+        every process computes the same partition.
+
+        Args:
+            num_shards (int): number of shards
+            shard_index (int): which shard to return, from 0 to num_shards - 1
+            strategy (str): how tracks are assigned to shards:
+                - `contiguous`: consecutive ranges of the sorted track ids
+                - `hash`: by the md5 hash of the track id, so a track stays in
+                  the same shard when tracks are added to or removed from the
+                  dataset
+                - `balanced`: so that the total duration of the tracks' audio
+                  files, read from `Dataset.audio_info`, is about the same in
+                  every shard. Tracks whose audio is missing weigh 0.
+
+        Returns:
+            (list): the shard's track ids, sorted
+
+        Raises:
+            ValueError: if num_shards, shard_index or strategy are invalid
+
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        if not 0 <= shard_index < num_shards:
+            raise ValueError(
+                "shard_index must be between 0 and {}".format(num_shards - 1)
+            )
+
+        track_ids = self._sorted_track_ids
+        if strategy == "contiguous":
+            start = len(track_ids) * shard_index // num_shards
+            end = len(track_ids) * (shard_index + 1) // num_shards
+            return track_ids[start:end]
+        if strategy == "hash":
+            return [
+                track_id
+                for track_id in track_ids
+                if int(hashlib.md5(track_id.encode("utf-8")).hexdigest(), 16)
+                % num_shards
+                == shard_index
+            ]
+        if strategy == "balanced":
+            audio_info = self.audio_info()
+            durations = {
+                track_id: sum(
+                    info.duration for info in audio_info.get(track_id, {}).values()
+                )
+                for track_id in track_ids
+            }
+            # longest tracks first, each to the shortest shard so far
+            shards = [(0, i, []) for i in range(num_shards)]
+            for track_id in sorted(track_ids, key=lambda t: (-durations[t], t)):
+                total, i, shard = heapq.heappop(shards)
+                shard.append(track_id)
+                heapq.heappush(shards, (total + durations[track_id], i, shard))
+            return sorted([shard for _, i, shard in shards if i == shard_index][0])
+        raise ValueError("strategy must be one of contiguous, hash or balanced")
+
     def readme(self):
         """Print the dataset's readme."""
         print(self._readme_str)
@@ -142,7 +543,13 @@ class Dataset(object):
         print("========== BibTeX ==========")
         print(self.bibtex)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=True):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=True,
+        skip_existing=False,
+    ):
         """Download data to `save_dir` and optionally print a message.
 
         Args:
@@ -153,12 +560,37 @@ class Dataset(object):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            skip_existing (bool):
+                If True, archive members which already exist in data_home with
+                the size and checksum listed in the index are not extracted
+                again, e.g. to resume an interrupted extraction.
 
         Raises:
-            ValueError: if invalid keys are passed to partial_download
+            ValueError: if invalid keys are passed to partial_download, or
+                if skip_existing is True and the dataset has its own
+                download function
             IOError: if a downloaded file's checksum is different from expected
 
         """
+        if skip_existing:
+            if self._download_fn is not download_utils.downloader:
+                raise ValueError(
+                    "skip_existing is not supported by {}'s download function".format(
+                        self.name
+                    )
+                )
+            download_utils.download_remotes(
+                self.data_home,
+                remotes=self._remotes,
+                partial_download=partial_download,
+                info_message=self._download_info,
+                force_overwrite=force_overwrite,
+                cleanup=cleanup,
+                skip_existing=True,
+                checksums=utils.index_checksums(self._index),
+            )
+            return
+
         self._download_fn(
             self.data_home,
             remotes=self._remotes,
@@ -168,6 +600,60 @@ class Dataset(object):
             cleanup=cleanup,
         )
 
+    def download_members(
+        self, remote_key, patterns=None, index_keys=None, force_overwrite=False
+    ):
+        """Download only some of the files inside a remote zip archive.
+
+        The files are read from the remote archive with http range requests,
+        so the rest of the archive is never downloaded.
+
+        Args:
+            remote_key (str): key of the zip remote to download from
+            patterns (list or None): glob patterns of the archive members to
+                download, relative to the remote's destination folder
+            index_keys (list or None): keys of the track index to download,
+                e.g. `['melody']` downloads the melody file of every track
+            force_overwrite (bool):
+                If True, existing files are overwritten by the downloaded files.
+
+        Returns:
+            (list): paths of the archive members that were downloaded
+
+        Raises:
+            ValueError: if remote_key is not a zip remote of this dataset
+
+        """
+        if (
+            self._remotes is None
+            or remote_key not in self._remotes
+            or not self._remotes[remote_key].filename.endswith('.zip')
+        ):
+            raise ValueError(
+                '{} is not a zip remote of {}'.format(remote_key, self.name)
+            )
+
+        remote = self._remotes[remote_key]
+        members = []
+        if index_keys is not None:
+            destination_dir = remote.destination_dir or '.'
+            for track_files in self._index['tracks'].values():
+                for key in index_keys:
+                    if key in track_files and track_files[key][0] is not None:
+                        members.append(
+                            os.path.normpath(
+                                os.path.relpath(track_files[key][0], destination_dir)
+                            )
+                        )
+
+        return download_utils.download_zip_members(
+            remote,
+            self.data_home,
+            patterns=patterns,
+            members=members,
+            force_overwrite=force_overwrite,
+        )
+
     @utils.cached_property
     def track_ids(self):
         """Return track ids
@@ -177,6 +663,93 @@ class Dataset(object):
         """
         return list(self._index['tracks'].keys())
 
+    def metadata_table(self):
+        """Get the metadata of every track as columns, without building Track
+        objects. Fields come from the dataset's metadata and from the index
+        (e.g. a genre encoded in the track id); tracks without a value for a
+        field get None.
+
+        Returns:
+            table (dict): {field name: np.ndarray}, one row per track in
+                `track_ids`, including a `track_id` column. Scalar fields
+                with no missing value have a native dtype, other fields
+                have dtype object.
+
+        """
+        try:
+            metadata = self.metadata
+        except NotImplementedError:
+            metadata = None
+
+        if self._metadata_table is not None and self._metadata_table[0] is metadata:
+            return self._metadata_table[1]
+
+        rows = []
+        for track_id in self.track_ids:
+            row = {}
+            if self._index_metadata_fn is not None:
+                row.update(
+                    self._index_metadata_fn(track_id, self._index["tracks"][track_id])
+                )
+            if metadata is not None and isinstance(metadata.get(track_id), dict):
+                row.update(metadata[track_id])
+            rows.append(row)
+
+        fields = []
+        for row in rows:
+            fields.extend(field for field in row if field not in fields)
+
+        table = {"track_id": np.array(self.track_ids)}
+        for field in fields:
+            values = [row.get(field) for row in rows]
+            if all(isinstance(v, (str, int, float, bool)) for v in values) and (
+                len(set(type(v) for v in values)) == 1
+            ):
+                table[field] = np.array(values)
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+                table[field] = column
+
+        self._metadata_table = (metadata, table)
+        return table
+
+    def filter(self, **conditions):
+        """Select tracks by their metadata (see `metadata_table`), without
+        building Track objects. Conditions are combined with a logical and;
+        each one is either
+            - a value: the field is equal to it
+            - a list, tuple or set: the field is one of its values
+            - a function: applied to the field's column, returns a boolean array
+
+        Fields with spaces or parentheses can be passed by unpacking a dict,
+        e.g. `dataset.filter(**{"Instrument (abbr.)": "Vc"})`.
+
+        Args:
+            **conditions: field name to condition
+
+        Returns:
+            track_ids (list): ids of the tracks matching all conditions
+
+        """
+        table = self.metadata_table()
+        mask = np.ones(len(table["track_id"]), dtype=bool)
+        for field, condition in conditions.items():
+            if field not in table:
+                raise ValueError(
+                    "{} is not a metadata field of {}. Valid fields are:\n{}".format(
+                        field, self.name, ",".join(table.keys())
+                    )
+                )
+            column = table[field]
+            if callable(condition):
+                mask &= np.asarray(condition(column), dtype=bool)
+            elif isinstance(condition, (list, tuple, set)):
+                mask &= np.isin(column, list(condition))
+            else:
+                mask &= column == condition
+        return table["track_id"][mask].tolist()
+
     def validate(self, verbose=True):
         """Validate if the stored dataset is a valid version
 
@@ -195,12 +768,496 @@ class Dataset(object):
         )
         return missing_files, invalid_checksums
 
+    def _remote_file_map(self):
+        """Map the files provided by each remote to the remote's key.
+
+        Zip remotes are listed by reading their central directory, and
+        single-file remotes map to their own path. Tar remotes cannot be
+        listed without downloading them.
+
+        Returns:
+            file_map (dict): {path relative to data_home: remote key}
+            unlisted (list): keys of the remotes which could not be listed
+
+        """
+        file_map = {}
+        unlisted = []
+        if self._remotes is None:
+            return file_map, unlisted
+
+        for key, remote in self._remotes.items():
+            destination_dir = remote.destination_dir or ""
+            extension = os.path.splitext(remote.filename)[-1]
+            if ".zip" in extension:
+                try:
+                    members = download_utils.list_zip_members(remote, self.data_home)
+                except Exception:
+                    unlisted.append(key)
+                    continue
+            elif ".gz" in extension or ".tar" in extension:
+                unlisted.append(key)
+                continue
+            else:
+                members = [remote.filename]
+
+            for member in members:
+                file_map[os.path.normpath(os.path.join(destination_dir, member))] = key
+
+        return file_map, unlisted
+
+    def repair(self, missing_files=None, invalid_checksums=None, verbose=True):
+        """Re-download only the files which are missing or have invalid checksums.
+
+        Each failing file is mapped back to the remote which provides it.
+        Files inside zip remotes are extracted one by one (see
+        `download_utils.download_zip_members`), other remotes are downloaded
+        again as a whole. Only the affected files are validated afterwards.
+
+        Args:
+            missing_files (dict or None): missing files, as returned by `validate`
+            invalid_checksums (dict or None): invalid files, as returned by `validate`
+                If either is None, the dataset is validated first.
+            verbose (bool): If False, don't print output
+
+        Returns:
+            missing_files (dict): files which are still missing after the repair
+            invalid_checksums (dict): files which still have invalid checksums
+
+        """
+        if missing_files is None or invalid_checksums is None:
+            missing_files, invalid_checksums = self.validate(verbose=False)
+
+        failing = {}
+        for files in [missing_files, invalid_checksums]:
+            for group in files:
+                for file_id, local_paths in files[group].items():
+                    for local_path in local_paths:
+                        failing[local_path] = (group, file_id)
+
+        if len(failing) == 0:
+            utils.log_message("Nothing to repair.", verbose)
+            return missing_files, invalid_checksums
+
+        file_map, unlisted = self._remote_file_map()
+        zip_members = {}
+        full_remotes = set()
+        for local_path in failing:
+            rel_path = os.path.normpath(os.path.relpath(local_path, self.data_home))
+            key = file_map.get(rel_path)
+            if key is None:
+                # the file may be in any of the remotes we could not list
+                full_remotes.update(unlisted)
+            elif self._remotes[key].filename.endswith(".zip"):
+                destination_dir = self._remotes[key].destination_dir or "."
+                zip_members.setdefault(key, []).append(
+                    os.path.normpath(os.path.relpath(rel_path, destination_dir))
+                )
+            else:
+                full_remotes.add(key)
+
+        for key, members in zip_members.items():
+            utils.log_message(
+                "> repairing {} files from {}".format(len(members), key), verbose
+            )
+            download_utils.download_zip_members(
+                self._remotes[key],
+                self.data_home,
+                members=members,
+                force_overwrite=True,
+            )
+
+        if len(full_remotes) > 0:
+            self._download_fn(
+                self.data_home,
+                remotes=self._remotes,
+                partial_download=sorted(full_remotes),
+                info_message=None,
+                force_overwrite=True,
+                cleanup=True,
+            )
+
+        # validate only the repaired files
+        checksums = utils.index_checksums(self._index)
+        still_missing = {}
+        still_invalid = {}
+        for local_path, (group, file_id) in failing.items():
+            checksum = checksums[
+                os.path.normpath(os.path.relpath(local_path, self.data_home))
+            ]
+            still_missing.setdefault(group, {})
+            still_invalid.setdefault(group, {})
+            utils.validate(
+                file_id,
+                local_path,
+                checksum,
+                still_missing[group],
+                still_invalid[group],
+            )
+
+        return still_missing, still_invalid
+
+
+def _make_batch(track_ids, audio, pad):
+    # audio: list of (y, sr) tuples
+    sample_rates = set(sr for _, sr in audio)
+    if len(sample_rates) > 1:
+        raise ValueError(
+            "tracks {} have different sample rates {}".format(track_ids, sample_rates)
+        )
+    signals = [y for y, _ in audio]
+    if len(set(y.shape[:-1] for y in signals)) > 1:
+        raise ValueError(
+            "tracks {} have different numbers of channels".format(track_ids)
+        )
+
+    lengths = np.array([y.shape[-1] for y in signals])
+    batch = {
+        "track_ids": list(track_ids),
+        "lengths": lengths,
+        "sr": sample_rates.pop(),
+    }
+    if not pad:
+        batch["audio"] = signals
+        return batch
+
+    padded = np.zeros(
+        (len(signals),) + signals[0].shape[:-1] + (lengths.max(),),
+        dtype=signals[0].dtype,
+    )
+    for i, y in enumerate(signals):
+        padded[i, ..., : y.shape[-1]] = y
+    batch["audio"] = padded
+    batch["mask"] = np.arange(lengths.max())[np.newaxis, :] < lengths[:, np.newaxis]
+    return batch
+
+
+def _load_fields(dataset, track_id, fields):
+    track = dataset.track(track_id)
+    return {field: getattr(track, field) for field in fields}
+
+
+class PrefetchIterator(object):
+    """Iterator returned by `Dataset.prefetch_iter`, yielding
+    (track_id, {field: value}) tuples in the order of the track ids, while
+    the next tracks are loaded by a thread or process pool.
+
+    Attributes:
+        prefetch (int): maximum number of tracks loaded ahead
+        n_items (int): number of tracks yielded so far
+        n_stalls (int): number of tracks which were not loaded yet when
+            they were requested
+        stall_time (float): total time in seconds spent waiting for tracks
+            to be loaded
+
+    """
+
+    def __init__(
+        self, dataset, fields, track_ids, prefetch=8, workers=4, processes=False
+    ):
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.prefetch = prefetch
+        self.n_items = 0
+        self.n_stalls = 0
+        self.stall_time = 0.0
+        self._dataset = dataset
+        self._fields = list(fields)
+        self._track_ids = iter(track_ids)
+        self._pending = deque()
+        if processes:
+            self._executor = futures.ProcessPoolExecutor(max_workers=workers)
+        else:
+            self._executor = futures.ThreadPoolExecutor(max_workers=workers)
+        self._fill()
+
+    @property
+    def queue_depth(self):
+        """int: number of tracks loaded and waiting to be consumed"""
+        return sum(future.done() for _, future in self._pending)
+
+    @property
+    def in_flight(self):
+        """int: number of tracks loaded or being loaded, up to `prefetch`"""
+        return len(self._pending)
+
+    def _fill(self):
+        while len(self._pending) < self.prefetch:
+            try:
+                track_id = next(self._track_ids)
+            except StopIteration:
+                return
+            future = self._executor.submit(
+                _load_fields, self._dataset, track_id, self._fields
+            )
+            self._pending.append((track_id, future))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._pending:
+            self.close()
+            raise StopIteration
+
+        track_id, future = self._pending.popleft()
+        # keep loading while waiting for this track
+        self._fill()
+        if not future.done():
+            self.n_stalls += 1
+            start = time.perf_counter()
+            futures.wait([future])
+            self.stall_time += time.perf_counter() - start
+
+        try:
+            data = future.result()
+        except BaseException:
+            self.close()
+            raise
+        self.n_items += 1
+        return track_id, data
+
+    def close(self):
+        """Stop loading tracks. Tracks being loaded are discarded."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RandomCropSampler(object):
+    """Sampler returned by `Dataset.random_crops`. Iterating over it yields
+    dictionaries with the crop's `track_id`, `offset` (in seconds), `audio`
+    (y, sr) and cropped annotations, with times relative to the offset.
+
+    Tracks are drawn with probability proportional to their duration, read
+    from `Dataset.audio_info` the first time crops are drawn, and crops start
+    uniformly within the track. Tracks without audio are never drawn, and
+    tracks shorter than the crop duration give shorter crops.
+
+    Attributes:
+        epoch (int): the current epoch, see `set_epoch`
+
+    """
+
+    def __init__(
+        self,
+        dataset,
+        crop_duration,
+        fields=(),
+        track_ids=None,
+        audio_attribute="audio_path",
+        sr=None,
+        mono=True,
+        seed=None,
+        worker=0,
+        n_crops=None,
+    ):
+        if crop_duration <= 0:
+            raise ValueError("crop_duration must be positive")
+
+        self.epoch = 0
+        self.crop_duration = crop_duration
+        self.fields = list(fields)
+        self.track_ids = list(track_ids if track_ids is not None else dataset.track_ids)
+        self.audio_attribute = audio_attribute
+        self.sr = sr
+        self.mono = mono
+        self.seed = seed
+        self.worker = worker
+        self.n_crops = n_crops
+        self._dataset = dataset
+
+    def set_epoch(self, epoch):
+        """Set the epoch, to draw different (and reproducible) crops at
+        every epoch.
+
+        Args:
+            epoch (int): the epoch
+
+        """
+        self.epoch = epoch
+
+    @utils.cached_property
+    def durations(self):
+        """np.ndarray: duration in seconds of each track, from the dataset's
+        `audio_info` table. 0 if its audio file is missing or unreadable."""
+        # get_audio_duration looks the files up in the loaded table
+        self._dataset.audio_info()
+        durations = np.zeros(len(self.track_ids))
+        for i, track_id in enumerate(self.track_ids):
+            audio_path = getattr(self._dataset.track(track_id), self.audio_attribute)
+            if audio_path is None or not os.path.exists(audio_path):
+                continue
+            try:
+                durations[i] = utils.get_audio_duration(audio_path)
+            except Exception as exc:
+                logging.warning(
+                    "Could not read the duration of {}: {}".format(audio_path, exc)
+                )
+        return durations
+
+    def draw(self, random_state):
+        """Draw the track and offset of a crop.
+
+        Args:
+            random_state (np.random.RandomState): the random state to use
+
+        Returns:
+            track_id (str): the track's id
+            offset (float): the start of the crop in seconds
+
+        """
+        total = self.durations.sum()
+        if total == 0:
+            raise ValueError("None of the tracks has audio to crop")
+        i = random_state.choice(len(self.track_ids), p=self.durations / total)
+        offset = random_state.uniform(0, max(self.durations[i] - self.crop_duration, 0))
+        return self.track_ids[i], offset
+
+    def crop(self, track_id, offset):
+        """Load a crop.
+
+        Args:
+            track_id (str): the track's id
+            offset (float): the start of the crop in seconds
+
+        Returns:
+            (dict): the crop's `track_id`, `offset`, `audio` and fields
+
+        """
+        track = self._dataset.track(track_id)
+        crop = {
+            "track_id": track_id,
+            "offset": offset,
+            "audio": utils.load_audio_window(
+                getattr(track, self.audio_attribute),
+                offset,
+                self.crop_duration,
+                sr=self.sr,
+                mono=self.mono,
+            ),
+        }
+        for field in self.fields:
+            crop[field] = utils.crop_annotation(
+                getattr(track, field), offset, offset + self.crop_duration
+            )
+        return crop
+
+    def __iter__(self):
+        if self.seed is None:
+            random_state = np.random.RandomState()
+        else:
+            random_state = np.random.RandomState([self.seed, self.epoch, self.worker])
+        n_crops = 0
+        while self.n_crops is None or n_crops < self.n_crops:
+            yield self.crop(*self.draw(random_state))
+            n_crops += 1
+
+    def __len__(self):
+        if self.n_crops is None:
+            raise TypeError("the sampler has no length if n_crops is None")
+        return self.n_crops
+
+
+class TrackPath(object):
+    """A track attribute holding the path of one of the track's files, joined
+    with data_home when it is accessed rather than when the track is created.
+    None if the file's path in the index is None.
+
+    Args:
+        key (str): the file's key in the track's index entry
+        *folders (str): folders between data_home and the indexed path
+
+    """
+
+    def __init__(self, key, *folders):
+        self.key = key
+        self.folders = folders
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        path = obj._track_paths[self.key][0]
+        if path is None:
+            return None
+        return os.path.join(obj._data_home, *(self.folders + (path,)))
+
+
+class TrackMetadata(object):
+    """A track attribute read from the track's `_track_metadata` dictionary
+    when it is accessed rather than copied when the track is created.
+    None if the field is missing.
+
+    Args:
+        field (str): the field's key in `_track_metadata`
+
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        return obj._track_metadata.get(self.field)
+
+
+# class attributes holding per-track values, which are shown and tested
+# as track attributes rather than properties
+TRACK_ATTRIBUTE_TYPES = (TrackPath, TrackMetadata, types.MemberDescriptorType)
+
 
 class Track(object):
+    # track_id, _data_home, _track_paths and _track_metadata are stored in slots,
+    # so a track only gets a __dict__ when it has other attributes or cached
+    # properties. Subclasses keep this by declaring `__slots__ = ()`.
+    # The __dict__ slot itself adds about 32 bytes per track on CPython 3.11
+    # (316 KB per 10k tracks, measured by
+    # scripts/benchmark_track_construction.py), and lets the modules which
+    # set other attributes in __init__ share this base.
+    # __weakref__ lets utils.ANNOTATION_CACHE release a track's annotations.
+    __slots__ = (
+        "track_id",
+        "_data_home",
+        "_track_paths",
+        "_track_metadata",
+        "__dict__",
+        "__weakref__",
+    )
+
+    def __getattr__(self, name):
+        # only called when the attribute is not found, e.g. an unset slot:
+        # subclasses defining _load_track_metadata() resolve _track_metadata
+        # the first time it is read rather than when the track is created
+        if name == "_track_metadata" and hasattr(
+            self.__class__, "_load_track_metadata"
+        ):
+            self._track_metadata = self._load_track_metadata()
+            return self._track_metadata
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(self.__class__.__name__, name)
+        )
+
     def __repr__(self):
-        properties = [v for v in dir(self.__class__) if not v.startswith("_")]
+        properties = [
+            v
+            for v in dir(self.__class__)
+            if not v.startswith("_")
+            and not isinstance(getattr(self.__class__, v), TRACK_ATTRIBUTE_TYPES)
+        ]
         attributes = [
-            v for v in dir(self) if not v.startswith("_") and v not in properties
+            v
+            for v in dir(self)
+            if not v.startswith("_") and v not in properties and hasattr(self, v)
         ]
 
         repr_str = "Track(\n"
@@ -227,6 +1284,25 @@ class Track(object):
         repr_str += ")"
         return repr_str
 
+    @property
+    def duration(self):
+        """float: duration in seconds of the track's first existing audio file,
+        from the dataset's audio info table if it was loaded, otherwise from
+        the file's header. None if none of its audio files exist."""
+        for file_path, _ in self._track_paths.values():
+            if file_path is not None and file_path.lower().endswith(
+                utils.AUDIO_EXTENSIONS
+            ):
+                audio_path = os.path.join(self._data_home, file_path)
+                if os.path.exists(audio_path):
+                    return utils.get_audio_duration(audio_path)
+        return None
+
+    def __reduce__(self):
+        # a track is rebuilt from the index where it is unpickled: cached
+        # annotations and attributes set on the track are not pickled
+        return (self.__class__, (self.track_id, self._data_home))
+
     def to_jams(self):
         raise NotImplementedError
 
@@ -241,6 +1317,9 @@ class MultiTrack(Track):
 
     """
 
+    def __reduce__(self):
+        return (self.__class__, (self.mtrack_id, self._data_home))
+
     def _check_mixable(self):
         if not hasattr(self, "tracks") or not hasattr(self, "track_audio_property"):
             raise NotImplementedError(
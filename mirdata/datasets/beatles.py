@@ -67,6 +67,14 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    beats_path = core.TrackPath("beat")
+    chords_path = core.TrackPath("chords")
+    keys_path = core.TrackPath("keys")
+    sections_path = core.TrackPath("sections")
+    audio_path = core.TrackPath("audio")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in Beatles".format(track_id))
@@ -75,36 +83,24 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.beats_path = utils.none_path_join(
-            [self._data_home, self._track_paths["beat"][0]]
-        )
-        self.chords_path = os.path.join(self._data_home, self._track_paths["chords"][0])
-        self.keys_path = utils.none_path_join(
-            [self._data_home, self._track_paths["keys"][0]]
-        )
-        self.sections_path = os.path.join(
-            self._data_home, self._track_paths["sections"][0]
-        )
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-
         self.title = os.path.basename(self._track_paths["sections"][0]).split(".")[0]
 
-    @utils.cached_property
+    @utils.cached_annotation
     def beats(self):
         """BeatData: human-labeled beat annotation"""
         return load_beats(self.beats_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def chords(self):
         """ChordData: chord annotation"""
         return load_chords(self.chords_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def key(self):
         """KeyData: key annotation"""
         return load_key(self.keys_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def sections(self):
         """SectionData: section annotation"""
         return load_sections(self.sections_path)
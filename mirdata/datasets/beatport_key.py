@@ -17,7 +17,6 @@ dance music subgenres.
 
 Data License: Creative Commons Attribution Share Alike 4.0 International
 """
-import fnmatch
 import json
 import librosa
 import os
@@ -77,6 +76,12 @@ class Track(core.Track):
         track_id (str): track id
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+    keys_path = core.TrackPath("key")
+    metadata_path = core.TrackPath("meta")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -87,34 +92,32 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.keys_path = os.path.join(self._data_home, self._track_paths["key"][0])
-        self.metadata_path = (
-            os.path.join(self._data_home, self._track_paths["meta"][0])
-            if self._track_paths["meta"][0] is not None
-            else None
-        )
         self.title = self.audio_path.replace(".mp3", "").split("/")[-1]
 
-    @utils.cached_property
+    @utils.cached_annotation
     def key(self):
         """List of String: list of possible key annotations"""
         return load_key(self.keys_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
+    def _metadata(self):
+        # parsed once and shared by artists, genres and tempo
+        return load_meta(self.metadata_path)
+
+    @utils.cached_annotation
     def artists(self):
         """Dict: artist annotation"""
-        return load_artist(self.metadata_path)
+        return load_artist(self.metadata_path, self._metadata)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def genres(self):
         """Dict: genre annotation"""
-        return load_genre(self.metadata_path)
+        return load_genre(self.metadata_path, self._metadata)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def tempo(self):
         """int: tempo beatports crowdsourced annotation"""
-        return load_tempo(self.metadata_path)
+        return load_tempo(self.metadata_path, self._metadata)
 
     @property
     def audio(self):
@@ -148,57 +151,23 @@ def load_audio(audio_path):
     return librosa.load(audio_path, sr=None, mono=True)
 
 
-def find_replace(directory, find, replace, pattern):
-    """
-    Replace in some directory all the songs with the format pattern find by replace
-    Parameters
-    ----------
-    directory (str) path to directory
-    find (str) string from replace
-    replace (str) string to replace
-    pattern (str) regex that must match the directories searrched
+def load_meta(metadata_path):
+    """Load a beatport_key metadata file.
+    Some of the files contain `nan` values, which are not valid JSON:
+    they are replaced by `null` when the file is read.
+    Args:
+        metadata_path (str): path to metadata annotation file
+    Returns:
+        (dict): the track's metadata
     """
-    for path, dirs, files in os.walk(os.path.abspath(directory)):
-        for filename in fnmatch.filter(files, pattern):
-            filepath = os.path.join(path, filename)
-            with open(filepath) as f:
-                s = f.read()
-            s = s.replace(find, replace)
-            with open(filepath, "w") as f:
-                f.write(s)
-
+    if metadata_path is None:
+        return None
 
-def _download(
-    save_dir, remotes, partial_download, info_message, force_overwrite, cleanup
-):
-    """Download the dataset.
+    if not os.path.exists(metadata_path):
+        raise IOError("metadata_path {} does not exist".format(metadata_path))
 
-    Args:
-        save_dir (str):
-            The directory to download the data
-        remotes (dict or None):
-            A dictionary of RemoteFileMetadata tuples of data in zip format.
-            If None, there is no data to download
-        partial_download (list or None):
-            A list of keys to partially download the remote objects of the download dict.
-            If None, all data is downloaded
-        info_message (str or None):
-            A string of info to print when this function is called.
-            If None, no string is printed.
-        force_overwrite (bool):
-            If True, existing files are overwritten by the downloaded files.
-        cleanup (bool):
-            Whether to delete the zip/tar file after extracting.
-    """
-    download_utils.downloader(
-        save_dir,
-        remotes=remotes,
-        partial_download=partial_download,
-        force_overwrite=force_overwrite,
-        cleanup=cleanup,
-    )
-    # removing nans from JSON files
-    find_replace(os.path.join(save_dir, "meta"), ": nan", ": null", "*.json")
+    with open(metadata_path) as json_file:
+        return json.loads(json_file.read().replace(": nan", ": null"))
 
 
 def load_key(keys_path):
@@ -224,61 +193,55 @@ def load_key(keys_path):
     return keys
 
 
-def load_tempo(metadata_path):
+def load_tempo(metadata_path, meta=None):
     """Load beatport_key tempo data from a file
     Args:
         metadata_path (str): path to metadata annotation file
+        meta (dict): pre-loaded metadata (see `load_meta`) or None
+            if None, the metadata is loaded using metadata_path
     Returns:
         (str): loaded tempo data
     """
-    if metadata_path is None:
+    if meta is None:
+        meta = load_meta(metadata_path)
+    if meta is None:
         return None
 
-    if not os.path.exists(metadata_path):
-        raise IOError("metadata_path {} does not exist".format(metadata_path))
-
-    with open(metadata_path) as json_file:
-        meta = json.load(json_file)
-
     return meta["bpm"]
 
 
-def load_genre(metadata_path):
+def load_genre(metadata_path, meta=None):
     """Load beatport_key genre data from a file
     Args:
         metadata_path (str): path to metadata annotation file
+        meta (dict): pre-loaded metadata (see `load_meta`) or None
+            if None, the metadata is loaded using metadata_path
     Returns:
         (dict): with the list of strings with genres ['genres'] and list of strings with sub-genres ['sub_genres']
     """
-    if metadata_path is None:
+    if meta is None:
+        meta = load_meta(metadata_path)
+    if meta is None:
         return None
 
-    if not os.path.exists(metadata_path):
-        raise IOError("metadata_path {} does not exist".format(metadata_path))
-
-    with open(metadata_path) as json_file:
-        meta = json.load(json_file)
-
     return {
         "genres": [genre["name"] for genre in meta["genres"]],
         "sub_genres": [genre["name"] for genre in meta["sub_genres"]],
     }
 
 
-def load_artist(metadata_path):
+def load_artist(metadata_path, meta=None):
     """Load beatport_key tempo data from a file
     Args:
         metadata_path (str): path to metadata annotation file
+        meta (dict): pre-loaded metadata (see `load_meta`) or None
+            if None, the metadata is loaded using metadata_path
     Returns:
         (list of strings): list of artists involved in the track.
     """
-    if metadata_path is None:
+    if meta is None:
+        meta = load_meta(metadata_path)
+    if meta is None:
         return None
 
-    if not os.path.exists(metadata_path):
-        raise IOError("metadata_path {} does not exist".format(metadata_path))
-
-    with open(metadata_path) as json_file:
-        meta = json.load(json_file)
-
     return [artist["name"] for artist in meta["artists"]]
@@ -223,6 +223,18 @@ class Track(core.Track):
         duration (str): duration in seconds of the track
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath('audio')
+    spectrogram_path = core.TrackPath('spectrum')
+    f0_path = core.TrackPath('f0')
+    notes_path = core.TrackPath('notes')
+    identifier = core.TrackMetadata('musicBrainzID')
+    artist = core.TrackMetadata('artist')
+    title = core.TrackMetadata('title')
+    release = core.TrackMetadata('release')
+    duration = core.TrackMetadata('duration')
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError('{} is not a valid track ID in Example'.format(track_id))
@@ -232,12 +244,6 @@ class Track(core.Track):
         self._data_home = data_home
 
         self._track_paths = DATA.index['tracks'][track_id]
-        self.audio_path = os.path.join(self._data_home, self._track_paths['audio'][0])
-        self.spectrogram_path = os.path.join(
-            self._data_home, self._track_paths['spectrum'][0]
-        )
-        self.f0_path = os.path.join(self._data_home, self._track_paths['f0'][0])
-        self.notes_path = os.path.join(self._data_home, self._track_paths['notes'][0])
 
         metadata = DATA.metadata(data_home=data_home)
         if metadata is not None and track_id in metadata:
@@ -251,12 +257,6 @@ class Track(core.Track):
                 'duration': None,
             }
 
-        self.identifier = self._track_metadata['musicBrainzID']
-        self.artist = self._track_metadata['artist']
-        self.title = self._track_metadata['title']
-        self.release = self._track_metadata['release']
-        self.duration = self._track_metadata['duration']
-
     @property
     def audio(self):
         """(np.ndarray, float): audio signal, sample rate"""
@@ -267,12 +267,12 @@ class Track(core.Track):
         """(np.ndarray, float): spectrogram"""
         return load_spectrogram(self.spectrogram_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def melody(self):
         """F0Data: audio signal, sample rate"""
         return load_melody(self.f0_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def notes(self):
         """NoteData: audio signal, sample rate"""
         return load_notes(self.notes_path)
@@ -109,6 +109,10 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    annotation_path = core.TrackPath("annot")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in DALI".format(track_id))
@@ -116,9 +120,6 @@ class Track(core.Track):
         self.track_id = track_id
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.annotation_path = os.path.join(
-            self._data_home, self._track_paths["annot"][0]
-        )
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -158,27 +159,27 @@ class Track(core.Track):
             self.language = None
             self.audio_path = None
 
-    @utils.cached_property
+    @utils.cached_annotation
     def notes(self):
         """NoteData: note-aligned lyrics"""
         return load_annotations_granularity(self.annotation_path, "notes")
 
-    @utils.cached_property
+    @utils.cached_annotation
     def words(self):
         """LyricData: word-aligned lyric"""
         return load_annotations_granularity(self.annotation_path, "words")
 
-    @utils.cached_property
+    @utils.cached_annotation
     def lines(self):
         """LyricData: line-aligned lyrics"""
         return load_annotations_granularity(self.annotation_path, "lines")
 
-    @utils.cached_property
+    @utils.cached_annotation
     def paragraphs(self):
         """LyricData: paragraph-aligned lyrics"""
         return load_annotations_granularity(self.annotation_path, "paragraphs")
 
-    @utils.cached_property
+    @utils.cached_annotation
     def annotation_object(self):
         """DALI.Annotations: DALI Annotations object"""
         return load_annotations_class(self.annotation_path)
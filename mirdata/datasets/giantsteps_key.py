@@ -28,6 +28,7 @@ All the data of this dataset is licensed with Creative Commons Attribution Share
 
 import json
 import librosa
+import logging
 import os
 
 from mirdata import download_utils
@@ -63,7 +64,34 @@ REMOTES = {
     ),
 }
 
-DATA = utils.LargeData("giantsteps_key_index.json")
+
+def _load_metadata(data_home):
+    metadata_index = {}
+    for track_id, track_paths in DATA.index["tracks"].items():
+        if track_paths["meta"][0] is None:
+            continue
+        metadata_path = os.path.join(data_home, track_paths["meta"][0])
+        if not os.path.exists(metadata_path):
+            continue
+        meta = load_meta(metadata_path)
+        metadata_index[track_id] = {
+            "artists": load_artist(metadata_path, meta),
+            "genres": load_genre(metadata_path, meta),
+            "tempo": load_tempo(metadata_path, meta),
+        }
+
+    if not metadata_index:
+        logging.info("No metadata files found in {}.".format(data_home))
+        return None
+
+    metadata_index["data_home"] = data_home
+    return metadata_index
+
+
+# the meta directory's mtime changes when metadata files are added or removed
+DATA = utils.LargeData(
+    "giantsteps_key_index.json", _load_metadata, metadata_paths=["meta"]
+)
 
 
 class Track(core.Track):
@@ -81,6 +109,12 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+    keys_path = core.TrackPath("key")
+    metadata_path = core.TrackPath("meta")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -91,34 +125,32 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.keys_path = os.path.join(self._data_home, self._track_paths["key"][0])
-        self.metadata_path = (
-            os.path.join(self._data_home, self._track_paths["meta"][0])
-            if self._track_paths["meta"][0] is not None
-            else None
-        )
         self.title = self.audio_path.replace(".mp3", "").split("/")[-1]
 
-    @utils.cached_property
+    @utils.cached_annotation
     def key(self):
         """String: key annotation"""
         return load_key(self.keys_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
+    def _metadata(self):
+        # parsed once and shared by artists, genres and tempo
+        return load_meta(self.metadata_path)
+
+    @utils.cached_annotation
     def artists(self):
         """Dict: artist annotation"""
-        return load_artist(self.metadata_path)
+        return load_artist(self.metadata_path, self._metadata)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def genres(self):
         """Dict: genre annotation"""
-        return load_genre(self.metadata_path)
+        return load_genre(self.metadata_path, self._metadata)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def tempo(self):
         """int: tempo beatports crowdsourced annotation"""
-        return load_tempo(self.metadata_path)
+        return load_tempo(self.metadata_path, self._metadata)
 
     @property
     def audio(self):
@@ -177,14 +209,14 @@ def load_key(keys_path):
     return key
 
 
-def load_tempo(metadata_path):
-    """Load giantsteps_key tempo data from a file
+def load_meta(metadata_path):
+    """Load a giantsteps_key metadata file
 
     Args:
         metadata_path (str): path to metadata annotation file
 
     Returns:
-        (str): loaded tempo data
+        (dict): the track's metadata
 
     """
     if metadata_path is None:
@@ -194,52 +226,66 @@ def load_tempo(metadata_path):
         raise IOError("metadata_path {} does not exist".format(metadata_path))
 
     with open(metadata_path) as json_file:
-        meta = json.load(json_file)
+        return json.load(json_file)
+
+
+def load_tempo(metadata_path, meta=None):
+    """Load giantsteps_key tempo data from a file
+
+    Args:
+        metadata_path (str): path to metadata annotation file
+        meta (dict): pre-loaded metadata (see `load_meta`) or None
+            if None, the metadata is loaded using metadata_path
+
+    Returns:
+        (str): loaded tempo data
+
+    """
+    if meta is None:
+        meta = load_meta(metadata_path)
+    if meta is None:
+        return None
 
     return meta["bpm"]
 
 
-def load_genre(metadata_path):
+def load_genre(metadata_path, meta=None):
     """Load giantsteps_key genre data from a file
 
     Args:
         metadata_path (str): path to metadata annotation file
+        meta (dict): pre-loaded metadata (see `load_meta`) or None
+            if None, the metadata is loaded using metadata_path
 
     Returns:
         (dict): with the list of strings with genres ['genres'] and list of strings with sub-genres ['sub_genres']
     """
-    if metadata_path is None:
+    if meta is None:
+        meta = load_meta(metadata_path)
+    if meta is None:
         return None
 
-    if not os.path.exists(metadata_path):
-        raise IOError("metadata_path {} does not exist".format(metadata_path))
-
-    with open(metadata_path) as json_file:
-        meta = json.load(json_file)
-
     return {
         "genres": [genre["name"] for genre in meta["genres"]],
         "sub_genres": [genre["name"] for genre in meta["sub_genres"]],
     }
 
 
-def load_artist(metadata_path):
+def load_artist(metadata_path, meta=None):
     """Load giantsteps_key tempo data from a file
 
     Args:
         metadata_path (str): path to metadata annotation file
+        meta (dict): pre-loaded metadata (see `load_meta`) or None
+            if None, the metadata is loaded using metadata_path
 
     Returns:
         (list of strings): list of artists involved in the track.
 
     """
-    if metadata_path is None:
+    if meta is None:
+        meta = load_meta(metadata_path)
+    if meta is None:
         return None
 
-    if not os.path.exists(metadata_path):
-        raise IOError("metadata_path {} does not exist".format(metadata_path))
-
-    with open(metadata_path) as json_file:
-        meta = json.load(json_file)
-
     return [artist["name"] for artist in meta["artists"]]
@@ -123,6 +123,12 @@ class Track(core.Track):
         annotation_v2_path (str): track annotation v2 path
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+    annotation_v1_path = core.TrackPath("annotation_v1")
+    annotation_v2_path = core.TrackPath("annotation_v2")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -133,27 +139,19 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.annotation_v1_path = os.path.join(
-            self._data_home, self._track_paths["annotation_v1"][0]
-        )
-        self.annotation_v2_path = os.path.join(
-            self._data_home, self._track_paths["annotation_v2"][0]
-        )
-
         self.title = self.audio_path.replace(".mp3", "").split("/")[-1].split(".")[0]
 
-    @utils.cached_property
+    @utils.cached_annotation
     def genre(self):
         """genre: human-labeled metadata annotation"""
         return load_genre(self.annotation_v1_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def tempo(self):
         """TempoData: tempo annotation ordered by confidence"""
         return load_tempo(self.annotation_v1_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def tempo_v2(self):
         """TempoData: tempos annotation ordered by confidence"""
         return load_tempo(self.annotation_v2_path)
@@ -43,10 +43,8 @@ Attribution 4.0 International (CC BY 4.0) License.
 For more details, please visit: http://magenta.tensorflow.org/datasets/groove
 """
 import csv
-import glob
 import logging
 import os
-import shutil
 
 import librosa
 import numpy as np
@@ -68,6 +66,7 @@ REMOTES = {
         url="http://storage.googleapis.com/magentadata/datasets/groove/groove-v1.0.0.zip",
         checksum="99db7e2a087761a913b2abfb19e86181",
         destination_dir=None,
+        path_rewrite="groove",
     )
 }
 
@@ -249,6 +248,21 @@ class Track(core.Track):
             'train', 'valid' or 'test'.
     """
 
+    __slots__ = ()
+
+    drummer = core.TrackMetadata("drummer")
+    session = core.TrackMetadata("session")
+    style = core.TrackMetadata("style")
+    tempo = core.TrackMetadata("tempo")
+    beat_type = core.TrackMetadata("beat_type")
+    time_signature = core.TrackMetadata("time_signature")
+    duration = core.TrackMetadata("duration")
+    split = core.TrackMetadata("split")
+    midi_filename = core.TrackMetadata("midi_filename")
+    audio_filename = core.TrackMetadata("audio_filename")
+    midi_path = core.TrackPath("midi")
+    audio_path = core.TrackPath("audio")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -277,39 +291,22 @@ class Track(core.Track):
                 "split": None,
             }
 
-        self.drummer = self._track_metadata["drummer"]
-        self.session = self._track_metadata["session"]
-        self.style = self._track_metadata["style"]
-        self.tempo = self._track_metadata["tempo"]
-        self.beat_type = self._track_metadata["beat_type"]
-        self.time_signature = self._track_metadata["time_signature"]
-        self.duration = self._track_metadata["duration"]
-        self.split = self._track_metadata["split"]
-        self.midi_filename = self._track_metadata["midi_filename"]
-        self.audio_filename = self._track_metadata["audio_filename"]
-
-        self.midi_path = os.path.join(self._data_home, self._track_paths["midi"][0])
-
-        self.audio_path = utils.none_path_join(
-            [self._data_home, self._track_paths["audio"][0]]
-        )
-
     @property
     def audio(self):
         """(np.ndarray, float): audio signal, sample rate"""
         return load_audio(self.audio_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def beats(self):
         """BeatData: machine-generated beat annotation"""
         return load_beats(self.midi_path, self.midi)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def drum_events(self):
         """EventData: annotated drum kit events"""
         return load_drum_events(self.midi_path, self.midi)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def midi(self):
         """(obj): prettyMIDI obj"""
         return load_midi(self.midi_path)
@@ -404,45 +401,3 @@ def load_drum_events(midi_path, midi=None):
         end_times.append(note.end)
         events.append(DRUM_MAPPING[note.pitch])
     return utils.EventData(np.array(start_times), np.array(end_times), np.array(events))
-
-
-def _download(
-    save_dir, remotes, partial_download, info_message, force_overwrite, cleanup
-):
-    """Download the dataset.
-
-    Args:
-        save_dir (str):
-            The directory to download the data
-        remotes (dict or None):
-            A dictionary of RemoteFileMetadata tuples of data in zip format.
-            If None, there is no data to download
-        partial_download (list or None):
-            A list of keys to partially download the remote objects of the download dict.
-            If None, all data is downloaded
-        info_message (str or None):
-            A string of info to print when this function is called.
-            If None, no string is printed.
-        force_overwrite (bool):
-            If True, existing files are overwritten by the downloaded files.
-        cleanup (bool):
-            Whether to delete the zip/tar file after extracting.
-
-    """
-    download_utils.downloader(
-        save_dir,
-        remotes=remotes,
-        info_message=None,
-        force_overwrite=force_overwrite,
-        cleanup=cleanup,
-    )
-
-    # files get downloaded to a folder called groove - move everything up a level
-    groove_dir = os.path.join(save_dir, "groove")
-    groove_files = glob.glob(os.path.join(groove_dir, "*"))
-
-    for fpath in groove_files:
-        shutil.move(fpath, save_dir)
-
-    if os.path.exists(groove_dir):
-        shutil.rmtree(groove_dir)
@@ -18,7 +18,6 @@ from mirdata import jams_utils
 from mirdata import core
 from mirdata import utils
 
-
 BIBTEX = """@article{tzanetakis2002gtzan,
   title={GTZAN genre collection},
   author={Tzanetakis, George and Cook, P},
@@ -37,6 +36,13 @@ REMOTES = {
 DATA = utils.LargeData("gtzan_genre_index.json")
 
 
+def _index_metadata(track_id, track_paths):
+    genre = track_id.split(".")[0]
+    if genre == "hiphop":
+        genre = "hip-hop"
+    return {"genre": genre}
+
+
 class Track(core.Track):
     """gtzan_genre Track class
 
@@ -50,6 +56,10 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -61,11 +71,7 @@ class Track(core.Track):
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
 
-        self.genre = track_id.split(".")[0]
-        if self.genre == "hiphop":
-            self.genre = "hip-hop"
-
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
+        self.genre = _index_metadata(track_id, self._track_paths)["genre"]
 
     @property
     def audio(self):
@@ -132,6 +132,14 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    audio_hex_cln_path = core.TrackPath("audio_hex_cln")
+    audio_hex_path = core.TrackPath("audio_hex")
+    audio_mic_path = core.TrackPath("audio_mic")
+    audio_mix_path = core.TrackPath("audio_mix")
+    jams_path = core.TrackPath("jams")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in GuitarSet".format(track_id))
@@ -141,20 +149,6 @@ class Track(core.Track):
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
 
-        self.audio_hex_cln_path = os.path.join(
-            self._data_home, self._track_paths["audio_hex_cln"][0]
-        )
-        self.audio_hex_path = os.path.join(
-            self._data_home, self._track_paths["audio_hex"][0]
-        )
-        self.audio_mic_path = os.path.join(
-            self._data_home, self._track_paths["audio_mic"][0]
-        )
-        self.audio_mix_path = os.path.join(
-            self._data_home, self._track_paths["audio_mix"][0]
-        )
-        self.jams_path = os.path.join(self._data_home, self._track_paths["jams"][0])
-
         title_list = track_id.split("_")  # [PID, S-T-K, mode, rec_mode]
         style, tempo, _ = title_list[1].split("-")  # [style, tempo, key]
         self.player_id = title_list[0]
@@ -162,12 +156,12 @@ class Track(core.Track):
         self.tempo = float(tempo)
         self.style = _STYLE_DICT[style[:-1]]
 
-    @utils.cached_property
+    @utils.cached_annotation
     def beats(self):
         """BeatData: the track's beat positions"""
         return load_beats(self.jams_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def leadsheet_chords(self):
         """ChordData: the track's chords as written in the leadsheet"""
         if self.mode == "solo":
@@ -176,7 +170,7 @@ class Track(core.Track):
             )
         return load_chords(self.jams_path, leadsheet_version=True)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def inferred_chords(self):
         """ChordData: the track's chords inferred from played transcription"""
         if self.mode == "solo":
@@ -185,12 +179,12 @@ class Track(core.Track):
             )
         return load_chords(self.jams_path, leadsheet_version=False)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def key_mode(self):
         """KeyData: the track's key and mode"""
         return load_key_mode(self.jams_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def pitch_contours(self):
         """(dict): a dict that contains 6 F0Data.
         From Low E string to high e string.
@@ -207,7 +201,7 @@ class Track(core.Track):
             contours[_GUITAR_STRINGS[i]] = load_pitch_contour(self.jams_path, i)
         return contours
 
-    @utils.cached_property
+    @utils.cached_annotation
     def notes(self):
         """dict: a dict that contains 6 NoteData.
         From Low E string to high e string.
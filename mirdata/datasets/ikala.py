@@ -94,6 +94,12 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    f0_path = core.TrackPath("pitch")
+    lyrics_path = core.TrackPath("lyrics")
+    audio_path = core.TrackPath("audio")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in iKala".format(track_id))
@@ -104,10 +110,6 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.f0_path = os.path.join(self._data_home, self._track_paths["pitch"][0])
-        self.lyrics_path = os.path.join(self._data_home, self._track_paths["lyrics"][0])
-
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
         self.song_id = track_id.split("_")[0]
         self.section = track_id.split("_")[1]
 
@@ -116,12 +118,12 @@ class Track(core.Track):
         else:
             self.singer_id = None
 
-    @utils.cached_property
+    @utils.cached_annotation
     def f0(self):
         """F0Data: The human-annotated singing voice pitch"""
         return load_f0(self.f0_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def lyrics(self):
         """LyricData: The human-annotated lyrics"""
         return load_lyrics(self.lyrics_path)
@@ -71,7 +71,10 @@ For more details, please visit: https://www.upf.edu/web/mtg/irmas
 
 """
 
+import json
+import logging
 import os
+import tempfile
 import librosa
 
 from mirdata import download_utils
@@ -119,7 +122,7 @@ REMOTES = {
 }
 
 
-DATA = utils.LargeData('irmas_index.json')
+ATTRIBUTE_TABLE = 'irmas_attributes.json'
 
 
 INST_DICT = [
@@ -139,6 +142,108 @@ INST_DICT = [
 GENRE_DICT = ['cou_fol', 'cla', 'pop_roc', 'lat_sou', 'jaz_blu']
 
 
+def _parse_track_attributes(track_id, audio_filename):
+    """Parse a track's attributes from its audio filename
+
+    Returns:
+        (dict): predominant_instrument, genre, drum, train and instrument,
+            which is None for testing tracks
+
+    Raises:
+        ValueError: if the filename's instrument or genre is unknown
+
+    """
+    # TESTING TRACKS
+    if '__' not in track_id:
+        return {
+            'predominant_instrument': None,
+            'genre': None,
+            'drum': None,
+            'train': False,
+            'instrument': None,
+        }
+
+    # TRAINING TRACKS
+    predominant_instrument = os.path.basename(os.path.dirname(audio_filename))
+    if predominant_instrument not in INST_DICT:
+        raise ValueError(
+            'Instrument {} of {} not in instrument dict'.format(
+                predominant_instrument, audio_filename
+            )
+        )
+
+    # Drum presence annotation is present
+    if 'dru' in audio_filename or 'nod' in audio_filename:
+        genre = audio_filename.split('.')[0].split('[')[3].split(']')[0]
+        drum = 'dru' in audio_filename
+
+    # Drum presence annotation not present
+    else:
+        genre = audio_filename.split('.')[0].split('[')[2].split(']')[0]
+        drum = None
+
+    if genre not in GENRE_DICT:
+        raise ValueError(
+            'Genre {} of {} not in genre dict'.format(genre, audio_filename)
+        )
+    return {
+        'predominant_instrument': predominant_instrument,
+        'genre': genre,
+        'drum': drum,
+        'train': True,
+        'instrument': [predominant_instrument],
+    }
+
+
+def _build_attribute_table(data_home):
+    table = {}
+    for track_id, track_paths in DATA.index['tracks'].items():
+        attributes = _parse_track_attributes(track_id, track_paths['audio'][0])
+        if not attributes['train']:
+            annotation_path = os.path.join(data_home, track_paths['annotation'][0])
+            if os.path.exists(annotation_path):
+                attributes['instrument'] = load_pred_inst(annotation_path)
+        table[track_id] = attributes
+    return table
+
+
+def _save_attribute_table(table, table_path):
+    # written to a temporary file first, so readers never see a partial table
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(table_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(table, f)
+        os.replace(tmp_path, table_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load_attribute_table(data_home):
+    table_path = os.path.join(data_home, ATTRIBUTE_TABLE)
+    if os.path.exists(table_path):
+        with open(table_path) as f:
+            return json.load(f)
+
+    # built from the audio filenames and the testing tracks' annotations on
+    # first load, and saved once all the annotations are downloaded
+    table = _build_attribute_table(data_home)
+    if all(attributes['instrument'] is not None for attributes in table.values()):
+        try:
+            _save_attribute_table(table, table_path)
+        except OSError as exc:
+            logging.warning(
+                'Could not save the attribute table {}: {}'.format(table_path, exc)
+            )
+    return table
+
+
+DATA = utils.LargeData(
+    'irmas_index.json', _load_attribute_table, metadata_paths=[ATTRIBUTE_TABLE]
+)
+
+
 class Track(core.Track):
     """IRMAS track class
 
@@ -155,6 +260,15 @@ class Track(core.Track):
         drum (bool): flag to identify if the track contains drums or not.
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath('audio')
+    annotation_path = core.TrackPath('annotation')
+    predominant_instrument = core.TrackMetadata('predominant_instrument')
+    genre = core.TrackMetadata('genre')
+    drum = core.TrackMetadata('drum')
+    train = core.TrackMetadata('train')
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError('{} is not a valid track ID in Example'.format(track_id))
@@ -163,59 +277,16 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.audio_path = os.path.join(self._data_home, self._track_paths['audio'][0])
-        self.annotation_path = os.path.join(
-            self._data_home, self._track_paths['annotation'][0]
-        )
-
-        # Dataset attributes
-        self.predominant_instrument = None
-        self.genre = None
-        self.drum = None
-        self.train = True
-
-        self._audio_filename = self._track_paths['audio'][0]
-
-        # TRAINING TRACKS
-        if '__' in track_id:
-            self.predominant_instrument = os.path.basename(
-                os.path.dirname(self.audio_path)
-            )
-            assert (
-                self.predominant_instrument in INST_DICT
-            ), "Instrument {} not in instrument dict".format(
-                self.predominant_instrument
-            )
 
-            # Drum presence annotation is present
-            if 'dru' in self._audio_filename or 'nod' in self._audio_filename:
-                self.genre = (
-                    self._audio_filename.split('.')[0].split('[')[3].split(']')[0]
-                )
-                assert self.genre in GENRE_DICT, "Genre {} not in genre dict".format(
-                    self.genre
-                )
-                self.drum = [True if 'dru' in self._audio_filename else False][0]
-
-            # Drum presence annotation not present
-            else:
-                self.genre = (
-                    self._audio_filename.split('.')[0].split('[')[2].split(']')[0]
-                )
-                assert self.genre in GENRE_DICT, "Genre {} not in genre dict".format(
-                    self.genre
-                )
-                self.drum = None
-
-        # TESTING TRACKS
-        else:
-            self.train = False
+    def _load_track_metadata(self):
+        # the track's row of the dataset's attribute table
+        return DATA.metadata(self._data_home)[self.track_id]
 
-    @utils.cached_property
+    @utils.cached_annotation
     def instrument(self):
         """(list, string): predominant instrument"""
-        if self.predominant_instrument is not None:
-            return [self.predominant_instrument]
+        if self._track_metadata['instrument'] is not None:
+            return list(self._track_metadata['instrument'])
         else:
             return load_pred_inst(self.annotation_path)
 
@@ -272,9 +343,12 @@ def load_pred_inst(annotation_path):
         pred_inst_file = fopen.readlines()
         for inst_ in pred_inst_file:
             inst_code = inst_[:3]
-            assert (
-                inst_code in INST_DICT
-            ), "Instrument {} not in instrument dictionary".format(inst_code)
+            if inst_code not in INST_DICT:
+                raise ValueError(
+                    'Instrument {} of {} not in instrument dictionary'.format(
+                        inst_code, annotation_path
+                    )
+                )
             pred_inst.append(inst_code)
 
         return pred_inst
@@ -28,10 +28,8 @@ For more details, please visit: https://magenta.tensorflow.org/datasets/maestro
 """
 
 import json
-import glob
 import logging
 import os
-import shutil
 
 import librosa
 import numpy as np
@@ -59,18 +57,20 @@ REMOTES = {
         url="https://storage.googleapis.com/magentadata/datasets/maestro/v2.0.0/maestro-v2.0.0.zip",
         checksum="7a6c23536ebcf3f50b1f00ac253886a7",
         destination_dir="",
+        path_rewrite="maestro-v2.0.0",
     ),
     "midi": download_utils.RemoteFileMetadata(
         filename="maestro-v2.0.0-midi.zip",
         url="https://storage.googleapis.com/magentadata/datasets/maestro/v2.0.0/maestro-v2.0.0-midi.zip",
         checksum="8a45cc678a8b23cd7bad048b1e9034c5",
         destination_dir="",
+        path_rewrite="maestro-v2.0.0",
     ),
     "metadata": download_utils.RemoteFileMetadata(
         filename="maestro-v2.0.0.json",
         url="https://storage.googleapis.com/magentadata/datasets/maestro/v2.0.0/maestro-v2.0.0.json",
         checksum="576172af1cdc4efddcf0be7d260d48f7",
-        destination_dir="maestro-v2.0.0",
+        destination_dir="",
     ),
 }
 
@@ -118,6 +118,16 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+    midi_path = core.TrackPath("midi")
+    canonical_composer = core.TrackMetadata("canonical_composer")
+    canonical_title = core.TrackMetadata("canonical_title")
+    split = core.TrackMetadata("split")
+    year = core.TrackMetadata("year")
+    duration = core.TrackMetadata("duration")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in MAESTRO".format(track_id))
@@ -127,29 +137,18 @@ class Track(core.Track):
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.midi_path = os.path.join(self._data_home, self._track_paths["midi"][0])
-
-        self._metadata = DATA.metadata(data_home)
-        if self._metadata is not None and track_id in self._metadata:
-            self.canonical_composer = self._metadata[track_id]["canonical_composer"]
-            self.canonical_title = self._metadata[track_id]["canonical_title"]
-            self.split = self._metadata[track_id]["split"]
-            self.year = self._metadata[track_id]["year"]
-            self.duration = self._metadata[track_id]["duration"]
+        metadata = DATA.metadata(data_home)
+        if metadata is not None and track_id in metadata:
+            self._track_metadata = metadata[track_id]
         else:
-            self.canonical_composer = None
-            self.canonical_title = None
-            self.split = None
-            self.year = None
-            self.duration = None
+            self._track_metadata = {}
 
-    @utils.cached_property
+    @utils.cached_annotation
     def midi(self):
         """output type: description of output"""
         return load_midi(self.midi_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def notes(self):
         """NoteData: annotated piano notes"""
         return load_notes(self.midi_path, self.midi)
@@ -164,7 +163,7 @@ class Track(core.Track):
         return jams_utils.jams_converter(
             audio_path=self.audio_path,
             note_data=[(self.notes, None)],
-            metadata=self._metadata,
+            metadata=self._track_metadata,
         )
 
 
@@ -263,14 +262,3 @@ def _download(
         force_overwrite=force_overwrite,
         cleanup=cleanup,
     )
-
-    # files get downloaded to a folder called maestro-v2.0.0
-    # move everything up a level
-    maestro_dir = os.path.join(save_dir, "maestro-v2.0.0")
-    maestro_files = glob.glob(os.path.join(maestro_dir, "*"))
-
-    for fpath in maestro_files:
-        shutil.move(fpath, save_dir)
-
-    if os.path.exists(maestro_dir):
-        shutil.rmtree(maestro_dir)
@@ -101,6 +101,14 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+    instrument = core.TrackMetadata("instrument")
+    instrument_id = core.TrackMetadata("instrument_id")
+    song_id = core.TrackMetadata("song_id")
+    subset = core.TrackMetadata("subset")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -124,12 +132,6 @@ class Track(core.Track):
                 "track_id": None,
             }
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.instrument = self._track_metadata["instrument"]
-        self.instrument_id = self._track_metadata["instrument_id"]
-        self.song_id = self._track_metadata["song_id"]
-        self.subset = self._track_metadata["subset"]
-
     @property
     def audio(self):
         """(np.ndarray, float): audio signal, sample rate"""
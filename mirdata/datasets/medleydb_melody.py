@@ -79,6 +79,19 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    melody1_path = core.TrackPath("melody1")
+    melody2_path = core.TrackPath("melody2")
+    melody3_path = core.TrackPath("melody3")
+    audio_path = core.TrackPath("audio")
+    artist = core.TrackMetadata("artist")
+    title = core.TrackMetadata("title")
+    genre = core.TrackMetadata("genre")
+    is_excerpt = core.TrackMetadata("is_excerpt")
+    is_instrumental = core.TrackMetadata("is_instrumental")
+    n_sources = core.TrackMetadata("n_sources")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -89,15 +102,6 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.melody1_path = os.path.join(
-            self._data_home, self._track_paths["melody1"][0]
-        )
-        self.melody2_path = os.path.join(
-            self._data_home, self._track_paths["melody2"][0]
-        )
-        self.melody3_path = os.path.join(
-            self._data_home, self._track_paths["melody3"][0]
-        )
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -112,25 +116,17 @@ class Track(core.Track):
                 "n_sources": None,
             }
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.artist = self._track_metadata["artist"]
-        self.title = self._track_metadata["title"]
-        self.genre = self._track_metadata["genre"]
-        self.is_excerpt = self._track_metadata["is_excerpt"]
-        self.is_instrumental = self._track_metadata["is_instrumental"]
-        self.n_sources = self._track_metadata["n_sources"]
-
-    @utils.cached_property
+    @utils.cached_annotation
     def melody1(self):
         """F0Data: The pitch of the single most predominant source (often the voice)"""
         return load_melody(self.melody1_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def melody2(self):
         """F0Data: The pitch of the predominant source for each point in time"""
         return load_melody(self.melody2_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def melody3(self):
         """MultipitchData: The pitch of any melodic source. Allows for more than one f0 value at a time."""
         return load_melody3(self.melody3_path)
@@ -76,6 +76,15 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    pitch_path = core.TrackPath("pitch")
+    audio_path = core.TrackPath("audio")
+    instrument = core.TrackMetadata("instrument")
+    artist = core.TrackMetadata("artist")
+    title = core.TrackMetadata("title")
+    genre = core.TrackMetadata("genre")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -86,7 +95,6 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.pitch_path = os.path.join(self._data_home, self._track_paths["pitch"][0])
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -99,13 +107,7 @@ class Track(core.Track):
                 "genre": None,
             }
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.instrument = self._track_metadata["instrument"]
-        self.artist = self._track_metadata["artist"]
-        self.title = self._track_metadata["title"]
-        self.genre = self._track_metadata["genre"]
-
-    @utils.cached_property
+    @utils.cached_annotation
     def pitch(self):
         """F0Data: The human-annotated pitch"""
         return load_pitch(self.pitch_path)
@@ -98,6 +98,10 @@ class Track(core.Track):
         tonic (str): tonic of the stroke in the Track
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in Example".format(track_id))
@@ -107,8 +111,6 @@ class Track(core.Track):
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-
         # Parse stroke name annotation from audio file name
         self.stroke_name = self.audio_path.split("__")[2].split("-")[0]
         assert (
@@ -11,10 +11,8 @@ For more details, please visit: https://zenodo.org/record/1289786#.XREpzaeZPx6
 """
 
 import csv
-import glob
 import logging
 import os
-import shutil
 import librosa
 import numpy as np
 
@@ -39,6 +37,7 @@ REMOTES = {
         url="https://zenodo.org/record/1289786/files/Orchset_dataset_0.zip?download=1",
         checksum="cf6fe52d64624f61ee116c752fb318ca",
         destination_dir=None,
+        path_rewrite="Orchset",
     )
 }
 
@@ -131,6 +130,25 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    melody_path = core.TrackPath("melody")
+    audio_path_mono = core.TrackPath("audio_mono")
+    audio_path_stereo = core.TrackPath("audio_stereo")
+    composer = core.TrackMetadata("composer")
+    work = core.TrackMetadata("work")
+    excerpt = core.TrackMetadata("excerpt")
+    predominant_melodic_instruments = core.TrackMetadata(
+        "predominant_melodic_instruments-normalized"
+    )
+    alternating_melody = core.TrackMetadata("alternating_melody")
+    contains_winds = core.TrackMetadata("contains_winds")
+    contains_strings = core.TrackMetadata("contains_strings")
+    contains_brass = core.TrackMetadata("contains_brass")
+    only_strings = core.TrackMetadata("only_strings")
+    only_winds = core.TrackMetadata("only_winds")
+    only_brass = core.TrackMetadata("only_brass")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in orchset".format(track_id))
@@ -139,7 +157,6 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.melody_path = os.path.join(self._data_home, self._track_paths["melody"][0])
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -160,27 +177,7 @@ class Track(core.Track):
                 "excerpt": None,
             }
 
-        self.audio_path_mono = os.path.join(
-            self._data_home, self._track_paths["audio_mono"][0]
-        )
-        self.audio_path_stereo = os.path.join(
-            self._data_home, self._track_paths["audio_stereo"][0]
-        )
-        self.composer = self._track_metadata["composer"]
-        self.work = self._track_metadata["work"]
-        self.excerpt = self._track_metadata["excerpt"]
-        self.predominant_melodic_instruments = self._track_metadata[
-            "predominant_melodic_instruments-normalized"
-        ]
-        self.alternating_melody = self._track_metadata["alternating_melody"]
-        self.contains_winds = self._track_metadata["contains_winds"]
-        self.contains_strings = self._track_metadata["contains_strings"]
-        self.contains_brass = self._track_metadata["contains_brass"]
-        self.only_strings = self._track_metadata["only_strings"]
-        self.only_winds = self._track_metadata["only_winds"]
-        self.only_brass = self._track_metadata["only_brass"]
-
-    @utils.cached_property
+    @utils.cached_annotation
     def melody(self):
         """F0Data: melody annotation"""
         return load_melody(self.melody_path)
@@ -238,45 +235,6 @@ def load_audio_stereo(audio_path):
     return librosa.load(audio_path, sr=None, mono=False)
 
 
-def _download(
-    save_dir, remotes, partial_download, info_message, force_overwrite, cleanup
-):
-    """Download the dataset.
-
-    Args:
-        save_dir (str):
-            The directory to download the data
-        remotes (dict or None):
-            A dictionary of RemoteFileMetadata tuples of data in zip format.
-            If None, there is no data to download
-        partial_download (list or None):
-            A list of keys to partially download the remote objects of the download dict.
-            If None, all data is downloaded
-        info_message (str or None):
-            A string of info to print when this function is called.
-            If None, no string is printed.
-        force_overwrite (bool):
-            If True, existing files are overwritten by the downloaded files.
-        cleanup (bool):
-            Whether to delete the zip/tar file after extracting.
-
-    """
-    download_utils.downloader(
-        save_dir,
-        remotes=remotes,
-        info_message=None,
-        force_overwrite=force_overwrite,
-        cleanup=cleanup,
-    )
-    # files get downloaded to a folder called Orchset - move everything up a level
-    duplicated_orchset_dir = os.path.join(save_dir, "Orchset")
-    orchset_files = glob.glob(os.path.join(duplicated_orchset_dir, "*"))
-    for fpath in orchset_files:
-        shutil.move(fpath, save_dir)
-    if os.path.exists(duplicated_orchset_dir):
-        shutil.rmtree(duplicated_orchset_dir)
-
-
 def load_melody(melody_path):
     if not os.path.exists(melody_path):
         raise IOError("melody_path {} does not exist".format(melody_path))
@@ -157,6 +157,20 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    sections_path = core.TrackPath("sections")
+    beats_path = core.TrackPath("beats")
+    audio_path = core.TrackPath("audio")
+    piece_number = core.TrackMetadata("piece_number")
+    suffix = core.TrackMetadata("suffix")
+    track_number = core.TrackMetadata("track_number")
+    title = core.TrackMetadata("title")
+    composer = core.TrackMetadata("composer")
+    artist = core.TrackMetadata("artist")
+    duration = core.TrackMetadata("duration")
+    category = core.TrackMetadata("category")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -166,10 +180,6 @@ class Track(core.Track):
         self.track_id = track_id
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.sections_path = os.path.join(
-            self._data_home, self._track_paths["sections"][0]
-        )
-        self.beats_path = os.path.join(self._data_home, self._track_paths["beats"][0])
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -186,23 +196,12 @@ class Track(core.Track):
                 "category": None,
             }
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-
-        self.piece_number = self._track_metadata["piece_number"]
-        self.suffix = self._track_metadata["suffix"]
-        self.track_number = self._track_metadata["track_number"]
-        self.title = self._track_metadata["title"]
-        self.composer = self._track_metadata["composer"]
-        self.artist = self._track_metadata["artist"]
-        self.duration = self._track_metadata["duration"]
-        self.category = self._track_metadata["category"]
-
-    @utils.cached_property
+    @utils.cached_annotation
     def sections(self):
         """SectionData: human labeled section annotations"""
         return load_sections(self.sections_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def beats(self):
         """BeatData: human labeled beat annotations"""
         return load_beats(self.beats_path)
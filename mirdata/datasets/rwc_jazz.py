@@ -157,6 +157,20 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    sections_path = core.TrackPath("sections")
+    beats_path = core.TrackPath("beats")
+    audio_path = core.TrackPath("audio")
+    piece_number = core.TrackMetadata("piece_number")
+    suffix = core.TrackMetadata("suffix")
+    track_number = core.TrackMetadata("track_number")
+    title = core.TrackMetadata("title")
+    artist = core.TrackMetadata("artist")
+    duration = core.TrackMetadata("duration")
+    variation = core.TrackMetadata("variation")
+    instruments = core.TrackMetadata("instruments")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in RWC-Jazz".format(track_id))
@@ -165,10 +179,6 @@ class Track(core.Track):
         self._data_home = data_home
 
         self._track_paths = DATA.index['tracks'][track_id]
-        self.sections_path = os.path.join(
-            self._data_home, self._track_paths["sections"][0]
-        )
-        self.beats_path = os.path.join(self._data_home, self._track_paths["beats"][0])
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -185,23 +195,12 @@ class Track(core.Track):
                 "instruments": None,
             }
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-
-        self.piece_number = self._track_metadata["piece_number"]
-        self.suffix = self._track_metadata["suffix"]
-        self.track_number = self._track_metadata["track_number"]
-        self.title = self._track_metadata["title"]
-        self.artist = self._track_metadata["artist"]
-        self.duration = self._track_metadata["duration"]
-        self.variation = self._track_metadata["variation"]
-        self.instruments = self._track_metadata["instruments"]
-
-    @utils.cached_property
+    @utils.cached_annotation
     def sections(self):
         """SectionData: human-labeled section data"""
         return load_sections(self.sections_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def beats(self):
         """BeatData: human-labeled beat data"""
         return load_beats(self.beats_path)
@@ -172,6 +172,24 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    sections_path = core.TrackPath("sections")
+    beats_path = core.TrackPath("beats")
+    chords_path = core.TrackPath("chords")
+    voca_inst_path = core.TrackPath("voca_inst")
+    audio_path = core.TrackPath("audio")
+    piece_number = core.TrackMetadata("piece_number")
+    suffix = core.TrackMetadata("suffix")
+    track_number = core.TrackMetadata("track_number")
+    title = core.TrackMetadata("title")
+    artist = core.TrackMetadata("artist")
+    singer_information = core.TrackMetadata("singer_information")
+    duration = core.TrackMetadata("duration")
+    tempo = core.TrackMetadata("tempo")
+    instruments = core.TrackMetadata("instruments")
+    drum_information = core.TrackMetadata("drum_information")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError(
@@ -182,14 +200,6 @@ class Track(core.Track):
         self._data_home = data_home
 
         self._track_paths = DATA.index['tracks'][track_id]
-        self.sections_path = os.path.join(
-            self._data_home, self._track_paths["sections"][0]
-        )
-        self.beats_path = os.path.join(self._data_home, self._track_paths["beats"][0])
-        self.chords_path = os.path.join(self._data_home, self._track_paths["chords"][0])
-        self.voca_inst_path = os.path.join(
-            self._data_home, self._track_paths["voca_inst"][0]
-        )
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata:
@@ -209,35 +219,22 @@ class Track(core.Track):
                 "drum_information": None,
             }
 
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-
-        self.piece_number = self._track_metadata["piece_number"]
-        self.suffix = self._track_metadata["suffix"]
-        self.track_number = self._track_metadata["track_number"]
-        self.title = self._track_metadata["title"]
-        self.artist = self._track_metadata["artist"]
-        self.singer_information = self._track_metadata["singer_information"]
-        self.duration = self._track_metadata["duration"]
-        self.tempo = self._track_metadata["tempo"]
-        self.instruments = self._track_metadata["instruments"]
-        self.drum_information = self._track_metadata["drum_information"]
-
-    @utils.cached_property
+    @utils.cached_annotation
     def sections(self):
         """SectionData: human-labeled section annotation"""
         return load_sections(self.sections_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def beats(self):
         """BeatData: human-labeled beat annotation"""
         return load_beats(self.beats_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def chords(self):
         """ChordData: human-labeled chord annotation"""
         return load_chords(self.chords_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def vocal_instrument_activity(self):
         """EventData: human-labeled vocal/instrument activity"""
         return load_voca_inst(self.voca_inst_path)
@@ -123,6 +123,24 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    sections_annotator1_uppercase_path = core.TrackPath("annotator_1_uppercase")
+    sections_annotator1_lowercase_path = core.TrackPath("annotator_1_lowercase")
+    sections_annotator2_uppercase_path = core.TrackPath("annotator_2_uppercase")
+    sections_annotator2_lowercase_path = core.TrackPath("annotator_2_lowercase")
+    audio_path = core.TrackPath("audio")
+    source = core.TrackMetadata("source")
+    annotator_1_id = core.TrackMetadata("annotator_1_id")
+    annotator_2_id = core.TrackMetadata("annotator_2_id")
+    duration = core.TrackMetadata("duration")
+    title = core.TrackMetadata("title")
+    artist = core.TrackMetadata("artist")
+    annotator_1_time = core.TrackMetadata("annotator_1_time")
+    annotator_2_time = core.TrackMetadata("annotator_2_time")
+    broad_genre = core.TrackMetadata("class")
+    genre = core.TrackMetadata("genre")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in Salami".format(track_id))
@@ -131,18 +149,6 @@ class Track(core.Track):
 
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
-        self.sections_annotator1_uppercase_path = utils.none_path_join(
-            [self._data_home, self._track_paths["annotator_1_uppercase"][0]]
-        )
-        self.sections_annotator1_lowercase_path = utils.none_path_join(
-            [self._data_home, self._track_paths["annotator_1_lowercase"][0]]
-        )
-        self.sections_annotator2_uppercase_path = utils.none_path_join(
-            [self._data_home, self._track_paths["annotator_2_uppercase"][0]]
-        )
-        self.sections_annotator2_lowercase_path = utils.none_path_join(
-            [self._data_home, self._track_paths["annotator_2_lowercase"][0]]
-        )
 
         metadata = DATA.metadata(data_home)
         if metadata is not None and track_id in metadata.keys():
@@ -161,40 +167,29 @@ class Track(core.Track):
                 "class": None,
                 "genre": None,
             }
-        self.audio_path = os.path.join(self._data_home, self._track_paths["audio"][0])
-        self.source = self._track_metadata["source"]
-        self.annotator_1_id = self._track_metadata["annotator_1_id"]
-        self.annotator_2_id = self._track_metadata["annotator_2_id"]
-        self.duration = self._track_metadata["duration"]
-        self.title = self._track_metadata["title"]
-        self.artist = self._track_metadata["artist"]
-        self.annotator_1_time = self._track_metadata["annotator_1_time"]
-        self.annotator_2_time = self._track_metadata["annotator_2_time"]
-        self.broad_genre = self._track_metadata["class"]
-        self.genre = self._track_metadata["genre"]
-
-    @utils.cached_property
+
+    @utils.cached_annotation
     def sections_annotator_1_uppercase(self):
         """SectionData: annotations in hierarchy level 0 from annotator 1"""
         if self.sections_annotator1_uppercase_path is None:
             return None
         return load_sections(self.sections_annotator1_uppercase_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def sections_annotator_1_lowercase(self):
         """SectionData: annotations in hierarchy level 1 from annotator 1"""
         if self.sections_annotator1_lowercase_path is None:
             return None
         return load_sections(self.sections_annotator1_lowercase_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def sections_annotator_2_uppercase(self):
         """SectionData: annotations in hierarchy level 0 from annotator 2"""
         if self.sections_annotator2_uppercase_path is None:
             return None
         return load_sections(self.sections_annotator2_uppercase_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def sections_annotator_2_lowercase(self):
         """SectionData: annotations in hierarchy level 1 from annotator 2"""
         if self.sections_annotator2_lowercase_path is None:
@@ -32,6 +32,7 @@ import numpy as np
 import os
 import json
 import logging
+import tempfile
 
 from mirdata import download_utils
 from mirdata import jams_utils
@@ -64,6 +65,13 @@ REMOTES = {
 }
 
 
+METADATA_TABLE = 'saraga_metadata.json'
+
+
+def _metadata_data_home(metadata_path):
+    return metadata_path.split('/' + metadata_path.split('/')[-3])[0]
+
+
 def _load_metadata(metadata_path):
     if not os.path.exists(metadata_path):
         logging.info('Metadata file {} not found.'.format(metadata_path))
@@ -71,7 +79,7 @@ def _load_metadata(metadata_path):
 
     with open(metadata_path) as f:
         metadata = json.load(f)
-        data_home = metadata_path.split('/' + metadata_path.split('/')[-3])[0]
+        data_home = _metadata_data_home(metadata_path)
         metadata['track_id'] = (
             str(metadata_path.split('/')[-3]) + '_' + str(metadata_path.split('/')[-2])
         )
@@ -80,7 +88,72 @@ def _load_metadata(metadata_path):
         return metadata
 
 
-DATA = utils.LargeData('saraga_index.json', _load_metadata)
+def _build_metadata_table(data_home):
+    table = {}
+    for track_id, track_paths in DATA.index['tracks'].items():
+        if track_paths['metadata'][0] is None:
+            continue
+        metadata = _load_metadata(os.path.join(data_home, track_paths['metadata'][0]))
+        if metadata is None or metadata['track_id'] != track_id:
+            continue
+        del metadata['data_home']
+        table[track_id] = metadata
+    return table
+
+
+def _save_metadata_table(table, table_path):
+    # written to a temporary file first, so readers never see a partial table
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(table_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(table, f)
+        os.replace(tmp_path, table_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load_metadata_table(data_home):
+    table_path = os.path.join(data_home, METADATA_TABLE)
+    if os.path.exists(table_path):
+        with open(table_path) as f:
+            table = json.load(f)
+    else:
+        # built from the tracks' metadata files on first load, and saved so
+        # later loads read a single file
+        table = _build_metadata_table(data_home)
+        if table:
+            try:
+                _save_metadata_table(table, table_path)
+            except OSError as exc:
+                logging.warning(
+                    'Could not save the metadata table {}: {}'.format(table_path, exc)
+                )
+
+    # data_home is not stored, so the table stays valid if data_home is moved
+    for track_id, metadata in table.items():
+        metadata_path = os.path.join(
+            data_home, DATA.index['tracks'][track_id]['metadata'][0]
+        )
+        metadata['data_home'] = _metadata_data_home(metadata_path)
+    # without metadata files the table is empty, and cached like any other
+    table['data_home'] = data_home
+    return table
+
+
+DATA = utils.LargeData(
+    'saraga_index.json', _load_metadata_table, metadata_paths=[METADATA_TABLE]
+)
+
+
+class _TrackStyle(core.TrackMetadata):
+    """The track's collection, carnatic or hindustani, read from its track id"""
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        return obj.track_id.split('_')[0]
 
 
 class Track(core.Track):
@@ -114,6 +187,34 @@ class Track(core.Track):
         layas (list, dicts): list of dicts containing the layas present in the track and its uuid
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath('audio')
+    ctonic_path = core.TrackPath('ctonic')
+    pitch_path = core.TrackPath('pitch')
+    pitch_vocal_path = core.TrackPath('pitch_vocal')
+    tempo_path = core.TrackPath('tempo')
+    sama_path = core.TrackPath('sama')
+    sections_path = core.TrackPath('sections')
+    phrases_path = core.TrackPath('phrases')
+    metadata_path = core.TrackPath('metadata')
+    iam_style = _TrackStyle('iam_style')
+    title = core.TrackMetadata('title')
+    artists = core.TrackMetadata('artists')
+    album_artists = core.TrackMetadata('album_artists')
+    mbid = core.TrackMetadata('mbid')
+    raaga = core.TrackMetadata('raaga')
+    form = core.TrackMetadata('form')
+    work = core.TrackMetadata('work')
+    taala = core.TrackMetadata('taala')
+    concert = core.TrackMetadata('concert')
+    raags = core.TrackMetadata('raags')
+    forms = core.TrackMetadata('forms')
+    release = core.TrackMetadata('release')
+    works = core.TrackMetadata('works')
+    taals = core.TrackMetadata('taals')
+    layas = core.TrackMetadata('layas')
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError('{} is not a valid track ID in Saraga'.format(track_id))
@@ -123,175 +224,77 @@ class Track(core.Track):
         self._data_home = data_home
         self._track_paths = DATA.index['tracks'][track_id]
 
-        # Audio path
-        self.audio_path = os.path.join(self._data_home, self._track_paths['audio'][0])
-
-        # Annotation paths
-        self.ctonic_path = utils.none_path_join(
-            [self._data_home, self._track_paths['ctonic'][0]]
-        )
-        self.pitch_path = utils.none_path_join(
-            [self._data_home, self._track_paths['pitch'][0]]
-        )
-        self.pitch_vocal_path = utils.none_path_join(
-            [self._data_home, self._track_paths['pitch_vocal'][0]]
-        )
-        self.tempo_path = utils.none_path_join(
-            [self._data_home, self._track_paths['tempo'][0]]
-        )
-        self.sama_path = utils.none_path_join(
-            [self._data_home, self._track_paths['sama'][0]]
-        )
-        self.sections_path = utils.none_path_join(
-            [self._data_home, self._track_paths['sections'][0]]
-        )
-        self.phrases_path = utils.none_path_join(
-            [self._data_home, self._track_paths['phrases'][0]]
-        )
-        self.metadata_path = utils.none_path_join(
-            [self._data_home, self._track_paths['metadata'][0]]
-        )
+    def _load_track_metadata(self):
+        # Use the consolidated metadata table, or the track's own metadata
+        # file if the track is not in it
+        metadata = DATA.metadata(self._data_home)
+        if metadata is not None and self.track_id in metadata:
+            metadata = metadata[self.track_id]
+        else:
+            metadata = _load_metadata(self.metadata_path)
 
-        # Flag to separate between carnatinc and hindustani tracks
-        self.iam_style = str(self.track_id.split('_')[0])
+        if metadata is not None and self.track_id == metadata['track_id']:
+            return metadata
 
-        # CARNATIC MUSIC TRACKS
+        # annotations with missing metadata
         if self.iam_style == 'carnatic':
-            metadata = DATA.metadata(self.metadata_path)
-            if metadata is not None and track_id == metadata['track_id']:
-                self._track_metadata = metadata
-            else:
-                # annotations with missing metadata
-                self._track_metadata = {
-                    'raaga': None,
-                    'form': None,
-                    'title': None,
-                    'work': None,
-                    'length': None,
-                    'taala': None,
-                    'album_artists': None,
-                    'mbid': None,
-                    'artists': None,
-                    'concert': None,
-                }
-
-        # HINDUSTANI MUSIC TRACKS
-        if self.iam_style == 'hindustani':
-            metadata = DATA.metadata(self.metadata_path)
-            if metadata is not None and track_id == metadata['track_id']:
-                self._track_metadata = metadata
-            else:
-                # annotations with missing metadata
-                self._track_metadata = {
-                    'title': None,
-                    'raags': None,
-                    'length': None,
-                    'album_artists': None,
-                    'forms': None,
-                    'mbid': None,
-                    'artists': None,
-                    'release': None,
-                    'works': None,
-                    'taals': None,
-                    'layas': None,
-                }
-
-        # Common attributes for Hindustani and Carnatic tracks
-        self.title = self._track_metadata['title']
-        self.artists = self._track_metadata['artists']
-        self.album_artists = self._track_metadata['album_artists']
-        self.mbid = self._track_metadata['mbid']
-
-        # Carnatic specific attributes
-        self.raaga = (
-            self._track_metadata['raaga']
-            if 'raaga' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.form = (
-            self._track_metadata['form']
-            if 'form' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.work = (
-            self._track_metadata['work']
-            if 'work' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.taala = (
-            self._track_metadata['taala']
-            if 'taala' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.concert = (
-            self._track_metadata['concert']
-            if 'concert' in self._track_metadata.keys() is not None
-            else None
-        )
-
-        # Hindustani specific attributes
-        self.raags = (
-            self._track_metadata['raags']
-            if 'raags' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.forms = (
-            self._track_metadata['forms']
-            if 'forms' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.release = (
-            self._track_metadata['release']
-            if 'release' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.works = (
-            self._track_metadata['works']
-            if 'works' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.taals = (
-            self._track_metadata['taals']
-            if 'taals' in self._track_metadata.keys() is not None
-            else None
-        )
-        self.layas = (
-            self._track_metadata['layas']
-            if 'layas' in self._track_metadata.keys() is not None
-            else None
-        )
-
-    @utils.cached_property
+            return {
+                'raaga': None,
+                'form': None,
+                'title': None,
+                'work': None,
+                'length': None,
+                'taala': None,
+                'album_artists': None,
+                'mbid': None,
+                'artists': None,
+                'concert': None,
+            }
+        return {
+            'title': None,
+            'raags': None,
+            'length': None,
+            'album_artists': None,
+            'forms': None,
+            'mbid': None,
+            'artists': None,
+            'release': None,
+            'works': None,
+            'taals': None,
+            'layas': None,
+        }
+
+    @utils.cached_annotation
     def tonic(self):
         """Float: tonic annotation"""
         return load_tonic(self.ctonic_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def pitch(self):
         """F0Data: pitch annotation"""
         return load_pitch(self.pitch_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def pitch_vocal(self):
         """F0Data: pitch vocal annotations"""
         return load_pitch(self.pitch_vocal_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def tempo(self):
         """Dict: tempo annotations"""
         return load_tempo(self.tempo_path, self.iam_style)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def sama(self):
         """SectionData: sama section annotations"""
         return load_sama(self.sama_path)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def sections(self):
         """SectionData: track section annotations"""
         return load_sections(self.sections_path, self.iam_style)
 
-    @utils.cached_property
+    @utils.cached_annotation
     def phrases(self):
         """EventData: phrase annotations"""
         return load_phrases(self.phrases_path)
@@ -316,6 +319,25 @@ class Track(core.Track):
         )
 
 
+def build_metadata_table(data_home):
+    """Build a consolidated metadata table of the carnatic and hindustani
+    tracks, and save it to data_home. Tracks read their metadata from this
+    single file instead of one file per track, and it is available as
+    `Dataset.metadata`. It is built the first time the metadata is loaded,
+    call this to rebuild it after the tracks' metadata files changed.
+
+    Args:
+        data_home (str): Local path where the dataset is stored.
+
+    Returns:
+        table_path (str): path to the saved metadata table
+
+    """
+    table_path = os.path.join(data_home, METADATA_TABLE)
+    _save_metadata_table(_build_metadata_table(data_home), table_path)
+    return table_path
+
+
 def load_audio(audio_path):
     """Load a Saraga audio file.
 
@@ -140,6 +140,22 @@ class Track(core.Track):
 
     """
 
+    __slots__ = ()
+
+    audio_path = core.TrackPath("audio", "audio")
+    family = core.TrackMetadata("Family")
+    instrument_abbr = core.TrackMetadata("Instrument (abbr.)")
+    instrument_full = core.TrackMetadata("Instrument (in full)")
+    technique_abbr = core.TrackMetadata("Technique (abbr.)")
+    technique_full = core.TrackMetadata("Technique (in full)")
+    pitch = core.TrackMetadata("Pitch")
+    pitch_id = core.TrackMetadata("Pitch ID")
+    dynamics = core.TrackMetadata("Dynamics")
+    dynamics_id = core.TrackMetadata("Dynamics ID")
+    instance_id = core.TrackMetadata("Instance ID")
+    string_id = core.TrackMetadata("String ID")
+    is_resampled = core.TrackMetadata("Resampled")
+
     def __init__(self, track_id, data_home):
         if track_id not in DATA.index['tracks']:
             raise ValueError("{} is not a valid track ID in TinySOL".format(track_id))
@@ -168,26 +184,6 @@ class Track(core.Track):
                 "Resampled": None,
             }
 
-        self.audio_path = os.path.join(
-            self._data_home, "audio", self._track_paths["audio"][0]
-        )
-
-        self.family = self._track_metadata["Family"]
-        self.instrument_abbr = self._track_metadata["Instrument (abbr.)"]
-        self.instrument_full = self._track_metadata["Instrument (in full)"]
-        self.technique_abbr = self._track_metadata["Technique (abbr.)"]
-        self.technique_full = self._track_metadata["Technique (in full)"]
-        self.pitch = self._track_metadata["Pitch"]
-        self.pitch_id = self._track_metadata["Pitch ID"]
-        self.dynamics = self._track_metadata["Dynamics"]
-        self.dynamics_id = self._track_metadata["Dynamics ID"]
-        self.instance_id = self._track_metadata["Instance ID"]
-        if "String ID" in self._track_metadata:
-            self.string_id = self._track_metadata["String ID"]
-        else:
-            self.string_id = None
-        self.is_resampled = self._track_metadata["Resampled"]
-
     @property
     def audio(self):
         """(np.ndarray, float): audio signal, sample rate"""
@@ -3,22 +3,41 @@
 
 Attributes:
     RemoteFileMetadata (namedtuple): It specifies the metadata of the remote file to download.
-        The metadata consists of `filename`, `url`, `checksum`, and `destination_dir`.
+        The metadata consists of `filename`, `url`, `checksum`, `destination_dir`
+        and, optionally, `path_rewrite` (see `rewrite_member_path`).
+
+    ARCHIVE_STORE_ENV (str): Name of the environment variable pointing to a local
+        archive store. Remote files found in the store (by checksum) are linked
+        or copied from it instead of being downloaded.
+
+    ARCHIVE_STORE_POPULATE_ENV (str): Name of the environment variable which,
+        if set to a non-empty value, adds every downloaded file to the archive store.
 """
 
 from collections import namedtuple
+import fnmatch
+import hashlib
 import os
+import shutil
+import tempfile
 from tqdm import tqdm
-import urllib
+import urllib.request
 import tarfile
 import zipfile
 
 from mirdata.utils import md5
 
 # destination dir should be a relative path to save the file/s, or None
+# path_rewrite is None, a folder prefix to strip from the archive members,
+# or a function mapping a member path to its extracted path (or None to skip it)
 RemoteFileMetadata = namedtuple(
-    'RemoteFileMetadata', ['filename', 'url', 'checksum', 'destination_dir']
+    'RemoteFileMetadata',
+    ['filename', 'url', 'checksum', 'destination_dir', 'path_rewrite'],
 )
+RemoteFileMetadata.__new__.__defaults__ = (None,)
+
+ARCHIVE_STORE_ENV = 'MIRDATA_ARCHIVE_STORE'
+ARCHIVE_STORE_POPULATE_ENV = 'MIRDATA_ARCHIVE_STORE_POPULATE'
 
 
 def downloader(
@@ -31,6 +50,9 @@ def downloader(
 ):
     """Download data to `save_dir` and optionally print a message.
 
+    This is the default download function of a dataset, and custom `_download`
+    functions share its signature. See `download_remotes` for more options.
+
     Args:
         save_dir (str):
             The directory to download the data
@@ -48,6 +70,56 @@ def downloader(
         cleanup (bool):
             Whether to delete the zip/tar file after extracting.
 
+    """
+    download_remotes(
+        save_dir,
+        remotes=remotes,
+        partial_download=partial_download,
+        info_message=info_message,
+        force_overwrite=force_overwrite,
+        cleanup=cleanup,
+    )
+
+
+def download_remotes(
+    save_dir,
+    remotes=None,
+    partial_download=None,
+    info_message=None,
+    force_overwrite=False,
+    cleanup=True,
+    stream=False,
+    skip_existing=False,
+    checksums=None,
+):
+    """Download data to `save_dir` and optionally print a message.
+
+    Args:
+        save_dir (str):
+            The directory to download the data
+        remotes (dict or None):
+            A dictionary of RemoteFileMetadata tuples of data in zip format.
+            If None, there is no data to download
+        partial_download (list or None):
+            A list of keys to partially download the remote objects of the download dict.
+            If None, all data is downloaded
+        info_message (str or None):
+            A string of info to print when this function is called.
+            If None, no string is printed.
+        force_overwrite (bool):
+            If True, existing files are overwritten by the downloaded files.
+        cleanup (bool):
+            Whether to delete the zip/tar file after extracting.
+        stream (bool):
+            If True, tar files are extracted while they are downloaded,
+            without writing the archive to disk. See `stream_tar_file`.
+        skip_existing (bool):
+            If True, archive members which already exist on disk with the
+            expected size (and checksum, if given) are not extracted again.
+        checksums (dict or None):
+            Expected md5 checksums of the extracted files, keyed by path
+            relative to `save_dir` (see `utils.index_checksums`).
+
     """
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
@@ -69,13 +141,34 @@ def downloader(
 
         print("Starting to download {} to folder {}".format(objs_to_download, save_dir))
 
+        extract_kwargs = {}
+        if skip_existing:
+            extract_kwargs['skip_existing'] = True
+            if checksums is not None:
+                extract_kwargs['checksums'] = {
+                    os.path.normpath(os.path.join(save_dir, path)): checksum
+                    for path, checksum in checksums.items()
+                }
+
         for k in objs_to_download:
             print("> downloading {}".format(k))
             extension = os.path.splitext(remotes[k].filename)[-1]
+            remote_kwargs = dict(extract_kwargs)
+            if remotes[k].path_rewrite is not None:
+                remote_kwargs['path_rewrite'] = remotes[k].path_rewrite
             if '.zip' in extension:
-                download_zip_file(remotes[k], save_dir, force_overwrite, cleanup)
+                download_zip_file(
+                    remotes[k], save_dir, force_overwrite, cleanup, **remote_kwargs
+                )
             elif '.gz' in extension or '.tar' in extension:
-                download_tar_file(remotes[k], save_dir, force_overwrite, cleanup)
+                if stream:
+                    stream_tar_file(
+                        remotes[k], save_dir, force_overwrite, **extract_kwargs
+                    )
+                else:
+                    download_tar_file(
+                        remotes[k], save_dir, force_overwrite, cleanup, **remote_kwargs
+                    )
             else:
                 download_from_remote(remotes[k], save_dir, force_overwrite)
 
@@ -92,12 +185,88 @@ class DownloadProgressBar(tqdm):
         self.update(b * bsize - self.n)
 
 
-def download_from_remote(remote, save_dir, force_overwrite=False):
+def _download_error_message(url):
+    return """
+                            mirdata failed to download the dataset from {}!
+                            Please try again in a few minutes.
+                            If this error persists, please raise an issue at
+                            https://github.com/mir-dataset-loaders/mirdata,
+                            and tag it with 'broken-link'.
+                            """.format(url)
+
+
+def _remote_download_dir(remote, save_dir):
+    if remote.destination_dir is None:
+        return save_dir
+    return os.path.join(save_dir, remote.destination_dir)
+
+
+def _archive_store_path(archive_store, checksum):
+    return os.path.join(archive_store, checksum[:2], checksum)
+
+
+def _link_or_copy(source_path, target_path):
+    """Hardlink source_path to target_path, or copy it if linking fails
+    (e.g. across file systems). An existing target_path is replaced.
+    """
+    tmp_path = '{}.{}.tmp'.format(target_path, os.getpid())
+    try:
+        os.link(source_path, tmp_path)
+    except OSError:
+        shutil.copyfile(source_path, tmp_path)
+    os.replace(tmp_path, target_path)
+
+
+def fetch_from_archive_store(remote, download_path, archive_store):
+    """Link or copy a remote file from a local archive store.
+
+    The store is content-addressed: a file with checksum `c` is stored
+    as `<archive_store>/<c[:2]>/<c>`.
+
+    Args:
+        remote (RemoteFileMetadata): Object containing download information
+        download_path (str): Path where the file should be placed
+        archive_store (str or None): Path to the archive store
+
+    Returns:
+        (bool): True if the file was found in the store
+    """
+    if archive_store is None or remote.checksum is None:
+        return False
+    store_path = _archive_store_path(archive_store, remote.checksum)
+    if not os.path.exists(store_path):
+        return False
+    _link_or_copy(store_path, download_path)
+    return True
+
+
+def add_to_archive_store(file_path, checksum, archive_store):
+    """Add a file with a known checksum to a local archive store.
+
+    Args:
+        file_path (str): Path to the file
+        checksum (str): md5 checksum of the file
+        archive_store (str): Path to the archive store
+    """
+    store_path = _archive_store_path(archive_store, checksum)
+    if os.path.exists(store_path):
+        return
+    if not os.path.exists(os.path.dirname(store_path)):
+        os.makedirs(os.path.dirname(store_path))
+    _link_or_copy(file_path, store_path)
+
+
+def download_from_remote(
+    remote, save_dir, force_overwrite=False, archive_store=None, populate_store=None
+):
     """Download a remote dataset into path
     Fetch a dataset pointed by remote's url, save into path using remote's
     filename and ensure its integrity based on the MD5 Checksum of the
     downloaded file.
 
+    If an archive store is configured, the file is first looked up there by
+    checksum (see `fetch_from_archive_store`).
+
     Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
 
     Args:
@@ -107,20 +276,35 @@ def download_from_remote(remote, save_dir, force_overwrite=False):
         force_overwrite  (bool):
             If True, overwrite existing file with the downloaded file.
             If False, does not overwrite, but checks that checksum is consistent.
+        archive_store (str or None):
+            Path to a local archive store. If None, the value of the
+            `MIRDATA_ARCHIVE_STORE` environment variable is used, if set.
+        populate_store (bool or None):
+            If True, downloaded files are added to the archive store.
+            If None, the `MIRDATA_ARCHIVE_STORE_POPULATE` environment variable is used.
 
     Returns:
         file_path (str): Full path of the created file.
     """
-    if remote.destination_dir is None:
-        download_dir = save_dir
-    else:
-        download_dir = os.path.join(save_dir, remote.destination_dir)
+    if archive_store is None:
+        archive_store = os.environ.get(ARCHIVE_STORE_ENV)
+    if populate_store is None:
+        populate_store = bool(os.environ.get(ARCHIVE_STORE_POPULATE_ENV))
+
+    download_dir = _remote_download_dir(remote, save_dir)
 
     if not os.path.exists(download_dir):
         os.makedirs(download_dir)
 
     download_path = os.path.join(download_dir, remote.filename)
-    if not os.path.exists(download_path) or force_overwrite:
+    if force_overwrite and os.path.exists(download_path):
+        # the existing file may be a hardlink into the archive store,
+        # so it is replaced instead of being written to
+        os.remove(download_path)
+
+    if not os.path.exists(download_path) and not fetch_from_archive_store(
+        remote, download_path, archive_store
+    ):
         # If file doesn't exist or we want to overwrite, download it
         with DownloadProgressBar(
             unit='B', unit_scale=True, unit_divisor=1024, miniters=1
@@ -133,16 +317,7 @@ def download_from_remote(remote, save_dir, force_overwrite=False):
                     data=None,
                 )
             except Exception as e:
-                error_msg = """
-                            mirdata failed to download the dataset from {}!
-                            Please try again in a few minutes.
-                            If this error persists, please raise an issue at
-                            https://github.com/mir-dataset-loaders/mirdata,
-                            and tag it with 'broken-link'.
-                            """.format(
-                    remote.url
-                )
-                print(error_msg)
+                print(_download_error_message(remote.url))
                 raise e
 
     checksum = md5(download_path)
@@ -152,10 +327,15 @@ def download_from_remote(remote, save_dir, force_overwrite=False):
             'differing from expected ({}), '
             'file may be corrupted.'.format(download_path, checksum, remote.checksum)
         )
+
+    if archive_store is not None and populate_store:
+        add_to_archive_store(download_path, checksum, archive_store)
     return download_path
 
 
-def download_zip_file(zip_remote, save_dir, force_overwrite, cleanup=True):
+def download_zip_file(
+    zip_remote, save_dir, force_overwrite, cleanup=True, **extract_kwargs
+):
     """Download and unzip a zip file.
 
     Args:
@@ -167,27 +347,104 @@ def download_zip_file(zip_remote, save_dir, force_overwrite, cleanup=True):
             If True, overwrites existing files
         cleanup (bool):
             If True, remove zipfile after unziping. Default=False
+        **extract_kwargs:
+            Extra arguments passed to `unzip`
+            (`skip_existing`, `checksums`, `path_rewrite`)
     """
     zip_download_path = download_from_remote(zip_remote, save_dir, force_overwrite)
-    unzip(zip_download_path, cleanup=cleanup)
+    unzip(zip_download_path, cleanup=cleanup, **extract_kwargs)
+
+
+def rewrite_member_path(member_path, path_rewrite):
+    """Get the path an archive member is extracted to.
+
+    Args:
+        member_path (str): path of the member inside the archive
+        path_rewrite (str, function or None):
+            If None, the path is kept as it is.
+            If a string, it is a folder prefix which is stripped from the
+            members inside that folder, e.g. 'maestro-v2.0.0' extracts
+            'maestro-v2.0.0/2004/x.wav' to '2004/x.wav'.
+            If a function, it maps the member path to the extracted path.
+
+    Returns:
+        path (str or None): the rewritten path, or None if the member
+            should not be extracted
+
+    """
+    if path_rewrite is None:
+        return member_path
+    if callable(path_rewrite):
+        return path_rewrite(member_path)
+
+    prefix = path_rewrite.rstrip('/') + '/'
+    if member_path.startswith(prefix):
+        member_path = member_path[len(prefix) :]
+    elif member_path == path_rewrite.rstrip('/'):
+        member_path = ''
+    return member_path if member_path else None
+
+
+def _member_filename(member, path_rewrite=None):
+    """Get the on-disk name of a zip member, fixing cp437-encoded names"""
+    if (
+        member.filename.encode('cp437').decode()
+        != member.filename.encode('utf8').decode()
+    ):
+        return rewrite_member_path(
+            member.filename.encode('cp437').decode(), path_rewrite
+        )
+    return rewrite_member_path(member.filename, path_rewrite)
+
 
+def _rewrite_tar_members(members, path_rewrite):
+    """Rename tar members in place according to path_rewrite,
+    dropping the ones which should not be extracted.
+    """
+    for member in members:
+        member_path = rewrite_member_path(member.name, path_rewrite)
+        if member_path is None:
+            continue
+        member.name = member_path
+        yield member
 
-def extractall_unicode(zfile, out_dir):
+
+def _is_extracted(disk_file_name, size, checksums):
+    """Check if an archive member was already extracted to disk_file_name,
+    i.e. it exists with the expected size and, if known, the expected checksum.
+    """
+    if not os.path.isfile(disk_file_name):
+        return False
+    if os.path.getsize(disk_file_name) != size:
+        return False
+    checksum = None
+    if checksums is not None:
+        checksum = checksums.get(os.path.normpath(disk_file_name))
+    return checksum is None or md5(disk_file_name) == checksum
+
+
+def extractall_unicode(zfile, out_dir, members=None, path_rewrite=None):
     """Extract all files inside a zip archive to a output directory.
     In comparison to the zipfile, it checks for correct file name encoding
 
     Args:
         zfile (obj): Zip file object created with zipfile.ZipFile
         out_dir (str): Output folder
+        members (list or None): list of zipfile.ZipInfo objects to extract.
+            If None, all members are extracted.
+        path_rewrite (str, function or None): see `rewrite_member_path`
 
     """
-    for m in zfile.infolist():
+    if members is None:
+        members = zfile.infolist()
+    for m in members:
+        member_path = _member_filename(m, path_rewrite)
+        if member_path is None:
+            continue
+
         data = zfile.read(m)  # extract zipped data into memory
 
-        if m.filename.encode('cp437').decode() != m.filename.encode('utf8').decode():
-            disk_file_name = os.path.join(out_dir, m.filename.encode('cp437').decode())
-        else:
-            disk_file_name = os.path.join(out_dir, m.filename)
+        disk_file_name = os.path.join(out_dir, member_path)
 
         dir_name = os.path.dirname(disk_file_name)
         if not os.path.exists(dir_name):
@@ -198,22 +455,44 @@ def extractall_unicode(zfile, out_dir):
                 fd.write(data)
 
 
-def unzip(zip_path, cleanup=True):
+def unzip(
+    zip_path, cleanup=True, skip_existing=False, checksums=None, path_rewrite=None
+):
     """Unzip a zip file inside it's current directory.
 
     Args:
         zip_path (str): Path to zip file
         cleanup (bool): If True, remove zipfile after unzipping. Default=False
+        skip_existing (bool): If True, members which already exist on disk
+            with the expected size (and checksum, if known) are not extracted
+        checksums (dict or None): Expected md5 checksums of the extracted files,
+            keyed by normalized file path
+        path_rewrite (str, function or None): see `rewrite_member_path`
 
     """
+    out_dir = os.path.dirname(zip_path)
     zfile = zipfile.ZipFile(zip_path, 'r')
-    extractall_unicode(zfile, os.path.dirname(zip_path))
+    members = None
+    if skip_existing:
+        members = [
+            m
+            for m in zfile.infolist()
+            if _member_filename(m, path_rewrite) is not None
+            and not _is_extracted(
+                os.path.join(out_dir, _member_filename(m, path_rewrite)),
+                m.file_size,
+                checksums,
+            )
+        ]
+    extractall_unicode(zfile, out_dir, members=members, path_rewrite=path_rewrite)
     zfile.close()
     if cleanup:
         os.remove(zip_path)
 
 
-def download_tar_file(tar_remote, save_dir, force_overwrite, cleanup=True):
+def download_tar_file(
+    tar_remote, save_dir, force_overwrite, cleanup=True, **extract_kwargs
+):
     """Download and untar a tar file.
 
     Args:
@@ -221,20 +500,357 @@ def download_tar_file(tar_remote, save_dir, force_overwrite, cleanup=True):
         save_dir (str): Path to save downloaded file
         force_overwrite (bool): If True, overwrites existing files
         cleanup (bool): If True, remove tarfile after untarring. Default=False
+        **extract_kwargs: Extra arguments passed to `untar`
+            (`skip_existing`, `checksums`, `path_rewrite`)
     """
     tar_download_path = download_from_remote(tar_remote, save_dir, force_overwrite)
-    untar(tar_download_path, cleanup=cleanup)
+    untar(tar_download_path, cleanup=cleanup, **extract_kwargs)
 
 
-def untar(tar_path, cleanup=True):
+def untar(
+    tar_path, cleanup=True, skip_existing=False, checksums=None, path_rewrite=None
+):
     """Untar a tar file inside it's current directory.
 
     Args:
         tar_path (str): Path to tar file
         cleanup (bool): If True, remove tarfile after untarring. Default=False
+        skip_existing (bool): If True, members which already exist on disk
+            with the expected size (and checksum, if known) are not extracted
+        checksums (dict or None): Expected md5 checksums of the extracted files,
+            keyed by normalized file path
+        path_rewrite (str, function or None): see `rewrite_member_path`
     """
+    out_dir = os.path.dirname(tar_path)
     tfile = tarfile.open(tar_path, 'r')
-    tfile.extractall(os.path.dirname(tar_path))
+    members = None
+    if path_rewrite is not None:
+        members = list(_rewrite_tar_members(tfile.getmembers(), path_rewrite))
+    if skip_existing:
+        members = [
+            m
+            for m in (tfile.getmembers() if members is None else members)
+            if not (
+                m.isfile()
+                and _is_extracted(os.path.join(out_dir, m.name), m.size, checksums)
+            )
+        ]
+    tfile.extractall(out_dir, members=members)
     tfile.close()
     if cleanup:
         os.remove(tar_path)
+
+
+class _HashingReader(object):
+    """File-like wrapper which computes the md5 hash of everything read
+    through it and reports the number of bytes read to a progress bar.
+    """
+
+    def __init__(self, fileobj, progress_bar=None):
+        self._fileobj = fileobj
+        self._progress_bar = progress_bar
+        self._hash_md5 = hashlib.md5()
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self._hash_md5.update(data)
+        if self._progress_bar is not None:
+            self._progress_bar.update(len(data))
+        return data
+
+    def drain(self, chunk_size=65536):
+        """Read (and hash) whatever is left in the stream"""
+        while self.read(chunk_size):
+            pass
+
+    def hexdigest(self):
+        return self._hash_md5.hexdigest()
+
+
+def _move_tree(source_dir, target_dir):
+    """Move the contents of `source_dir` into `target_dir`, merging with
+    any existing folders and replacing existing files.
+    """
+    for root, dirs, files in os.walk(source_dir):
+        target_root = os.path.join(target_dir, os.path.relpath(root, source_dir))
+        if not os.path.exists(target_root):
+            os.makedirs(target_root)
+        for fname in files:
+            os.replace(os.path.join(root, fname), os.path.join(target_root, fname))
+
+
+def stream_tar_file(
+    tar_remote, save_dir, force_overwrite=False, skip_existing=False, checksums=None
+):
+    """Download a tar file and extract it on the fly.
+
+    The archive is never written to disk: the http response is fed directly
+    to `tarfile` in streaming mode and its md5 checksum is computed while
+    reading. Files are extracted to a staging folder inside the destination
+    folder and are only moved to their final location if the checksum of
+    the compressed stream matches the expected one.
+
+    If the archive is already present locally and `force_overwrite` is False,
+    or if it is found in the archive store, it is extracted from disk instead
+    (see `untar`).
+
+    Args:
+        tar_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save the extracted files
+        force_overwrite (bool): If True, overwrites existing files
+        skip_existing (bool): If True, members which already exist on disk
+            with the expected size (and checksum, if known) are not extracted.
+            The whole archive is still downloaded, to verify its checksum.
+        checksums (dict or None): Expected md5 checksums of the extracted files,
+            keyed by normalized file path
+
+    Raises:
+        IOError: if the checksum of the downloaded stream is different from expected
+
+    """
+    download_dir = _remote_download_dir(tar_remote, save_dir)
+    local_tar_path = os.path.join(download_dir, tar_remote.filename)
+    extract_kwargs = {
+        'skip_existing': skip_existing,
+        'checksums': checksums,
+        'path_rewrite': tar_remote.path_rewrite,
+    }
+    if os.path.exists(local_tar_path) and not force_overwrite:
+        download_tar_file(
+            tar_remote, save_dir, force_overwrite, cleanup=False, **extract_kwargs
+        )
+        return
+
+    if not os.path.exists(download_dir):
+        os.makedirs(download_dir)
+
+    if not os.path.exists(local_tar_path) and fetch_from_archive_store(
+        tar_remote, local_tar_path, os.environ.get(ARCHIVE_STORE_ENV)
+    ):
+        download_tar_file(tar_remote, save_dir, False, cleanup=True, **extract_kwargs)
+        return
+
+    staging_dir = tempfile.mkdtemp(prefix='.mirdata-staging-', dir=download_dir)
+    try:
+        try:
+            response = urllib.request.urlopen(tar_remote.url)
+        except Exception as e:
+            print(_download_error_message(tar_remote.url))
+            raise e
+
+        with response, DownloadProgressBar(
+            unit='B',
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            total=response.length,
+        ) as t:
+            reader = _HashingReader(response, progress_bar=t)
+            with tarfile.open(fileobj=reader, mode='r|*') as tfile:
+                for member in _rewrite_tar_members(tfile, tar_remote.path_rewrite):
+                    if (
+                        skip_existing
+                        and member.isfile()
+                        and _is_extracted(
+                            os.path.join(download_dir, member.name),
+                            member.size,
+                            checksums,
+                        )
+                    ):
+                        continue
+                    tfile.extract(member, staging_dir)
+            # tarfile stops before the end-of-archive padding
+            reader.drain()
+
+        checksum = reader.hexdigest()
+        if tar_remote.checksum != checksum:
+            raise IOError(
+                '{} has an MD5 checksum ({}) '
+                'differing from expected ({}), '
+                'file may be corrupted.'.format(
+                    tar_remote.url, checksum, tar_remote.checksum
+                )
+            )
+
+        _move_tree(staging_dir, download_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+class HttpRangeFile(object):
+    """Read-only, seekable file-like view of a remote file, backed by
+    http range requests.
+
+    Only the bytes which are actually read are transferred, which allows
+    `zipfile` to read a remote archive's central directory and a subset of
+    its members without downloading the whole file.
+
+    Args:
+        url (str): url of the remote file. The server must support range requests.
+        block_size (int): minimum number of bytes fetched per request
+
+    Attributes:
+        size (int): size of the remote file in bytes
+        bytes_read (int): number of bytes transferred so far
+
+    """
+
+    def __init__(self, url, block_size=65536):
+        self.url = url
+        self.block_size = block_size
+        self.bytes_read = 0
+        self._position = 0
+        self._buffer_start = 0
+        self._buffer = b''
+
+        request = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(request) as response:
+            content_length = response.headers.get('Content-Length')
+        if content_length is None:
+            raise IOError('{} did not report a Content-Length'.format(url))
+        self.size = int(content_length)
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            self._position = offset
+        elif whence == 1:
+            self._position += offset
+        elif whence == 2:
+            self._position = self.size + offset
+        else:
+            raise ValueError('invalid whence ({})'.format(whence))
+        if self._position < 0:
+            raise ValueError('negative seek position {}'.format(self._position))
+        return self._position
+
+    def _fetch(self, start, end):
+        request = urllib.request.Request(
+            self.url, headers={'Range': 'bytes={}-{}'.format(start, end - 1)}
+        )
+        with urllib.request.urlopen(request) as response:
+            if response.status != 206:
+                raise IOError(
+                    '{} does not support http range requests'.format(self.url)
+                )
+            data = response.read()
+        self.bytes_read += len(data)
+        return data
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self._position
+        end = min(self._position + size, self.size)
+        if end <= self._position:
+            return b''
+
+        buffer_end = self._buffer_start + len(self._buffer)
+        if not (self._buffer_start <= self._position and end <= buffer_end):
+            fetch_end = min(max(end, self._position + self.block_size), self.size)
+            self._buffer = self._fetch(self._position, fetch_end)
+            self._buffer_start = self._position
+
+        offset = self._position - self._buffer_start
+        data = self._buffer[offset : offset + end - self._position]
+        self._position += len(data)
+        return data
+
+    def close(self):
+        self._buffer = b''
+
+
+def _open_zip_remote(zip_remote, save_dir):
+    """Open a zip remote, from disk if the archive was kept after extraction
+    and through http range requests otherwise.
+    """
+    download_dir = _remote_download_dir(zip_remote, save_dir)
+    local_zip_path = os.path.join(download_dir, zip_remote.filename)
+    if os.path.exists(local_zip_path):
+        return zipfile.ZipFile(local_zip_path, 'r')
+
+    try:
+        remote_file = HttpRangeFile(zip_remote.url)
+    except Exception as e:
+        print(_download_error_message(zip_remote.url))
+        raise e
+    return zipfile.ZipFile(remote_file, 'r')
+
+
+def list_zip_members(zip_remote, save_dir):
+    """List the files inside a zip remote, reading only its central directory.
+
+    Args:
+        zip_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path where the remote is downloaded. Usually `data_home`
+
+    Returns:
+        members (list): paths of the files in the archive, relative to the
+            remote's destination folder
+
+    """
+    with _open_zip_remote(zip_remote, save_dir) as zfile:
+        member_paths = [
+            _member_filename(m, zip_remote.path_rewrite)
+            for m in zfile.infolist()
+            if not m.is_dir()
+        ]
+    return [path for path in member_paths if path is not None]
+
+
+def download_zip_members(
+    zip_remote, save_dir, patterns=None, members=None, force_overwrite=False
+):
+    """Extract a subset of the members of a remote zip file, without
+    downloading the whole archive.
+
+    The archive's central directory and the selected members are read
+    with http range requests (see `HttpRangeFile`), or from disk if the
+    archive is present locally. Each member is verified against the CRC
+    stored in the archive.
+
+    Args:
+        zip_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save the extracted files
+        patterns (list or None): list of glob patterns (see `fnmatch`) matched
+            against the member paths
+        members (list or None): list of member paths to extract
+        force_overwrite (bool): If True, overwrites existing files
+
+    Member paths are relative to the remote's destination folder.
+
+    Returns:
+        extracted (list): paths of the members that were extracted
+
+    """
+    patterns = [] if patterns is None else patterns
+    members = set() if members is None else set(members)
+
+    download_dir = _remote_download_dir(zip_remote, save_dir)
+    with _open_zip_remote(zip_remote, save_dir) as zfile:
+        selected = []
+        for m in zfile.infolist():
+            fname = _member_filename(m, zip_remote.path_rewrite)
+            if fname is None:
+                continue
+            if fname not in members and not any(
+                fnmatch.fnmatch(fname, p) for p in patterns
+            ):
+                continue
+            if force_overwrite or not os.path.exists(os.path.join(download_dir, fname)):
+                selected.append(m)
+        extractall_unicode(
+            zfile,
+            download_dir,
+            members=selected,
+            path_rewrite=zip_remote.path_rewrite,
+        )
+
+    return [_member_filename(m, zip_remote.path_rewrite) for m in selected]
@@ -3,7 +3,6 @@
 """
 
 import jams
-import librosa
 import os
 
 from mirdata import utils
@@ -32,7 +31,9 @@ def jams_converter(
     ----------
     audio_path (str or None):
         A path to the corresponding audio file, or None. If provided,
-        the audio file will be read to compute the duration. If None,
+        the duration is read from the dataset's audio info table if it was
+        loaded, or from the audio file's header (see
+        `utils.get_audio_info`). If None,
         'duration' must be a field in the metadata dictionary, or the
         resulting jam object will not validate.
     spectrum_cante100_path (str or None):
@@ -82,7 +83,7 @@ def jams_converter(
     duration = None
     if audio_path is not None:
         if os.path.exists(audio_path):
-            duration = librosa.get_duration(filename=audio_path)
+            duration = utils.get_audio_duration(audio_path)
         else:
             raise OSError(
                 "jams conversion failed because the audio file "
@@ -21,15 +21,44 @@ Attributes:
 
     TempoData (namedtuple): `time`, `duration`, `value`, `confidence`
 
+    AudioInfo (namedtuple): `duration`, `sr`, `channels`, `frames`, `codec`
+
+    METADATA_CACHE_ENV (str): Name of the environment variable pointing to a
+        directory where parsed metadata is persisted (see `LargeData.metadata`).
+        If not set, metadata is parsed from its source files in every process.
+
+    INDEX_BACKEND_ENV (str): Name of the environment variable selecting the
+        default `LargeData` index backend, `json` (default) or `sqlite`.
+
+    ANNOTATION_CACHE_ENV (str): Name of the environment variable setting the
+        size in bytes of `ANNOTATION_CACHE` (default 512 MB).
+
+    ANNOTATION_CACHE (AnnotationCache): cache shared by all the tracks'
+        `cached_annotation` properties.
+
 """
 
 
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from collections.abc import Mapping
+from concurrent import futures
 import hashlib
 import os
 import json
+import logging
+import pickle
+import sqlite3
+import sys
+import tempfile
+import threading
+import weakref
+
+import librosa
+import numpy as np
+import soundfile
 import tqdm
 from mirdata import download_utils
+from mirdata import version
 
 
 def md5(file_path):
@@ -170,6 +199,35 @@ def check_index(dataset_index, data_home, verbose=True):
     return missing_files, invalid_checksums
 
 
+def index_checksums(dataset_index):
+    """Get the checksum of every file in a dataset index
+
+    Args:
+        dataset_index (dict): dataset index
+
+    Returns:
+        checksums (dict): {normalized file path relative to data_home: md5 checksum}
+
+    """
+    checksums = {}
+    if dataset_index.get('metadata') is not None:
+        for file_path, checksum in dataset_index['metadata'].values():
+            if file_path is not None:
+                checksums[os.path.normpath(file_path)] = checksum
+
+    for group in ['tracks', 'multitracks']:
+        if dataset_index.get(group) is None:
+            continue
+        for file_dict in dataset_index[group].values():
+            for file_key, file_info in file_dict.items():
+                # multitracks list their tracks, which are not files
+                if file_key == 'tracks' or file_info[0] is None:
+                    continue
+                checksums[os.path.normpath(file_info[0])] = file_info[1]
+
+    return checksums
+
+
 def validator(dataset_index, data_home, verbose=True):
     """Checks the existence and validity of files stored locally with
     respect to the paths and file checksums stored in the reference index.
@@ -243,6 +301,184 @@ TempoData = namedtuple("TempoData", ["time", "duration", "value", "confidence"])
 
 EventData = namedtuple("EventData", ["start_times", "end_times", "event"])
 
+AudioInfo = namedtuple("AudioInfo", ["duration", "sr", "channels", "frames", "codec"])
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".aif", ".aiff", ".m4a")
+
+METADATA_CACHE_ENV = "MIRDATA_METADATA_CACHE"
+INDEX_BACKEND_ENV = "MIRDATA_INDEX_BACKEND"
+ANNOTATION_CACHE_ENV = "MIRDATA_ANNOTATION_CACHE_BYTES"
+
+
+# LargeData objects with a loaded audio info table, looked up by get_audio_info
+_AUDIO_INFO_TABLES = weakref.WeakSet()
+
+
+def _file_mtime(path):
+    # modification time of path in ns, or None if it does not exist
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_audio_info(audio_path):
+    # read the audio info from the file's header, or decode it if needed
+    if not os.path.exists(audio_path):
+        raise IOError("audio_path {} does not exist".format(audio_path))
+    try:
+        sf_info = soundfile.info(audio_path)
+        return AudioInfo(
+            sf_info.duration,
+            sf_info.samplerate,
+            sf_info.channels,
+            sf_info.frames,
+            "{}/{}".format(sf_info.format, sf_info.subtype),
+        )
+    except RuntimeError:
+        y, sr = librosa.load(audio_path, sr=None, mono=False)
+        return AudioInfo(
+            y.shape[-1] / float(sr),
+            sr,
+            1 if y.ndim == 1 else y.shape[0],
+            y.shape[-1],
+            os.path.splitext(audio_path)[1][1:].upper(),
+        )
+
+
+def _try_read_audio_info(audio_path):
+    # the file's audio info, or None if it cannot be read
+    try:
+        return _read_audio_info(audio_path)
+    except Exception as exc:
+        logging.warning(
+            "Could not read the audio info of {}: {}".format(audio_path, exc)
+        )
+        return None
+
+
+def get_audio_info(audio_path):
+    """Get the duration, sample rate, number of channels and frames and the
+    codec of an audio file. It is looked up in the audio info tables loaded
+    with `LargeData.audio_info` if the file did not change since, or read
+    from the file's header when the format allows it (e.g. wav, flac, ogg,
+    mp3), otherwise by decoding it.
+
+    Args:
+        audio_path (str): path to the audio file
+
+    Returns:
+        (AudioInfo): the file's audio info
+
+    """
+    for table in list(_AUDIO_INFO_TABLES):
+        info = table._lookup_audio_info(audio_path)
+        if info is not None:
+            return info
+    return _read_audio_info(audio_path)
+
+
+def get_audio_duration(audio_path):
+    """Get the duration of an audio file (see `get_audio_info`).
+
+    Args:
+        audio_path (str): path to the audio file
+
+    Returns:
+        (float): duration in seconds
+
+    """
+    return get_audio_info(audio_path).duration
+
+
+def load_audio_window(audio_path, offset, duration, sr=None, mono=True):
+    """Load a window of an audio file. For formats supporting it, only the
+    window is read and decoded.
+
+    Args:
+        audio_path (str): path to the audio file
+        offset (float): start of the window in seconds
+        duration (float): duration of the window in seconds. The window is
+            shorter if the file ends before it does.
+        sr (float or None): sample rate to resample to. If None, uses the
+            file's sample rate
+        mono (bool): if True, the audio is mixed down to mono
+
+    Returns:
+        y (np.ndarray): the audio signal
+        sr (float): The sample rate of the audio
+
+    """
+    if not os.path.exists(audio_path):
+        raise IOError("audio_path {} does not exist".format(audio_path))
+    return librosa.load(audio_path, sr=sr, mono=mono, offset=offset, duration=duration)
+
+
+def _select(values, keep):
+    # index arrays, lists or None with a boolean mask
+    if values is None:
+        return None
+    if isinstance(values, np.ndarray):
+        return values[keep]
+    return [value for value, k in zip(values, keep) if k]
+
+
+def crop_annotation(annotation, start_time, end_time):
+    """Get the part of a time-aligned annotation between start_time and
+    end_time, with times relative to start_time, e.g. to match a crop of the
+    audio. Events overlapping the window are cut at its boundaries.
+
+    Args:
+        annotation (namedtuple): a F0Data, MultipitchData, BeatData, NoteData,
+            ChordData, SectionData, KeyData, EventData, LyricData or TempoData.
+            Other values are returned unchanged.
+        start_time (float): start of the window in seconds
+        end_time (float): end of the window in seconds
+
+    Returns:
+        the cropped annotation, of the same type
+
+    """
+    if isinstance(annotation, (F0Data, MultipitchData, BeatData)):
+        times = np.asarray(annotation[0], dtype=float)
+        keep = (times >= start_time) & (times < end_time)
+        return annotation.__class__(
+            times[keep] - start_time, *[_select(v, keep) for v in annotation[1:]]
+        )
+
+    if isinstance(annotation, (NoteData, ChordData, SectionData)):
+        intervals = np.asarray(annotation[0], dtype=float).reshape(-1, 2)
+        keep = (intervals[:, 1] > start_time) & (intervals[:, 0] < end_time)
+        intervals = np.clip(intervals[keep], start_time, end_time) - start_time
+        return annotation.__class__(
+            intervals, *[_select(v, keep) for v in annotation[1:]]
+        )
+
+    if isinstance(annotation, (KeyData, EventData, LyricData)):
+        start_times = np.asarray(annotation.start_times, dtype=float)
+        end_times = np.asarray(annotation.end_times, dtype=float)
+        keep = (end_times > start_time) & (start_times < end_time)
+        return annotation.__class__(
+            np.clip(start_times[keep], start_time, end_time) - start_time,
+            np.clip(end_times[keep], start_time, end_time) - start_time,
+            *[_select(v, keep) for v in annotation[2:]]
+        )
+
+    if isinstance(annotation, TempoData):
+        times = np.asarray(annotation.time, dtype=float)
+        ends = times + np.asarray(annotation.duration, dtype=float)
+        keep = (ends > start_time) & (times < end_time)
+        times = np.clip(times[keep], start_time, end_time)
+        ends = np.clip(ends[keep], start_time, end_time)
+        return TempoData(
+            times - start_time,
+            ends - times,
+            _select(annotation.value, keep),
+            _select(annotation.confidence, keep),
+        )
+
+    return annotation
+
 
 def load_json_index(filename):
     working_dir = os.path.dirname(os.path.realpath(__file__))
@@ -250,10 +486,236 @@ def load_json_index(filename):
         return json.load(f)
 
 
+def build_sqlite_index(index_path, db_path):
+    """Convert a json index to an sqlite database, read by `SqliteIndex`.
+    Every top level dictionary (tracks, multitracks, metadata) is stored as one
+    row per entry, any other top level value (e.g. version) as a single row.
+
+    Args:
+        index_path (str): path to the json index
+        db_path (str): path to the sqlite database to write
+
+    """
+    with open(index_path) as fhandle:
+        index = json.load(fhandle)
+
+    # written to a temporary file first, so readers never see a partial database
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(db_path), suffix=".tmp")
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(tmp_path)
+        with connection:
+            connection.execute(
+                "CREATE TABLE entries "
+                "(grp TEXT, id TEXT, value TEXT, PRIMARY KEY (grp, id))"
+            )
+            connection.execute("CREATE TABLE top (key TEXT PRIMARY KEY, value TEXT)")
+            for key, value in index.items():
+                if isinstance(value, dict):
+                    connection.executemany(
+                        "INSERT INTO entries VALUES (?, ?, ?)",
+                        ((key, k, json.dumps(v)) for k, v in value.items()),
+                    )
+                connection.execute(
+                    "INSERT INTO top VALUES (?, ?)",
+                    (key, None if isinstance(value, dict) else json.dumps(value)),
+                )
+        connection.close()
+        os.replace(tmp_path, db_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class _SqliteConnection(object):
+    """One read-only sqlite connection per thread and process"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def execute(self, query, params=()):
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                "file:{}?mode=ro".format(self.db_path), uri=True
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection.execute(query, params)
+
+
+class SqliteIndexGroup(Mapping):
+    """A top level dictionary of a `SqliteIndex` (e.g. tracks), read from
+    the database on access, one indexed lookup per entry.
+    """
+
+    def __init__(self, connection, group):
+        self._connection = connection
+        self._group = group
+
+    def __getitem__(self, key):
+        row = self._connection.execute(
+            "SELECT value FROM entries WHERE grp = ? AND id = ?", (self._group, key)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __contains__(self, key):
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM entries WHERE grp = ? AND id = ?", (self._group, key)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self):
+        rows = self._connection.execute(
+            "SELECT id FROM entries WHERE grp = ? ORDER BY rowid", (self._group,)
+        ).fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM entries WHERE grp = ?", (self._group,)
+        ).fetchone()[0]
+
+    def items(self):
+        rows = self._connection.execute(
+            "SELECT id, value FROM entries WHERE grp = ? ORDER BY rowid",
+            (self._group,),
+        ).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+
+class SqliteIndex(Mapping):
+    """A dataset index stored in sqlite (see `build_sqlite_index`), with the
+    same structure as the json index: `index['tracks'][track_id]` is a point
+    lookup in the database instead of a lookup in the fully loaded json.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = _SqliteConnection(db_path)
+        self._top = OrderedDict(
+            (key, None if value is None else json.loads(value))
+            for key, value in self._connection.execute(
+                "SELECT key, value FROM top ORDER BY rowid"
+            ).fetchall()
+        )
+
+    def __getitem__(self, key):
+        if key not in self._top:
+            raise KeyError(key)
+        if self._top[key] is None:
+            return SqliteIndexGroup(self._connection, key)
+        return self._top[key]
+
+    def __iter__(self):
+        return iter(self._top)
+
+    def __len__(self):
+        return len(self._top)
+
+
+def load_sqlite_index(filename):
+    """Load a json index through its sqlite database, which is (re)built when
+    it is missing or older than the json index. It is kept in the user's
+    cache directory, `$XDG_CACHE_HOME/mirdata` or `~/.cache/mirdata`, named
+    after the json index's location.
+
+    Args:
+        filename (str): file name of the json index
+
+    Returns:
+        index (SqliteIndex): the dataset index
+
+    Raises:
+        OSError: if the cache directory is not writable
+        sqlite3.Error: if the database cannot be built or read
+
+    """
+    working_dir = os.path.dirname(os.path.realpath(__file__))
+    index_path = os.path.join(working_dir, "datasets/indexes", filename)
+    cache_dir = os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "mirdata",
+    )
+    db_path = os.path.join(
+        cache_dir,
+        "{}-{}.sqlite".format(
+            hashlib.md5(index_path.encode("utf-8")).hexdigest(),
+            os.path.splitext(filename)[0],
+        ),
+    )
+    if not os.path.exists(db_path) or os.path.getmtime(db_path) < os.path.getmtime(
+        index_path
+    ):
+        os.makedirs(cache_dir, exist_ok=True)
+        build_sqlite_index(index_path, db_path)
+    return SqliteIndex(db_path)
+
+
+class SingleFlight(object):
+    """Runs at most one call per key at a time: callers arriving while a
+    call with the same key is running wait for it and get its result (or
+    its exception) instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Call `fn()`, or wait for the running call with the same key.
+
+        Args:
+            key (hashable): identifies the work done by fn
+            fn (function): called without arguments
+
+        Returns:
+            fn's result
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event()}
+
+        if not leader:
+            call["done"].wait()
+            if "error" in call:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except BaseException as exc:
+            call["error"] = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+
+# shared by cached_property, cached_annotation and LargeData.metadata; keys
+# start with id(obj), which is unique while the call, holding obj, runs
+SINGLE_FLIGHT = SingleFlight()
+
+
 class cached_property(object):
     """A property that is only computed once per instance and then replaces
     itself with an ordinary attribute. Deleting the attribute resets the
-    property.
+    property. Threads accessing the property while it is being computed
+    wait for its value rather than computing it again.
     Source: https://github.com/bottlepy/bottle/commit/fa7733e075da0d790d809aa3d2f53071897e6f76
     """
 
@@ -265,12 +727,238 @@ class cached_property(object):
         # type: (Any, type) -> Any
         if obj is None:
             return self
-        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        return SINGLE_FLIGHT.do(
+            (id(obj), self.func.__name__), lambda: self._compute(obj)
+        )
+
+    def _compute(self, obj):
+        name = self.func.__name__
+        # set by a call which finished before this one started
+        if name in obj.__dict__:
+            return obj.__dict__[name]
+        value = obj.__dict__[name] = self.func(obj)
         return value
 
 
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions"])
+
+
+def nbytes(value, _depth=0):
+    """Approximate size in bytes of a loaded annotation: numpy arrays,
+    strings, numbers and the containers and objects holding them.
+
+    Args:
+        value (object): the annotation
+
+    Returns:
+        (int): size in bytes
+
+    """
+    if isinstance(value, np.ndarray):
+        return max(sys.getsizeof(value), value.nbytes)
+    size = sys.getsizeof(value)
+    if _depth > 16 or isinstance(value, (str, bytes, int, float)):
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += nbytes(key, _depth + 1) + nbytes(item, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += nbytes(item, _depth + 1)
+    elif hasattr(value, "__dict__"):
+        size += nbytes(vars(value), _depth + 1)
+    return size
+
+
+class AnnotationCache(object):
+    """Least recently used cache of loaded annotations, bounded by the total
+    size of the annotations it holds rather than by their number.
+
+    Entries belong to a track (any object supporting weak references) and
+    are dropped when the track is garbage collected, or when the cache is
+    over budget, least recently used first. Hits, misses and evictions are
+    counted per property.
+
+    Args:
+        max_bytes (int): maximum total size of the cached annotations,
+            as estimated by `nbytes`. 0 disables caching.
+
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._owners = {}  # {owner: (owner, names)}
+        self._stats = {}
+        # reentrant, as the garbage collector may release a track while
+        # the cache is being updated
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _count(self, name, field):
+        stats = self._stats.get(name, CacheStats(0, 0, 0))
+        self._stats[name] = stats._replace(**{field: getattr(stats, field) + 1})
+
+    def _pop(self, key):
+        size = self._entries.pop(key)[1]
+        self.nbytes -= size
+        owner = self._owners.get(key[0])
+        if owner is not None:
+            owner[1].discard(key[1])
+            if not owner[1]:
+                del self._owners[key[0]]
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._pop(key)
+            self._count(key[1], "evictions")
+
+    def _release(self, owner):
+        # weakref callback: the track was garbage collected
+        with self._lock:
+            if owner in self._owners:
+                for name in list(self._owners[owner][1]):
+                    self._pop((owner, name))
+
+    def get(self, obj, name, load_fn):
+        """Return the cached value of `name` for `obj`, calling
+        `load_fn(obj)` and caching its result if it is not cached.
+        Concurrent calls for the same value wait for a single load.
+
+        Args:
+            obj (object): the object the value belongs to
+            name (str): the property's name, used in `stats`
+            load_fn (function): loads the value from obj
+
+        Returns:
+            the value
+
+        """
+        key = (weakref.ref(obj), name)
+        value = self._lookup(key, name)
+        if value is not None:
+            return value[0]
+
+        loaded = []
+
+        def load():
+            loaded.append(True)
+            return self._load(obj, key, name, load_fn)
+
+        value = SINGLE_FLIGHT.do((id(obj), name), load)
+        if not loaded:
+            # loaded by a concurrent call
+            with self._lock:
+                self._count(name, "hits")
+        return value
+
+    def _lookup(self, key, name):
+        # a (value,) tuple on hits, None on misses
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self._count(name, "hits")
+            return (entry[0],)
+
+    def _load(self, obj, key, name, load_fn):
+        # cached by a call which finished before this one started
+        value = self._lookup(key, name)
+        if value is not None:
+            return value[0]
+        with self._lock:
+            self._count(name, "misses")
+
+        value = load_fn(obj)
+        size = nbytes(value)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            if key[0] not in self._owners:
+                # one reference with a callback per object, so that its
+                # entries are released with it
+                owner = weakref.ref(obj, self._release)
+                self._owners[owner] = (owner, set())
+            owner, names = self._owners[key[0]]
+            self._entries[(owner, name)] = (value, size)
+            names.add(name)
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def set_max_bytes(self, max_bytes):
+        """Change the cache's size, evicting entries if it shrinks.
+
+        Args:
+            max_bytes (int): maximum total size of the cached annotations
+
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Drop all cached annotations and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._owners.clear()
+            self._stats.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Hits, misses and evictions of each property.
+
+        Returns:
+            (dict): {property name: CacheStats}
+
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+ANNOTATION_CACHE = AnnotationCache(
+    int(os.environ.get(ANNOTATION_CACHE_ENV) or 512 * 1024 ** 2)
+)
+
+
+class cached_annotation(cached_property):
+    """A cached_property whose values are kept in `ANNOTATION_CACHE`
+    instead of the instance, so that the memory used by loaded annotations
+    is bounded: an evicted annotation is loaded again the next time it is
+    accessed. Properties are named `<module>.<class>.<name>` in the cache's
+    statistics.
+    """
+
+    def __init__(self, func):
+        super(cached_annotation, self).__init__(func)
+        self.name = "{}.{}".format(
+            func.__module__, getattr(func, "__qualname__", func.__name__)
+        )
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        return ANNOTATION_CACHE.get(obj, self.name, self.func)
+
+
 class LargeData(object):
-    def __init__(self, index_file, metadata_load_fn=None, remote_index=None):
+    def __init__(
+        self,
+        index_file,
+        metadata_load_fn=None,
+        remote_index=None,
+        metadata_cache_size=8,
+        backend=None,
+        metadata_paths=None,
+    ):
         """Object which loads and caches large data the first time it's
         accessed.
 
@@ -282,12 +970,42 @@ class LargeData(object):
             Function which returns a metadata dictionary.
             If None, assume the dataset has no metadata. When the
             `metadata` attribute is called, raises a NotImplementedError
+        metadata_cache_size: int
+            Number of metadata dictionaries kept in memory, one per
+            resolved key passed to `metadata`. The least recently used one
+            is dropped first.
+        backend: str
+            How the index is loaded: `json` loads the whole json index,
+            `sqlite` reads it from an sqlite database built from the json
+            index in the user's cache directory (see `load_sqlite_index`),
+            which is faster for large indexes when only a few tracks are
+            accessed. If it cannot be built or read, e.g. because the cache
+            directory is not writable, the json index is loaded instead.
+            If None, the `MIRDATA_INDEX_BACKEND` environment variable is used,
+            defaulting to `json`.
+        metadata_paths: list
+            Paths relative to data_home of the files or directories
+            `metadata_load_fn` reads, for datasets whose index lists no
+            metadata files. Cached metadata is reloaded when one of them
+            changes.
 
         """
-        self._metadata = None
+        if backend is None:
+            backend = os.environ.get(INDEX_BACKEND_ENV) or "json"
+        if backend not in ["json", "sqlite"]:
+            raise ValueError("backend must be one of json or sqlite")
+
+        self._metadata = OrderedDict()
+        self._metadata_lock = threading.Lock()
         self.index_file = index_file
         self.metadata_load_fn = metadata_load_fn
         self.remote_index = remote_index
+        self.metadata_cache_size = metadata_cache_size
+        self.backend = backend
+        self.metadata_paths = metadata_paths
+        self._metadata_db = None
+        self._audio_info = OrderedDict()
+        self._audio_info_lock = threading.Lock()
 
     @cached_property
     def index(self):
@@ -299,12 +1017,410 @@ class LargeData(object):
             if not os.path.isfile(path_index_file):
                 path_indexes = os.path.join(working_dir, "datasets/indexes")
                 download_utils.downloader(path_indexes, remotes=self.remote_index)
+        if self.backend == "sqlite":
+            try:
+                return load_sqlite_index(self.index_file)
+            except (OSError, sqlite3.Error) as exc:
+                logging.warning(
+                    "Could not use the sqlite index for {}, "
+                    "falling back to json: {}".format(self.index_file, exc)
+                )
         return load_json_index(self.index_file)
 
+    def _metadata_mtimes(self, data_home):
+        """Modification times of the files the metadata is loaded from:
+        the index's metadata files if it lists any, else `metadata_paths`,
+        or data_home itself if it is a file. Used to reload cached metadata
+        which changed on disk.
+        """
+        metadata_index = None
+        if isinstance(self.index, Mapping):
+            metadata_index = self.index.get("metadata")
+        if metadata_index:
+            paths = [
+                os.path.join(data_home, file_path)
+                for file_path, _ in metadata_index.values()
+                if file_path is not None
+            ]
+        elif self.metadata_paths:
+            paths = [
+                os.path.join(data_home, file_path) for file_path in self.metadata_paths
+            ]
+        elif os.path.isfile(data_home):
+            paths = [data_home]
+        else:
+            return None
+
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _metadata_cache_path(self, data_home, cache_dir):
+        """Path of the persisted metadata for data_home, named after the
+        checksums of the index's metadata files, or None if the index
+        lists no metadata files.
+        """
+        metadata_index = None
+        if isinstance(self.index, Mapping):
+            metadata_index = self.index.get("metadata")
+        if not metadata_index:
+            return None
+
+        cache_key = hashlib.md5()
+        cache_key.update(version.version.encode("utf-8"))
+        cache_key.update(os.path.realpath(data_home).encode("utf-8"))
+        for name in sorted(metadata_index):
+            cache_key.update(str(metadata_index[name][1]).encode("utf-8"))
+        return os.path.join(
+            cache_dir,
+            "{}-{}.pkl".format(
+                os.path.splitext(self.index_file)[0], cache_key.hexdigest()
+            ),
+        )
+
+    def _load_metadata(self, data_home, mtimes):
+        """Call `metadata_load_fn`, going through the persistent metadata
+        cache if the `MIRDATA_METADATA_CACHE` environment variable is set.
+        Persisted metadata is only used if its source files have the same
+        mtimes as when it was saved.
+        """
+        cache_dir = os.environ.get(METADATA_CACHE_ENV)
+        cache_path = None
+        if cache_dir and mtimes and None not in mtimes:
+            cache_path = self._metadata_cache_path(data_home, cache_dir)
+
+        if cache_path is not None and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as fhandle:
+                    cached_mtimes, metadata = pickle.load(fhandle)
+                if cached_mtimes == mtimes:
+                    return metadata
+            except Exception as exc:
+                logging.warning(
+                    "Ignoring unreadable metadata cache {}: {}".format(cache_path, exc)
+                )
+
+        metadata = self.metadata_load_fn(data_home)
+
+        if cache_path is not None and metadata is not None:
+            tmp_path = None
+            try:
+                if not os.path.exists(cache_dir):
+                    os.makedirs(cache_dir)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "wb") as fhandle:
+                    pickle.dump((mtimes, metadata), fhandle, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except Exception as exc:
+                logging.warning(
+                    "Could not write metadata cache {}: {}".format(cache_path, exc)
+                )
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        return metadata
+
     def metadata(self, data_home):
+        """Load the metadata for data_home, caching the result.
+
+        Cached metadata is keyed by the resolved data_home, so different
+        paths to the same location share one entry, and is reloaded when
+        one of its source files changed since it was loaded.
+
+        If the `MIRDATA_METADATA_CACHE` environment variable points to a
+        directory, parsed metadata is also persisted there (as a pickle
+        named after the index's metadata checksums), so other processes
+        skip parsing the source files as long as they are unchanged.
+
+        Parameters
+        ----------
+        data_home: str
+            Passed to `metadata_load_fn`
+
+        Returns
+        -------
+        metadata: dict or None
+            The loaded metadata, or None if it was not found
+
+        """
         if self.metadata_load_fn is None:
             raise NotImplementedError
 
-        if self._metadata is None or self._metadata["data_home"] != data_home:
-            self._metadata = self.metadata_load_fn(data_home)
-        return self._metadata
+        if data_home is None:
+            return self.metadata_load_fn(data_home)
+
+        key = os.path.realpath(data_home)
+        mtimes = self._metadata_mtimes(data_home)
+        metadata = self._cached_metadata(key, mtimes)
+        if metadata is not None:
+            return metadata[0]
+
+        # concurrent calls for the same data_home wait for a single load
+        return SINGLE_FLIGHT.do(
+            (id(self), "metadata", key, mtimes),
+            lambda: self._load_cached_metadata(data_home, key, mtimes),
+        )
+
+    def _cached_metadata(self, key, mtimes):
+        # a (metadata,) tuple if it is cached and up to date, else None
+        with self._metadata_lock:
+            if key in self._metadata and self._metadata[key][0] == mtimes:
+                self._metadata.move_to_end(key)
+                return (self._metadata[key][1],)
+        return None
+
+    def _load_cached_metadata(self, data_home, key, mtimes):
+        # cached by a call which finished before this one started
+        metadata = self._cached_metadata(key, mtimes)
+        if metadata is not None:
+            return metadata[0]
+
+        metadata = self._load_metadata(data_home, mtimes)
+        # missing metadata is not cached, so it is picked up once it exists
+        if metadata is not None:
+            with self._metadata_lock:
+                self._metadata[key] = (mtimes, metadata)
+                self._metadata.move_to_end(key)
+                while len(self._metadata) > self.metadata_cache_size:
+                    self._metadata.popitem(last=False)
+        return metadata
+
+    def _audio_files(self, data_home):
+        # (track_id, index key, absolute path, mtime or None if missing) of
+        # the tracks' audio files
+        for track_id, track_files in self.index["tracks"].items():
+            for key, (file_path, _) in track_files.items():
+                if file_path is not None and file_path.lower().endswith(
+                    AUDIO_EXTENSIONS
+                ):
+                    path = os.path.join(data_home, file_path)
+                    yield track_id, key, path, _file_mtime(path)
+
+    def _audio_info_paths(self, data_home):
+        """Where the audio info table of data_home is saved: in data_home,
+        and in the `MIRDATA_METADATA_CACHE` directory if it is set, for
+        datasets stored on read-only mounts.
+        """
+        table_name = "{}_audio_info.json".format(os.path.splitext(self.index_file)[0])
+        paths = [os.path.join(data_home, table_name)]
+        cache_dir = os.environ.get(METADATA_CACHE_ENV)
+        if cache_dir:
+            cache_key = hashlib.md5(os.path.realpath(data_home).encode("utf-8"))
+            paths.append(
+                os.path.join(
+                    cache_dir,
+                    "{}-{}".format(cache_key.hexdigest(), table_name),
+                )
+            )
+        return paths
+
+    def audio_info(self, data_home, workers=8, recompute=False):
+        """Get the audio info (duration, sample rate, channels, frames and
+        codec) of every track's audio files in data_home.
+
+        It is read from the files' headers in parallel the first time, and
+        saved as `<index name>_audio_info.json` in data_home, or in the
+        `MIRDATA_METADATA_CACHE` directory if data_home is not writable,
+        from where it is loaded afterwards. Each file's entry is kept with
+        the file's modification time: files added, changed or removed
+        since the table was computed are picked up on the next call.
+        Missing and unreadable files are left out.
+        Once loaded, `get_audio_info` (and so `Track.duration` and
+        `to_jams`) read durations from the table instead of the files.
+
+        Parameters
+        ----------
+        data_home: str
+            Where the dataset is stored
+        workers: int
+            Number of threads reading the files' headers
+        recompute: bool
+            If True, the whole table is computed again
+
+        Returns
+        -------
+        audio_info: dict
+            {track_id: {index key: AudioInfo}}
+
+        """
+        key = os.path.realpath(data_home)
+        files = list(self._audio_files(data_home))
+        mtimes = tuple(f[3] for f in files)
+        if recompute:
+            with self._audio_info_lock:
+                self._audio_info.pop(key, None)
+        else:
+            audio_info = self._cached_audio_info(key, mtimes)
+            if audio_info is not None:
+                return audio_info
+
+        return SINGLE_FLIGHT.do(
+            (id(self), "audio_info", key, mtimes, recompute),
+            lambda: self._load_audio_info(data_home, key, files, workers, recompute),
+        )
+
+    def _cached_audio_info(self, key, mtimes):
+        # the table of key if it is loaded and its files are unchanged
+        with self._audio_info_lock:
+            if key in self._audio_info and self._audio_info[key][0] == mtimes:
+                self._audio_info.move_to_end(key)
+                return self._audio_info[key][1]
+        return None
+
+    def _read_audio_info(self, data_home):
+        # {(track_id, index key): (mtime, AudioInfo)} from the saved table
+        for table_path in self._audio_info_paths(data_home):
+            if not os.path.exists(table_path):
+                continue
+            try:
+                with open(table_path) as fhandle:
+                    return {
+                        (track_id, file_key): (
+                            entry["mtime"],
+                            AudioInfo(*entry["info"]),
+                        )
+                        for track_id, track_info in json.load(fhandle).items()
+                        for file_key, entry in track_info.items()
+                    }
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                logging.warning(
+                    "Ignoring unreadable audio info table {}: {}".format(
+                        table_path, exc
+                    )
+                )
+        return {}
+
+    def _write_audio_info(self, data_home, entries):
+        table = {}
+        for (track_id, file_key), (mtime, info) in entries.items():
+            table.setdefault(track_id, {})[file_key] = {"mtime": mtime, "info": info}
+
+        for table_path in self._audio_info_paths(data_home):
+            tmp_path = None
+            try:
+                table_dir = os.path.dirname(table_path)
+                if not os.path.exists(table_dir):
+                    os.makedirs(table_dir)
+                fd, tmp_path = tempfile.mkstemp(dir=table_dir, suffix=".tmp")
+                with os.fdopen(fd, "w") as fhandle:
+                    json.dump(table, fhandle)
+                os.replace(tmp_path, table_path)
+                return
+            except OSError as exc:
+                logging.warning(
+                    "Could not save the audio info table {}: {}".format(table_path, exc)
+                )
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _load_audio_info(self, data_home, key, files, workers, recompute):
+        mtimes = tuple(f[3] for f in files)
+        if not recompute:
+            audio_info = self._cached_audio_info(key, mtimes)
+            if audio_info is not None:
+                return audio_info
+
+        saved = {} if recompute else self._read_audio_info(data_home)
+        entries = {}
+        to_compute = []
+        for track_id, file_key, path, mtime in files:
+            if mtime is None:
+                continue
+            entry = saved.get((track_id, file_key))
+            if entry is not None and entry[0] == mtime:
+                entries[(track_id, file_key)] = entry
+            else:
+                to_compute.append((track_id, file_key, path, mtime))
+
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            infos = executor.map(_try_read_audio_info, [f[2] for f in to_compute])
+            for (track_id, file_key, _, mtime), info in zip(to_compute, infos):
+                if info is not None:
+                    entries[(track_id, file_key)] = (mtime, info)
+
+        if entries and (to_compute or len(entries) != len(saved)):
+            self._write_audio_info(data_home, entries)
+
+        audio_info = {}
+        by_path = {}
+        for track_id, file_key, path, _ in files:
+            if (track_id, file_key) in entries:
+                mtime, info = entries[(track_id, file_key)]
+                audio_info.setdefault(track_id, {})[file_key] = info
+                by_path[os.path.abspath(path)] = (mtime, info)
+
+        with self._audio_info_lock:
+            self._audio_info[key] = (mtimes, audio_info, by_path)
+            self._audio_info.move_to_end(key)
+            while len(self._audio_info) > self.metadata_cache_size:
+                self._audio_info.popitem(last=False)
+        _AUDIO_INFO_TABLES.add(self)
+        return audio_info
+
+    def _lookup_audio_info(self, audio_path):
+        # the AudioInfo of audio_path in the loaded tables if it is unchanged
+        path = os.path.abspath(audio_path)
+        with self._audio_info_lock:
+            entries = [table[2].get(path) for table in self._audio_info.values()]
+        mtime = None
+        for entry in entries:
+            if entry is not None:
+                if mtime is None:
+                    mtime = _file_mtime(path)
+                if entry[0] == mtime:
+                    return entry[1]
+        return None
+
+    def query_metadata(self, data_home, where, params=()):
+        """Select track ids with an sql query on the metadata.
+
+        The metadata is copied to an in-memory sqlite database the first
+        time it is queried, and again when it is reloaded: it is not
+        persisted, so each process pays for the copy once. The metadata of
+        each track is stored as json in the `value` column of
+        a `metadata (track_id, value)` table, so fields are read with
+        `json_extract`, e.g. to select the DALI tracks in english:
+        `query_metadata(data_home, "json_extract(value, '$.metadata.language') = ?", ["english"])`
+
+        Parameters
+        ----------
+        data_home: str
+            Passed to `metadata`
+        where: str
+            sql condition on the `metadata` table
+        params: list
+            parameters of the query
+
+        Returns
+        -------
+        track_ids: list
+            ids of the tracks matching the condition
+
+        """
+        metadata = self.metadata(data_home)
+        if metadata is None:
+            return []
+
+        with self._metadata_lock:
+            if self._metadata_db is None or self._metadata_db[0] is not metadata:
+                connection = sqlite3.connect(":memory:", check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE metadata (track_id TEXT PRIMARY KEY, value TEXT)"
+                )
+                connection.executemany(
+                    "INSERT INTO metadata VALUES (?, ?)",
+                    (
+                        (track_id, json.dumps(value))
+                        for track_id, value in metadata.items()
+                        if isinstance(value, dict)
+                    ),
+                )
+                self._metadata_db = (metadata, connection)
+            rows = self._metadata_db[1].execute(
+                "SELECT track_id FROM metadata WHERE {} ORDER BY rowid".format(where),
+                params,
+            )
+            return [row[0] for row in rows]
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Benchmark re-running the extraction of an archive which was already
+# (fully or partially) extracted, with and without skip_existing.
+#
+# Usage: python benchmark_extraction.py --n-files 200 --file-size 1000000
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+import zipfile
+
+from mirdata import download_utils
+
+
+def make_archive(archive_path, n_files, file_size):
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zfile:
+        for i in range(n_files):
+            zfile.writestr('audio/{}.wav'.format(i), os.urandom(file_size))
+
+
+def timed_unzip(archive_path, **kwargs):
+    start = time.perf_counter()
+    download_utils.unzip(archive_path, cleanup=False, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(args):
+    work_dir = tempfile.mkdtemp()
+    try:
+        archive_path = os.path.join(work_dir, 'archive.zip')
+        make_archive(archive_path, args.n_files, args.file_size)
+
+        print('first extraction:        {:.3f}s'.format(timed_unzip(archive_path)))
+
+        # simulate an interrupted extraction
+        audio_files = os.listdir(os.path.join(work_dir, 'audio'))
+        for fname in random.sample(audio_files, int(len(audio_files) * args.missing)):
+            os.remove(os.path.join(work_dir, 'audio', fname))
+
+        print('re-extraction:           {:.3f}s'.format(timed_unzip(archive_path)))
+        for fname in random.sample(audio_files, int(len(audio_files) * args.missing)):
+            os.remove(os.path.join(work_dir, 'audio', fname))
+        print(
+            're-extraction (skip):    {:.3f}s'.format(
+                timed_unzip(archive_path, skip_existing=True)
+            )
+        )
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    PARSER = argparse.ArgumentParser(
+        description='Benchmark restarted extraction with skip_existing.'
+    )
+    PARSER.add_argument('--n-files', type=int, default=200)
+    PARSER.add_argument('--file-size', type=int, default=1000000)
+    PARSER.add_argument(
+        '--missing',
+        type=float,
+        default=0.1,
+        help='Fraction of the files removed before re-extracting.',
+    )
+    main(PARSER.parse_args())
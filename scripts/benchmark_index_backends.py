@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Benchmark the json and sqlite LargeData index backends: cold start (a new
+# process loading the index and opening one track) and point lookups.
+#
+# Usage: python benchmark_index_backends.py --index irmas_index.json
+import argparse
+import random
+import subprocess
+import sys
+import time
+
+from mirdata import utils
+
+COLD_START = """
+import time
+from mirdata import utils
+start = time.perf_counter()
+index = utils.LargeData({index!r}, backend={backend!r}).index
+index['tracks'][{track_id!r}]
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(index_file, backend, track_id, n_runs):
+    times = []
+    for _ in range(n_runs):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                '-c',
+                COLD_START.format(index=index_file, backend=backend, track_id=track_id),
+            ]
+        )
+        times.append(float(output))
+    return min(times)
+
+
+def point_lookups(index, track_ids):
+    start = time.perf_counter()
+    for track_id in track_ids:
+        index['tracks'][track_id]
+    return time.perf_counter() - start
+
+
+def main(args):
+    json_index = utils.LargeData(args.index, backend='json').index
+    # builds the sqlite database if needed, so it is not part of the timings
+    sqlite_index = utils.LargeData(args.index, backend='sqlite').index
+    track_ids = list(json_index['tracks'].keys())
+    lookups = [random.choice(track_ids) for _ in range(args.n_lookups)]
+
+    for backend, index in [('json', json_index), ('sqlite', sqlite_index)]:
+        print(
+            '{:6} cold start: {:.4f}s  {} lookups: {:.4f}s'.format(
+                backend,
+                cold_start(args.index, backend, track_ids[0], args.n_runs),
+                args.n_lookups,
+                point_lookups(index, lookups),
+            )
+        )
+
+
+if __name__ == '__main__':
+    PARSER = argparse.ArgumentParser(
+        description='Benchmark the json and sqlite index backends.'
+    )
+    PARSER.add_argument('--index', type=str, default='irmas_index.json')
+    PARSER.add_argument('--n-lookups', type=int, default=10000)
+    PARSER.add_argument('--n-runs', type=int, default=5)
+    main(PARSER.parse_args())
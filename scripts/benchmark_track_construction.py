@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Benchmark creating Track objects: time and memory held by n_tracks tracks
+# of a dataset, with and without reading their path attributes, and the
+# memory the "__dict__" entry of core.Track.__slots__ adds to n_tracks tracks.
+#
+# Usage: python benchmark_track_construction.py --dataset tinysol
+import argparse
+import itertools
+import time
+import tracemalloc
+
+import mirdata
+from mirdata import core
+
+
+def make_tracks(dataset, track_ids):
+    return [dataset.track(track_id) for track_id in track_ids]
+
+
+def traced_memory(make_objects):
+    tracemalloc.start()
+    objects = make_objects()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return memory
+
+
+def dict_slot_memory(n_tracks):
+    """Memory held by n_tracks instances of classes with core.Track's
+    slots, with minus without the __dict__ slot"""
+    slots = core.Track.__slots__
+    with_dict = type('WithDict', (object,), {'__slots__': slots})
+    without_dict = type(
+        'WithoutDict',
+        (object,),
+        {'__slots__': tuple(slot for slot in slots if slot != '__dict__')},
+    )
+    return traced_memory(
+        lambda: [with_dict() for _ in range(n_tracks)]
+    ) - traced_memory(lambda: [without_dict() for _ in range(n_tracks)])
+
+
+def main(args):
+    dataset = mirdata.Dataset(args.dataset, data_home=args.data_home)
+    track_ids = list(
+        itertools.islice(itertools.cycle(dataset.track_ids), args.n_tracks)
+    )
+    # load the index and metadata outside of the measurements
+    make_tracks(dataset, track_ids[:1])
+
+    start = time.perf_counter()
+    make_tracks(dataset, track_ids)
+    elapsed = time.perf_counter() - start
+
+    memory = traced_memory(lambda: make_tracks(dataset, track_ids))
+    tracks = make_tracks(dataset, track_ids)
+
+    path_attributes = [
+        attribute
+        for attribute in dir(tracks[0])
+        if attribute.endswith('_path') and not attribute.startswith('_')
+    ]
+    start = time.perf_counter()
+    for track in tracks:
+        for attribute in path_attributes:
+            getattr(track, attribute)
+    access = time.perf_counter() - start
+
+    print(
+        '{}: {} tracks in {:.4f}s, {:.1f} bytes per track, '
+        'reading {} path attributes: {:.4f}s'.format(
+            args.dataset,
+            args.n_tracks,
+            elapsed,
+            memory / float(args.n_tracks),
+            len(path_attributes),
+            access,
+        )
+    )
+    print(
+        '__dict__ slot: {:.1f} KB per {} tracks, {} of them have a __dict__'.format(
+            dict_slot_memory(args.n_tracks) / 1024.0,
+            args.n_tracks,
+            sum(bool(track.__dict__) for track in tracks),
+        )
+    )
+
+
+if __name__ == '__main__':
+    PARSER = argparse.ArgumentParser(description='Benchmark Track construction.')
+    PARSER.add_argument('--dataset', type=str, default='tinysol')
+    PARSER.add_argument('--data-home', type=str, default=None)
+    PARSER.add_argument('--n-tracks', type=int, default=10000)
+    main(PARSER.parse_args())
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Benchmark the cost of sending tracks to worker processes: pickled size and
+# the time to map over n_tracks tracks with a multiprocessing pool, pickling
+# tracks with Track.__reduce__ (track_id and data_home) or with their full
+# state (slots and __dict__), which is what pickle does by default.
+#
+# Usage: python benchmark_track_pickling.py --dataset dali
+import argparse
+import copyreg
+import itertools
+import multiprocessing
+from multiprocessing.reduction import ForkingPickler
+import pickle
+import time
+
+import mirdata
+
+
+def full_state(track):
+    slots = {}
+    for cls in type(track).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            if slot not in ('__dict__', '__weakref__') and hasattr(track, slot):
+                slots[slot] = getattr(track, slot)
+    return (copyreg.__newobj__, (type(track),), (track.__dict__, slots))
+
+
+def get_track_id(track):
+    return track.track_id
+
+
+def run(tracks, n_workers, chunksize):
+    with multiprocessing.get_context('spawn').Pool(n_workers) as pool:
+        pool.map(get_track_id, tracks[:n_workers], chunksize=1)  # start workers
+        start = time.perf_counter()
+        pool.map(get_track_id, tracks, chunksize=chunksize)
+        return time.perf_counter() - start
+
+
+def main(args):
+    dataset = mirdata.Dataset(args.dataset, data_home=args.data_home)
+    track_ids = list(
+        itertools.islice(itertools.cycle(dataset.track_ids), args.n_tracks)
+    )
+    tracks = [dataset.track(track_id) for track_id in track_ids]
+
+    for name in ['reduce', 'full state']:
+        if name == 'full state':
+            ForkingPickler.register(type(tracks[0]), full_state)
+            copyreg.pickle(type(tracks[0]), full_state)
+        size = len(pickle.dumps(tracks, pickle.HIGHEST_PROTOCOL))
+        print(
+            '{:10}: {} tracks, {:.1f} bytes per track, pool.map: {:.4f}s'.format(
+                name,
+                args.n_tracks,
+                size / float(args.n_tracks),
+                run(tracks, args.n_workers, args.chunksize),
+            )
+        )
+
+
+if __name__ == '__main__':
+    PARSER = argparse.ArgumentParser(description='Benchmark Track pickling.')
+    PARSER.add_argument('--dataset', type=str, default='dali')
+    PARSER.add_argument('--data-home', type=str, default=None)
+    PARSER.add_argument('--n-tracks', type=int, default=10000)
+    PARSER.add_argument('--n-workers', type=int, default=2)
+    PARSER.add_argument('--chunksize', type=int, default=100)
+    main(PARSER.parse_args())
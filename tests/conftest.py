@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
+import http.server
+import io
 import pytest
 import os
+import re
+import threading
+import zipfile
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -44,6 +49,64 @@ def report_file(request):
     return request.config.getoption('--report-file')
 
 
+class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the server's `content` at any url, honouring Range headers,
+    and counts the bytes sent in the server's `bytes_sent`"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.server.content)))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+    def do_GET(self):
+        content = self.server.content
+        match = re.match(r'bytes=(\d+)-(\d+)', self.headers.get('Range', ''))
+        if match is None:
+            self.send_response(200)
+            data = content
+        else:
+            start, end = int(match.group(1)), int(match.group(2))
+            data = content[start : end + 1]
+            self.send_response(206)
+            self.send_header(
+                'Content-Range', 'bytes {}-{}/{}'.format(start, end, len(content))
+            )
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.bytes_sent += len(data)
+
+
+@pytest.fixture
+def range_server():
+    """Local http server supporting range requests: set its `content`
+    attribute to the bytes to serve"""
+    server = http.server.HTTPServer(('127.0.0.1', 0), RangeRequestHandler)
+    server.content = b''
+    server.bytes_sent = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def remote_zip():
+    """Bytes of a zip archive with two audio and two annotation files"""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zfile:
+        zfile.writestr('audio/track1.wav', os.urandom(2 ** 20))
+        zfile.writestr('audio/track2.wav', os.urandom(2 ** 20))
+        zfile.writestr('annotations/track1.txt', b'0.0\t1.0\n')
+        zfile.writestr('annotations/track2.txt', b'0.0\t2.0\n')
+    return zip_buffer.getvalue()
+
+
 def pytest_sessionstart(session):
     session.results = dict()
 
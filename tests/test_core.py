@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import itertools
+import os
+import pickle
+import shutil
 import sys
+import time
 import pytest
 import numpy as np
+import soundfile
 
 import mirdata
-from mirdata import core
+from mirdata import core, download_utils, utils
 
 if sys.version_info.major == 3:
     builtin_module_name = "builtins"
@@ -39,7 +46,8 @@ def test_track_repr():
     expected1 = """Track(\n  a="asdf",\n  b=1.2345678,\n  """
     expected2 = """c={1: 'a', 'b': 2},\n  e=None,\n  """
     expected3 = """long="...{}",\n  """.format("b" * 50 + "c" * 50)
-    expected4 = """f: ThisObjectType,\n  g: I have an improper docstring,\n)"""
+    expected4 = """duration: float,\n  f: ThisObjectType,\n  """
+    expected4 += """g: I have an improper docstring,\n)"""
 
     test_track = TestTrack()
     actual = test_track.__repr__()
@@ -58,6 +66,43 @@ def test_track_repr():
         bad_track.__repr__()
 
 
+def test_track_descriptors():
+    class TestTrack(core.Track):
+        __slots__ = ()
+
+        audio_path = core.TrackPath("audio")
+        annotation_path = core.TrackPath("annotation", "annotations")
+        title = core.TrackMetadata("title")
+        artist = core.TrackMetadata("artist")
+
+        def __init__(self):
+            self.track_id = "a"
+            self._data_home = "data_home"
+            self._track_paths = {"audio": ["a.wav", None], "annotation": [None, None]}
+            self._track_metadata = {"title": "A"}
+
+    track = TestTrack()
+    assert track.audio_path == os.path.join("data_home", "a.wav")
+    assert track.annotation_path is None
+    assert track.title == "A"
+    assert track.artist is None
+    # nothing is stored per track besides the slots
+    assert track.__dict__ == {}
+    assert isinstance(TestTrack.audio_path, core.TrackPath)
+
+    expected = """Track(\n  annotation_path=None,\n  artist=None,\n  """
+    expected += """audio_path="{}",\n  title="A",\n  track_id="a",\n  """.format(
+        os.path.join("data_home", "a.wav")
+    )
+    expected += """duration: float,\n)"""
+    assert track.__repr__() == expected
+
+    track._track_paths["annotation"] = ["b.txt", None]
+    assert track.annotation_path == os.path.join(
+        "data_home", "annotations", "b.txt"
+    )
+
+
 def test_dataset():
     dataset = mirdata.Dataset("guitarset")
     assert isinstance(dataset, core.Dataset)
@@ -71,6 +116,420 @@ def test_dataset():
     print(dataset)  # test that repr doesn't fail
 
 
+def test_dataset_track_cache():
+    dataset = mirdata.Dataset("orchset")
+    assert dataset.track("Beethoven-S3-I-ex1") is not dataset.track(
+        "Beethoven-S3-I-ex1"
+    )
+
+    dataset = mirdata.Dataset("orchset", cache_tracks=True)
+    track = dataset.track("Beethoven-S3-I-ex1")
+    assert dataset.track("Beethoven-S3-I-ex1") is track
+    assert dataset.load_tracks()["Beethoven-S3-I-ex1"] is track
+    dataset.data_home = "asdf"
+    assert dataset.track("Beethoven-S3-I-ex1") is not track
+    # tracks are only kept while something else holds them
+    del track
+    assert len(dataset._tracks) == 0
+
+    dataset = mirdata.Dataset("orchset", cache_tracks=True, track_cache_size=2)
+    track_id = id(dataset.track("Beethoven-S3-I-ex1"))
+    assert id(dataset.track("Beethoven-S3-I-ex1")) == track_id
+    dataset.track("Beethoven-S3-I-ex2")
+    dataset.track("Beethoven-S3-I-ex3")
+    assert len(dataset._tracks) == 2
+    assert "Beethoven-S3-I-ex1" not in [key[0] for key in dataset._tracks.keys()]
+
+
+def _track_id_length(track):
+    return len(track.track_id)
+
+
+def test_dataset_sequence():
+    dataset = mirdata.Dataset("orchset")
+    track_ids = sorted(dataset.track_ids)
+    assert len(dataset) == len(track_ids)
+    assert dataset[0].track_id == track_ids[0]
+    assert dataset[-1].track_id == track_ids[-1]
+    assert dataset[np.int64(1)].track_id == track_ids[1]
+    assert [track.track_id for track in dataset[2:5]] == track_ids[2:5]
+    with pytest.raises(IndexError):
+        dataset[len(track_ids)]
+    with pytest.raises(TypeError):
+        dataset[track_ids[0]]
+
+    dataset = mirdata.Dataset("orchset", data_home="asdf", transform=_track_id_length)
+    assert dataset[0] == len(track_ids[0])
+    assert dataset[:2] == [len(track_id) for track_id in track_ids[:2]]
+
+
+def test_dataset_pickle():
+    dataset = mirdata.Dataset(
+        "orchset", data_home="asdf", cache_tracks=True, transform=_track_id_length
+    )
+    dataset.track_ids
+    pickled = pickle.dumps(dataset)
+    # the index is not pickled
+    assert len(pickled) < 500
+
+    unpickled = pickle.loads(pickled)
+    assert unpickled.name == "orchset"
+    assert unpickled.data_home == "asdf"
+    assert unpickled._tracks is not None
+    assert unpickled.transform is _track_id_length
+    assert unpickled[3] == dataset[3]
+
+
+def test_track_pickle():
+    dataset = mirdata.Dataset(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track = dataset.track("Beethoven-S3-I-ex1")
+    melody = track.melody
+    track.large = np.zeros(10000)
+    pickled = pickle.dumps(track)
+    # neither cached annotations nor other attributes are pickled
+    assert len(pickled) < 300
+
+    unpickled = pickle.loads(pickled)
+    assert type(unpickled) is type(track)
+    assert unpickled.track_id == track.track_id
+    assert unpickled.melody_path == track.melody_path
+    assert np.array_equal(unpickled.melody.frequencies, melody.frequencies)
+    assert not hasattr(unpickled, "large")
+
+
+def test_dataset_shard(tmpdir):
+    dataset = mirdata.Dataset("orchset")
+    track_ids = sorted(dataset.track_ids)
+    for strategy in ["contiguous", "hash"]:
+        shards = [dataset.shard(3, i, strategy=strategy) for i in range(3)]
+        assert sorted(sum(shards, [])) == track_ids
+        assert all(shard == sorted(shard) for shard in shards)
+    assert dataset.shard(3, 0) == track_ids[:21]
+    assert dataset.shard(3, 2) == track_ids[42:]
+    assert dataset.shard(1, 0, strategy="hash") == track_ids
+    # hash shards must not change across releases
+    assert dataset.shard(4, 1, strategy="hash")[:3] == [
+        "Beethoven-S3-I-ex3",
+        "Beethoven-S5-II-ex2",
+        "Brahms-HungarianDance-n5-ex1",
+    ]
+
+    with pytest.raises(ValueError):
+        dataset.shard(0, 0)
+    with pytest.raises(ValueError):
+        dataset.shard(3, 3)
+    with pytest.raises(ValueError):
+        dataset.shard(3, 0, strategy="asdf")
+
+    data_home = str(tmpdir)
+    dataset = mirdata.Dataset("orchset", data_home=data_home)
+    durations = {"a": 50, "b": 40, "c": 30, "d": 20, "e": 10}
+    dataset._index = {"tracks": {}}
+    for track_id in list(durations) + ["f"]:
+        dataset._index["tracks"][track_id] = {
+            "audio": [track_id + ".wav", None],
+            "melody": [None, None],
+        }
+    # f has no audio
+    audio_info = {
+        track_id: {"audio": utils.AudioInfo(duration, 44100, 1, 0, "PCM_16")}
+        for track_id, duration in durations.items()
+    }
+    dataset.audio_info = lambda: audio_info
+    assert dataset.shard(2, 0, strategy="balanced") == ["a", "d", "e"]
+    assert dataset.shard(2, 1, strategy="balanced") == ["b", "c", "f"]
+
+    # on a dataset that is not downloaded, every track weighs 0
+    dataset = mirdata.Dataset("orchset", data_home=data_home)
+    shards = [dataset.shard(3, i, strategy="balanced") for i in range(3)]
+    assert sorted(sum(shards, [])) == track_ids
+
+
+def test_dataset_prefetch_iter():
+    dataset = mirdata.Dataset(
+        "orchset", data_home="tests/resources/mir_datasets/orchset"
+    )
+    track_id = "Beethoven-S3-I-ex1"
+    melody = dataset.track(track_id).melody
+    for processes in [False, True]:
+        results = list(
+            dataset.prefetch_iter(
+                ["melody", "melody_path"],
+                track_ids=[track_id] * 3,
+                prefetch=2,
+                workers=2,
+                processes=processes,
+            )
+        )
+        assert [result[0] for result in results] == [track_id] * 3
+        for _, data in results:
+            assert data["melody_path"] == dataset.track(track_id).melody_path
+            assert np.array_equal(data["melody"].frequencies, melody.frequencies)
+
+    class SlowTrack(object):
+        def __init__(self, track_id):
+            if track_id == "error":
+                raise ValueError(track_id)
+            time.sleep(0.05)
+            self.track_id = track_id
+
+    dataset.track = SlowTrack
+    consumed = []
+
+    def track_ids():
+        for track_id in ["a", "b", "c", "d", "error"]:
+            consumed.append(track_id)
+            yield track_id
+
+    iterator = dataset.prefetch_iter(["track_id"], track_ids(), prefetch=2, workers=1)
+    # loading stops when prefetch tracks are waiting to be consumed
+    assert consumed == ["a", "b"] and iterator.in_flight == 2
+    assert next(iterator) == ("a", {"track_id": "a"})
+    assert consumed == ["a", "b", "c"]
+    assert iterator.n_stalls == 1 and iterator.stall_time > 0
+
+    time.sleep(0.2)
+    assert iterator.queue_depth == 2
+    assert next(iterator)[0] == "b"
+    assert iterator.n_stalls == 1 and iterator.n_items == 2
+
+    assert [track_id for track_id, _ in itertools.islice(iterator, 2)] == ["c", "d"]
+    with pytest.raises(ValueError):
+        next(iterator)
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+    with dataset.prefetch_iter(["track_id"], ["a", "b", "c"]) as iterator:
+        next(iterator)
+    assert iterator.in_flight == 0
+
+    with pytest.raises(ValueError):
+        dataset.prefetch_iter(["track_id"], prefetch=0)
+
+
+def test_dataset_random_crops(tmpdir):
+    data_home = os.path.join(str(tmpdir), "orchset")
+    shutil.copytree("tests/resources/mir_datasets/orchset", data_home)
+    dataset = mirdata.Dataset("orchset", data_home=data_home)
+    track_id = "Beethoven-S3-I-ex1"
+    track = dataset.track(track_id)
+    sampler = dataset.random_crops(
+        1.0,
+        fields=["melody"],
+        track_ids=[track_id],
+        audio_attribute="audio_path_mono",
+        seed=0,
+        n_crops=3,
+    )
+    assert len(sampler) == 3
+    crops = list(sampler)
+    assert len(crops) == 3
+    audio, sr = track.audio_mono
+    duration = len(audio) / float(sr)
+    assert np.isclose(sampler.durations[0], duration)
+    for crop in crops:
+        assert crop["track_id"] == track_id
+        assert 0 <= crop["offset"] <= duration - 1.0
+        start = int(round(crop["offset"] * sr))
+        assert np.allclose(crop["audio"][0], audio[start : start + sr], atol=1e-4)
+        melody = crop["melody"]
+        assert np.all((melody.times >= 0) & (melody.times < 1.0))
+        keep = (track.melody.times >= crop["offset"]) & (
+            track.melody.times < crop["offset"] + 1.0
+        )
+        assert np.allclose(melody.frequencies, track.melody.frequencies[keep])
+
+    # reproducible for a seed, epoch and worker
+    offsets = [crop["offset"] for crop in crops]
+    assert [crop["offset"] for crop in sampler] == offsets
+    sampler.set_epoch(1)
+    assert [crop["offset"] for crop in sampler] != offsets
+    sampler = dataset.random_crops(
+        1.0, track_ids=[track_id], audio_attribute="audio_path_mono", seed=0, worker=1
+    )
+    assert next(iter(sampler))["offset"] not in offsets
+
+    # tracks without audio are never drawn
+    sampler = dataset.random_crops(
+        1.0,
+        track_ids=[track_id, "Beethoven-S3-I-ex2"],
+        audio_attribute="audio_path_mono",
+        seed=0,
+        n_crops=5,
+    )
+    assert np.allclose(sampler.durations, [duration, 0.0])
+    assert {crop["track_id"] for crop in sampler} == {track_id}
+    sampler.durations = np.array([0.0, 0.0])
+    with pytest.raises(ValueError):
+        next(iter(sampler))
+
+    with pytest.raises(ValueError):
+        dataset.random_crops(0)
+
+
+def test_dataset_audio_info(tmpdir, mocker):
+    data_home = os.path.join(str(tmpdir), "orchset")
+    shutil.copytree("tests/resources/mir_datasets/orchset", data_home)
+    dataset = mirdata.Dataset("orchset", data_home=data_home)
+    track_id = "Beethoven-S3-I-ex1"
+
+    audio_info = dataset.audio_info(workers=2)
+    # the other tracks' files are not in the test data
+    assert list(audio_info.keys()) == [track_id]
+    mono = audio_info[track_id]["audio_mono"]
+    stereo = audio_info[track_id]["audio_stereo"]
+    assert mono.channels == 1 and stereo.channels == 2
+    assert mono.sr == 44100 and mono.frames == 88200
+    assert np.isclose(mono.duration, 2.0)
+    assert mono.codec == "WAV/PCM_16"
+    assert os.path.exists(os.path.join(data_home, "orchset_index_audio_info.json"))
+
+    # durations are read from the table once it is loaded
+    mock_info = mocker.patch.object(core.utils.soundfile, "info")
+    assert dataset.track(track_id).duration == mono.duration
+    assert dataset.track(track_id).to_jams().file_metadata.duration == mono.duration
+    assert dataset.audio_info() is audio_info
+    assert core.utils.LargeData("orchset_index.json").audio_info(data_home) == (
+        audio_info
+    )
+    mock_info.assert_not_called()
+
+    mocker.stopall()
+    # files changed since the table was loaded are read again
+    mono_path = os.path.join(data_home, "audio", "mono", track_id + ".wav")
+    soundfile.write(mono_path, np.zeros(44100), 44100)
+    os.utime(mono_path, ns=(0, 0))
+    assert core.utils.get_audio_duration(mono_path) == 1.0
+    audio_info = dataset.audio_info()
+    assert audio_info[track_id]["audio_mono"].duration == 1.0
+
+    stereo_path = os.path.join(data_home, "audio", "stereo", track_id + ".wav")
+    os.remove(stereo_path)
+    audio_info = dataset.audio_info()
+    assert list(audio_info[track_id].keys()) == ["audio_mono"]
+    assert dataset.audio_info(recompute=True) == audio_info
+    assert dataset.track(track_id).duration == 1.0
+
+    os.remove(mono_path)
+    assert dataset.track(track_id).duration is None
+
+
+def test_dataset_audio_info_read_only(tmpdir, mocker, monkeypatch):
+    data_home = os.path.join(str(tmpdir), "orchset")
+    shutil.copytree("tests/resources/mir_datasets/orchset", data_home)
+    table_path = os.path.join(data_home, "orchset_index_audio_info.json")
+    mkstemp = core.utils.tempfile.mkstemp
+
+    def read_only_mkstemp(dir=None, **kwargs):
+        if os.path.realpath(dir) == os.path.realpath(data_home):
+            raise PermissionError("read-only")
+        return mkstemp(dir=dir, **kwargs)
+
+    mocker.patch.object(core.utils.tempfile, "mkstemp", side_effect=read_only_mkstemp)
+    monkeypatch.delenv(core.utils.METADATA_CACHE_ENV, raising=False)
+    audio_info = core.utils.LargeData("orchset_index.json").audio_info(data_home)
+    assert list(audio_info.keys()) == ["Beethoven-S3-I-ex1"]
+    assert not os.path.exists(table_path)
+
+    # saved to the metadata cache directory instead if it is set
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    monkeypatch.setenv(core.utils.METADATA_CACHE_ENV, cache_dir)
+    assert core.utils.LargeData("orchset_index.json").audio_info(data_home) == (
+        audio_info
+    )
+    assert not os.path.exists(table_path)
+    assert len(os.listdir(cache_dir)) == 1
+
+    mock_info = mocker.patch.object(core.utils.soundfile, "info")
+    assert core.utils.LargeData("orchset_index.json").audio_info(data_home) == (
+        audio_info
+    )
+    mock_info.assert_not_called()
+
+
+def test_dataset_iter_batches(tmpdir):
+    data_home = str(tmpdir)
+    dataset = mirdata.Dataset("orchset", data_home=data_home)
+    durations = [1.0, 3.0, 1.5, 3.5, 2.5, 0.5]
+    track_ids = dataset.track_ids[: len(durations)]
+    sr = 8000
+    for track_id, duration in zip(track_ids, durations):
+        audio_path = dataset.track(track_id).audio_path_mono
+        os.makedirs(os.path.dirname(audio_path), exist_ok=True)
+        soundfile.write(audio_path, np.full(int(duration * sr), 0.5), sr)
+
+    batches = list(
+        dataset.iter_batches(
+            2, [2.0], audio_property="audio_mono", track_ids=track_ids, workers=2
+        )
+    )
+    # [1.0, 1.5], [0.5] under 2s, [3.0, 3.5], [2.5] above
+    assert [batch["track_ids"] for batch in batches] == [
+        [track_ids[0], track_ids[2]],
+        [track_ids[5]],
+        [track_ids[1], track_ids[3]],
+        [track_ids[4]],
+    ]
+    batch = batches[0]
+    assert batch["sr"] == sr
+    assert batch["audio"].shape == (2, int(1.5 * sr))
+    assert batch["lengths"].tolist() == [sr, int(1.5 * sr)]
+    assert batch["mask"].shape == batch["audio"].shape
+    assert batch["mask"][0].sum() == sr and batch["mask"][1].all()
+    assert np.allclose(batch["audio"][batch["mask"]], 0.5, atol=1e-4)
+    assert np.all(batch["audio"][~batch["mask"]] == 0)
+
+    # the tracks which are not downloaded are left out
+    all_batches = list(dataset.iter_batches(2, [2.0], audio_property="audio_mono"))
+    assert [batch["track_ids"] for batch in all_batches] == [
+        batch["track_ids"] for batch in batches
+    ]
+
+    batches = list(
+        dataset.iter_batches(
+            2,
+            [2.0],
+            pad=False,
+            audio_property="audio_mono",
+            track_ids=track_ids,
+            drop_last=True,
+        )
+    )
+    assert len(batches) == 2
+    assert [len(y) for y in batches[1]["audio"]] == [3 * sr, int(3.5 * sr)]
+    assert "mask" not in batches[1]
+
+    def shuffled(seed):
+        return [
+            batch["track_ids"]
+            for batch in dataset.iter_batches(
+                2,
+                [2.0],
+                audio_property="audio_mono",
+                track_ids=track_ids,
+                shuffle=True,
+                seed=seed,
+            )
+        ]
+
+    assert shuffled(1) == shuffled(1)
+    assert sorted(sum(shuffled(1), [])) == sorted(track_ids)
+    assert all(
+        set(batch) <= set(track_ids[i] for i in [0, 2, 5])
+        or set(batch) <= set(track_ids[i] for i in [1, 3, 4])
+        for batch in shuffled(2)
+    )
+
+    with pytest.raises(ValueError):
+        next(dataset.iter_batches(2, [2.0, 1.0], track_ids=track_ids))
+    with pytest.raises(ValueError):
+        core._make_batch(["a", "b"], [(np.zeros(2), 1), (np.zeros(2), 2)], True)
+    with pytest.raises(ValueError):
+        core._make_batch(["a", "b"], [(np.zeros(2), 1), (np.zeros((2, 2)), 1)], True)
+
+
 def test_dataset_errors():
     with pytest.raises(ValueError):
         core.Dataset("not_a_dataset")
@@ -87,6 +546,157 @@ def test_dataset_errors():
         d.choice_track()
 
 
+def test_dataset_metadata():
+    dataset = mirdata.Dataset(
+        "giantsteps_key", data_home="tests/resources/mir_datasets/giantsteps_key"
+    )
+    assert dataset.metadata["3"]["tempo"] == 150
+    assert dataset.metadata is dataset.metadata
+
+    dataset = mirdata.Dataset("beatles")
+    with pytest.raises(NotImplementedError):
+        dataset.metadata
+
+
+def test_dataset_metadata_table():
+    dataset = mirdata.Dataset(
+        "tinysol", data_home="tests/resources/mir_datasets/tinysol"
+    )
+    table = dataset.metadata_table()
+    assert table["track_id"].tolist() == dataset.track_ids
+    assert "Family" in table and "Fold" in table
+    assert table["Family"].dtype == object  # tracks missing from the test metadata
+    row = dataset.track_ids.index("Cb-ord-A2-mf-2c-N")
+    assert table["Family"][row] == "Strings"
+    assert table["Fold"][row] == 4
+    assert dataset.metadata_table() is table
+
+    # index only
+    dataset = mirdata.Dataset("gtzan_genre")
+    table = dataset.metadata_table()
+    assert set(table.keys()) == {"track_id", "genre"}
+    assert table["genre"].dtype.kind == "U"
+    assert len(table["genre"]) == len(dataset.track_ids)
+
+
+def test_dataset_filter():
+    dataset = mirdata.Dataset(
+        "tinysol", data_home="tests/resources/mir_datasets/tinysol"
+    )
+    assert dataset.filter(Family="Strings") == ["Cb-ord-A2-mf-2c-N"]
+    assert dataset.filter(Family=["Strings", "Winds"]) == [
+        "Cb-ord-A2-mf-2c-N",
+        "Fl-ord-C4-mf-N-T14d",
+    ]
+    assert dataset.filter(Family="Strings", Fold=lambda fold: fold == 0) == []
+    assert dataset.filter(**{"Instrument (abbr.)": "Fl"}) == ["Fl-ord-C4-mf-N-T14d"]
+    assert len(dataset.filter()) == len(dataset.track_ids)
+    with pytest.raises(ValueError):
+        dataset.filter(asdf=1)
+
+    dataset = mirdata.Dataset("gtzan_genre")
+    hiphop = dataset.filter(genre="hip-hop")
+    assert len(hiphop) == 100
+    assert all(track_id.startswith("hiphop.") for track_id in hiphop)
+
+
+def test_dataset_download_skip_existing(mocker):
+    mock_download = mocker.patch.object(core.download_utils, "download_remotes")
+    dataset = mirdata.Dataset("orchset", data_home="a")
+    dataset.download(skip_existing=True)
+
+    args, kwargs = mock_download.call_args
+    assert args == ("a",)
+    assert kwargs["remotes"] == dataset._remotes
+    assert kwargs["skip_existing"]
+    assert kwargs["checksums"] == core.utils.index_checksums(dataset._index)
+
+    with pytest.raises(ValueError):
+        mirdata.Dataset("maestro").download(skip_existing=True)
+
+
+def test_dataset_download_members(mocker):
+    mock_members = mocker.patch.object(
+        core.download_utils, "download_zip_members", return_value=[]
+    )
+    dataset = mirdata.Dataset("orchset", data_home="a")
+    dataset.download_members("all", patterns=["GT/*"], index_keys=["melody"])
+
+    args, kwargs = mock_members.call_args
+    assert args == (dataset._remotes["all"], "a")
+    assert kwargs["patterns"] == ["GT/*"]
+    assert len(kwargs["members"]) == len(dataset.track_ids)
+    assert "GT/Beethoven-S3-I-ex1.mel" in kwargs["members"]
+
+    with pytest.raises(ValueError):
+        dataset.download_members("not_a_remote")
+
+    with pytest.raises(ValueError):
+        mirdata.Dataset("beatles").download_members("annotations")
+
+
+def test_dataset_repair(range_server, remote_zip, tmpdir, mocker):
+    range_server.content = remote_zip
+    data_home = str(tmpdir)
+    dataset = mirdata.Dataset("orchset", data_home=data_home)
+    dataset._remotes = {
+        "all": download_utils.RemoteFileMetadata(
+            filename="remote.zip",
+            url="http://127.0.0.1:{}/remote.zip".format(range_server.server_port),
+            checksum="1234",
+            destination_dir="data",
+        )
+    }
+    dataset._index = {
+        "tracks": {
+            "track1": {
+                "melody": [
+                    "data/annotations/track1.txt",
+                    hashlib.md5(b"0.0\t1.0\n").hexdigest(),
+                ]
+            },
+            "track2": {
+                "melody": [
+                    "data/annotations/track2.txt",
+                    hashlib.md5(b"0.0\t2.0\n").hexdigest(),
+                ]
+            },
+        }
+    }
+    mock_download = mocker.patch.object(dataset, "_download_fn")
+
+    dataset.download_members("all", patterns=["annotations/*"])
+    track1_path = os.path.join(data_home, "data", "annotations", "track1.txt")
+    track2_path = os.path.join(data_home, "data", "annotations", "track2.txt")
+    os.remove(track1_path)
+    with open(track2_path, "w") as fhandle:
+        fhandle.write("corrupted")
+
+    missing, invalid = dataset.validate(verbose=False)
+    assert missing["tracks"] == {"track1": [track1_path]}
+    assert invalid["tracks"] == {"track2": [track2_path]}
+
+    missing, invalid = dataset.repair(verbose=False)
+    assert missing == {"tracks": {}}
+    assert invalid == {"tracks": {}}
+    # only the broken files were fetched, the audio was never downloaded
+    mock_download.assert_not_called()
+    assert not os.path.exists(os.path.join(data_home, "data", "audio"))
+
+    missing, invalid = dataset.repair(verbose=False)
+    assert missing == {"tracks": {}}
+
+    # files which can't be found in any listed remote fall back to a full download
+    dataset._index["tracks"]["track3"] = {"melody": ["data/track3.txt", "1234"]}
+    dataset._remotes["other"] = dataset._remotes["all"]._replace(
+        filename="other.tar.gz"
+    )
+    missing, invalid = dataset.repair(verbose=False)
+    mock_download.assert_called_once()
+    assert mock_download.call_args[1]["partial_download"] == ["other"]
+    assert missing["tracks"] == {"track3": [os.path.join(data_home, "data/track3.txt")]}
+
+
 def test_multitrack_basic():
     class TestTrack(core.Track):
         def __init__(self, key):
@@ -69,6 +69,54 @@ def test_downloader(mocker, mock_path, capsys):
     mock_tar.assert_called_once_with(tar_remote, 'a', False, True)
     mocker.resetall()
 
+    # tar only, streaming
+    mock_stream = mocker.patch.object(download_utils, 'stream_tar_file')
+    download_utils.download_remotes('a', remotes={'b': tar_remote}, stream=True)
+    mock_stream.assert_called_once_with(tar_remote, 'a', False)
+    mocker.resetall()
+
+    # streaming, skipping existing files
+    download_utils.download_remotes(
+        'a',
+        remotes={'b': tar_remote},
+        stream=True,
+        skip_existing=True,
+        checksums={'file.txt': '1234'},
+    )
+    mock_stream.assert_called_once_with(
+        tar_remote,
+        'a',
+        False,
+        skip_existing=True,
+        checksums={os.path.join('a', 'file.txt'): '1234'},
+    )
+    mock_tar.assert_not_called()
+    mocker.resetall()
+
+    # zip and tar, skipping existing files
+    download_utils.download_remotes(
+        'a',
+        remotes={'b': zip_remote, 'c': tar_remote},
+        skip_existing=True,
+        checksums={'file.txt': '1234'},
+    )
+    expected_checksums = {os.path.join('a', 'file.txt'): '1234'}
+    mock_zip.assert_called_once_with(
+        zip_remote, 'a', False, True, skip_existing=True, checksums=expected_checksums
+    )
+    mock_tar.assert_called_once_with(
+        tar_remote, 'a', False, True, skip_existing=True, checksums=expected_checksums
+    )
+    mocker.resetall()
+
+    # zip with a path rewrite
+    rewrite_remote = zip_remote._replace(path_rewrite='folder')
+    download_utils.downloader('a', remotes={'b': rewrite_remote})
+    mock_zip.assert_called_once_with(
+        rewrite_remote, 'a', False, True, path_rewrite='folder'
+    )
+    mocker.resetall()
+
     # file only
     download_utils.downloader('a', remotes={'b': file_remote})
     mock_file.assert_called_once_with(file_remote, 'a', False)
@@ -191,6 +239,134 @@ def test_untar():
     os.remove(expected_file_location)
 
 
+def test_unzip_skip_existing(tmpdir, mocker):
+    zip_path = os.path.join(str(tmpdir), 'file.zip')
+    shutil.copy('tests/resources/file.zip', zip_path)
+    file_path = os.path.join(str(tmpdir), 'file.txt')
+    download_utils.unzip(zip_path, cleanup=False)
+    with open(file_path) as fhandle:
+        content = fhandle.read()
+
+    mock_extract = mocker.patch.object(
+        download_utils, 'extractall_unicode', wraps=download_utils.extractall_unicode
+    )
+    download_utils.unzip(zip_path, cleanup=False, skip_existing=True)
+    assert mock_extract.call_args[1]['members'] == []
+
+    # a file with the expected size but a different checksum is extracted again
+    with open(file_path, 'w') as fhandle:
+        fhandle.write('x' * len(content))
+    download_utils.unzip(
+        zip_path,
+        cleanup=False,
+        skip_existing=True,
+        checksums={file_path: download_utils.md5('tests/resources/file.zip')},
+    )
+    assert len(mock_extract.call_args[1]['members']) == 1
+    with open(file_path) as fhandle:
+        assert fhandle.read() == content
+
+
+def test_untar_skip_existing(tmpdir):
+    tar_path = os.path.join(str(tmpdir), 'file.tar.gz')
+    shutil.copy('tests/resources/file.tar.gz', tar_path)
+    file_path = os.path.join(str(tmpdir), 'file', 'file.txt')
+    download_utils.untar(tar_path, cleanup=False)
+    mtime = os.path.getmtime(file_path)
+    os.utime(file_path, (mtime - 100, mtime - 100))
+
+    download_utils.untar(tar_path, cleanup=False, skip_existing=True)
+    assert os.path.getmtime(file_path) == mtime - 100
+
+    # a file with a different size is extracted again
+    with open(file_path, 'w') as fhandle:
+        fhandle.write('corrupted')
+    download_utils.untar(tar_path, cleanup=False, skip_existing=True)
+    assert os.path.getsize(file_path) == 0
+
+
+def test_rewrite_member_path():
+    assert download_utils.rewrite_member_path('a/b.txt', None) == 'a/b.txt'
+    assert download_utils.rewrite_member_path('a/b.txt', 'a') == 'b.txt'
+    assert download_utils.rewrite_member_path('a/b.txt', 'a/') == 'b.txt'
+    assert download_utils.rewrite_member_path('a/', 'a') is None
+    assert download_utils.rewrite_member_path('ab/c.txt', 'a') == 'ab/c.txt'
+    assert download_utils.rewrite_member_path('a/b.txt', lambda p: None) is None
+    assert (
+        download_utils.rewrite_member_path('a/b.txt', lambda p: p.upper())
+        == 'A/B.TXT'
+    )
+
+
+def test_unzip_path_rewrite(tmpdir):
+    zip_path = os.path.join(str(tmpdir), 'remote.zip')
+    with zipfile.ZipFile(zip_path, 'w') as zfile:
+        zfile.writestr('folder/', b'')
+        zfile.writestr('folder/sub/file.txt', b'a')
+        zfile.writestr('__MACOSX/folder/._file.txt', b'b')
+
+    download_utils.unzip(
+        zip_path,
+        path_rewrite=lambda p: None
+        if p.startswith('__MACOSX')
+        else download_utils.rewrite_member_path(p, 'folder'),
+    )
+    assert sorted(os.listdir(str(tmpdir))) == ['sub']
+    assert os.path.exists(os.path.join(str(tmpdir), 'sub', 'file.txt'))
+
+
+def test_untar_path_rewrite(tmpdir):
+    tar_path = os.path.join(str(tmpdir), 'file.tar.gz')
+    shutil.copy('tests/resources/file.tar.gz', tar_path)
+    download_utils.untar(tar_path, path_rewrite='file')
+    assert sorted(os.listdir(str(tmpdir))) == ['file.txt']
+
+
+def test_stream_tar_file(httpserver, tmpdir):
+    httpserver.serve_content(open('tests/resources/file.tar.gz', 'rb').read())
+
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename='file.tar.gz',
+        url=httpserver.url,
+        checksum=('dd308de1b9158bd0c5046ed0c56317ea'),
+        destination_dir='subfolder',
+    )
+
+    download_utils.stream_tar_file(TEST_REMOTE, str(tmpdir))
+    download_dir = os.path.join(str(tmpdir), 'subfolder')
+    assert os.path.exists(os.path.join(download_dir, 'file', 'file.txt'))
+    # neither the archive nor the staging folder are left behind
+    assert os.listdir(download_dir) == ['file']
+
+    # files already extracted are skipped
+    file_path = os.path.join(download_dir, 'file', 'file.txt')
+    mtime = os.path.getmtime(file_path)
+    os.utime(file_path, (mtime - 100, mtime - 100))
+    download_utils.stream_tar_file(TEST_REMOTE, str(tmpdir), skip_existing=True)
+    assert os.path.getmtime(file_path) == mtime - 100
+
+    with open(file_path, 'w') as fhandle:
+        fhandle.write('corrupted')
+    download_utils.stream_tar_file(TEST_REMOTE, str(tmpdir), skip_existing=True)
+    assert os.path.getsize(file_path) == 0
+
+
+def test_stream_tar_file_raises_IOError(httpserver, tmpdir):
+    httpserver.serve_content(open('tests/resources/file.tar.gz', 'rb').read())
+
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename='file.tar.gz',
+        url=httpserver.url,
+        checksum=('1234'),
+        destination_dir=None,
+    )
+
+    with pytest.raises(IOError):
+        download_utils.stream_tar_file(TEST_REMOTE, str(tmpdir))
+    # nothing is committed if the checksum does not match
+    assert os.listdir(str(tmpdir)) == []
+
+
 def test_download_zip_file(mocker, mock_file, mock_unzip):
     mock_file.return_value = "foo"
     download_utils.download_zip_file("a", "b", True)
@@ -235,3 +411,111 @@ def test_extractall_cp437(mocker, mock_file, mock_unzip):
         true_file_location = os.path.join('tests', 'resources', true_file)
         os.remove(true_file_location)
     shutil.rmtree(os.path.join('tests', 'resources','__MACOSX'))
+
+
+def test_http_range_file(range_server):
+    range_server.content = bytes(range(256)) * 1000
+    url = 'http://127.0.0.1:{}/remote.zip'.format(range_server.server_port)
+
+    remote_file = download_utils.HttpRangeFile(url, block_size=16)
+    assert remote_file.size == 256000
+    remote_file.seek(-256, 2)
+    assert remote_file.read(4) == bytes([0, 1, 2, 3])
+    assert remote_file.tell() == 255748
+    remote_file.seek(10)
+    assert remote_file.read(3) == bytes([10, 11, 12])
+    assert remote_file.bytes_read == 32
+
+
+def test_download_zip_members(range_server, remote_zip, tmpdir):
+    range_server.content = remote_zip
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename='remote.zip',
+        url='http://127.0.0.1:{}/remote.zip'.format(range_server.server_port),
+        checksum=('1234'),
+        destination_dir='subfolder',
+    )
+
+    extracted = download_utils.download_zip_members(
+        TEST_REMOTE, str(tmpdir), patterns=['annotations/*']
+    )
+    assert sorted(extracted) == ['annotations/track1.txt', 'annotations/track2.txt']
+    download_dir = os.path.join(str(tmpdir), 'subfolder')
+    assert os.listdir(download_dir) == ['annotations']
+    with open(os.path.join(download_dir, 'annotations', 'track2.txt'), 'rb') as fhandle:
+        assert fhandle.read() == b'0.0\t2.0\n'
+    # the ~2MB of audio members are not fetched
+    assert range_server.bytes_sent < len(remote_zip) / 10
+
+    extracted = download_utils.download_zip_members(
+        TEST_REMOTE,
+        str(tmpdir),
+        patterns=['annotations/*'],
+        members=['audio/track1.wav'],
+    )
+    # existing files are skipped
+    assert extracted == ['audio/track1.wav']
+    assert not os.path.exists(os.path.join(download_dir, 'audio', 'track2.wav'))
+
+
+def test_download_from_remote_archive_store(httpserver, tmpdir):
+    httpserver.serve_content(open('tests/resources/remote.wav').read())
+    archive_store = os.path.join(str(tmpdir), 'store')
+
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename='remote.wav',
+        url=httpserver.url,
+        checksum=('3f77d0d69dc41b3696f074ad6bf2852f'),
+        destination_dir=None,
+    )
+
+    # populate the store
+    download_utils.download_from_remote(
+        TEST_REMOTE,
+        os.path.join(str(tmpdir), 'home1'),
+        archive_store=archive_store,
+        populate_store=True,
+    )
+    store_path = os.path.join(
+        archive_store, '3f', '3f77d0d69dc41b3696f074ad6bf2852f'
+    )
+    assert os.path.exists(store_path)
+
+    # a second data home is served from the store, not from the network
+    broken_remote = TEST_REMOTE._replace(url='http://127.0.0.1:1/not_a_file')
+    download_path = download_utils.download_from_remote(
+        broken_remote, os.path.join(str(tmpdir), 'home2'), archive_store=archive_store
+    )
+    assert os.path.samefile(download_path, store_path)
+
+    # overwriting doesn't write through the hardlink into the store
+    download_utils.download_from_remote(
+        TEST_REMOTE,
+        os.path.join(str(tmpdir), 'home2'),
+        force_overwrite=True,
+        archive_store=archive_store,
+    )
+    assert download_utils.md5(store_path) == TEST_REMOTE.checksum
+
+
+def test_download_from_remote_archive_store_env(httpserver, tmpdir, monkeypatch):
+    httpserver.serve_content(open('tests/resources/remote.wav').read())
+    archive_store = os.path.join(str(tmpdir), 'store')
+    monkeypatch.setenv(download_utils.ARCHIVE_STORE_ENV, archive_store)
+
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename='remote.wav',
+        url=httpserver.url,
+        checksum=('3f77d0d69dc41b3696f074ad6bf2852f'),
+        destination_dir=None,
+    )
+
+    # the store is not populated unless asked to
+    download_utils.download_from_remote(TEST_REMOTE, os.path.join(str(tmpdir), 'a'))
+    assert not os.path.exists(archive_store)
+
+    monkeypatch.setenv(download_utils.ARCHIVE_STORE_POPULATE_ENV, '1')
+    download_utils.download_from_remote(TEST_REMOTE, os.path.join(str(tmpdir), 'b'))
+    assert os.path.exists(
+        os.path.join(archive_store, '3f', '3f77d0d69dc41b3696f074ad6bf2852f')
+    )
@@ -92,3 +92,17 @@ def test_load_meta():
     assert giantsteps_key.load_genre(None) is None
     assert giantsteps_key.load_artist(None) is None
     assert giantsteps_key.load_tempo(None) is None
+
+
+def test_load_metadata():
+    data_home = "tests/resources/mir_datasets/giantsteps_key"
+    metadata = giantsteps_key._load_metadata(data_home)
+    assert metadata["data_home"] == data_home
+    assert metadata["3"] == {
+        "artists": ["Jason Sparks"],
+        "genres": {"genres": ["Breaks"], "sub_genres": []},
+        "tempo": 150,
+    }
+    assert "4" not in metadata
+
+    assert giantsteps_key._load_metadata("asdf/asdf") is None
@@ -108,9 +108,10 @@ def test_download(httpserver):
             url=httpserver.url,
             checksum=("97a9a888d2a65cc87bb26e74df08b011"),
             destination_dir=None,
+            path_rewrite="groove",
         )
     }
-    groove_midi._download(data_home, remotes, None, None, False, False)
+    download_utils.downloader(data_home, remotes=remotes, cleanup=False)
 
     assert os.path.exists(data_home)
     assert not os.path.exists(os.path.join(data_home, "groove"))
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import os
+import pytest
 
 from tests.test_utils import run_track_tests
 from mirdata.datasets import irmas
@@ -99,3 +100,76 @@ def test_load_pred_inst():
     assert type(pred_inst_data_test[0]) is str
     assert pred_inst_data_test == ['gel', 'voi']
     assert irmas.load_pred_inst(None) is None
+
+
+def test_attribute_table(tmpdir, mocker):
+    irmas.DATA._metadata.clear()
+    mock_parse = mocker.spy(irmas, '_parse_track_attributes')
+    data_home = 'tests/resources/mir_datasets/irmas'
+    track = irmas.Track('1', data_home=data_home)
+    track_train = irmas.Track('0189__2', data_home=data_home)
+    mock_parse.assert_not_called()
+    assert track.instrument == ['gel', 'voi']
+    assert track_train.instrument == ['cla']
+    assert mock_parse.call_count == len(irmas.DATA.index['tracks'])
+
+    table = irmas.DATA.metadata(data_home)
+    assert table['0189__2'] == {
+        'predominant_instrument': 'cla',
+        'genre': 'cla',
+        'drum': None,
+        'train': True,
+        'instrument': ['cla'],
+    }
+    assert table['1']['instrument'] == ['gel', 'voi']
+    # not saved while testing annotations are missing
+    assert table['2']['instrument'] is None
+    assert not os.path.exists(os.path.join(data_home, irmas.ATTRIBUTE_TABLE))
+    assert mock_parse.call_count == len(irmas.DATA.index['tracks'])
+
+    # saved once every testing annotation is found
+    data_home = str(tmpdir)
+    for track_id, track_paths in irmas.DATA.index['tracks'].items():
+        if '__' in track_id:
+            continue
+        annotation_path = os.path.join(data_home, track_paths['annotation'][0])
+        if not os.path.isdir(os.path.dirname(annotation_path)):
+            os.makedirs(os.path.dirname(annotation_path))
+        with open(annotation_path, 'w') as fhandle:
+            fhandle.write('pia\n')
+    table = irmas.DATA.metadata(data_home)
+    assert table['1']['instrument'] == ['pia']
+    assert os.path.exists(os.path.join(data_home, irmas.ATTRIBUTE_TABLE))
+
+    mock_parse.reset_mock()
+    irmas.DATA._metadata.clear()
+    assert irmas.DATA.metadata(data_home) == table
+    mock_parse.assert_not_called()
+
+
+def test_parse_track_attributes():
+    assert irmas._parse_track_attributes(
+        '1234__1', 'IRMAS-TrainingData/pia/[pia][dru][jaz_blu]1234__1.wav'
+    ) == {
+        'predominant_instrument': 'pia',
+        'genre': 'jaz_blu',
+        'drum': True,
+        'train': True,
+        'instrument': ['pia'],
+    }
+    with pytest.raises(ValueError):
+        irmas._parse_track_attributes(
+            '1234__1', 'IRMAS-TrainingData/asd/[asd][dru][jaz_blu]1234__1.wav'
+        )
+    with pytest.raises(ValueError):
+        irmas._parse_track_attributes(
+            '1234__1', 'IRMAS-TrainingData/pia/[pia][dru][asd]1234__1.wav'
+        )
+
+
+def test_load_pred_inst_invalid(tmpdir):
+    annotation_path = str(tmpdir.join('annotation.txt'))
+    with open(annotation_path, 'w') as fhandle:
+        fhandle.write('pia\nasd\n')
+    with pytest.raises(ValueError):
+        irmas.load_pred_inst(annotation_path)
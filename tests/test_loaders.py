@@ -402,4 +402,25 @@ def test_multitracks():
 
         assert jam.validate(), "Jams validation failed for {}.MultiTrack({})".format(
             dataset_name, mtrack_id
-        )
\ No newline at end of file
+        )
+
+
+@pytest.mark.parametrize(
+    "dataset_name,track_id,tempo,artists,genres",
+    [
+        ("beatport_key", "1", 115, ["Lindstrom"], ["Electronica / Downtempo"]),
+        ("giantsteps_key", "3", 150, ["Jason Sparks"], ["Breaks"]),
+    ],
+)
+def test_track_metadata_parsed_once(
+    mocker, dataset_name, track_id, tempo, artists, genres
+):
+    # tempo, artists and genres share a single parse of the metadata file
+    module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
+    data_home = os.path.join("tests/resources/mir_datasets", dataset_name)
+    track = module.Track(track_id, data_home=data_home)
+    mock_load = mocker.patch.object(module, "load_meta", wraps=module.load_meta)
+    assert track.tempo == tempo
+    assert track.artists == artists
+    assert track.genres == {"genres": genres, "sub_genres": []}
+    mock_load.assert_called_once_with(track.metadata_path)
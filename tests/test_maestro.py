@@ -117,7 +117,7 @@ def test_download_partial(httpserver):
             filename="3-maestro-v2.0.0.json",
             url=httpserver.url,
             checksum=("d41d8cd98f00b204e9800998ecf8427e"),
-            destination_dir="maestro-v2.0.0",
+            destination_dir=None,
         ),
     }
     maestro._download(data_home, remotes, None, None, False, False)
@@ -163,6 +163,7 @@ def test_download(httpserver):
             url=httpserver.url,
             checksum=("625180ffa41cd9f2ab7252dd954b9e8a"),
             destination_dir=None,
+            path_rewrite="maestro-v2.0.0",
         )
     }
     maestro._download(data_home, remotes, None, None, False, False)
@@ -198,6 +199,7 @@ def test_download(httpserver):
             url=httpserver.url,
             checksum=("c82283fff347ed2bd833693c09a9f01d"),
             destination_dir=None,
+            path_rewrite="maestro-v2.0.0",
         )
     }
     maestro._download(data_home, remotes, ["midi"], None, False, False)
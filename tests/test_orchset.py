@@ -176,9 +176,10 @@ def test_download(httpserver):
             url=httpserver.url,
             checksum=("4794bc3514f7e8d1727f0d975d6d1ee2"),
             destination_dir=None,
+            path_rewrite="Orchset",
         )
     }
-    orchset._download(data_home, remotes, None, None, False, True)
+    download_utils.downloader(data_home, remotes=remotes)
 
     assert os.path.exists(data_home)
     assert not os.path.exists(os.path.join(data_home, "Orchset"))
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
+import os
+import shutil
+import mirdata
 from mirdata import utils
 from mirdata.datasets import saraga
 from tests.test_utils import run_track_tests
@@ -666,3 +669,64 @@ def test_load_audio():
 
     assert saraga.load_audio(None) is None
 
+
+def test_build_metadata_table(tmpdir, mocker):
+    data_home = str(tmpdir.join('saraga'))
+    shutil.copytree('tests/resources/mir_datasets/saraga', data_home)
+    table_path = os.path.join(data_home, saraga.METADATA_TABLE)
+    os.remove(table_path)
+
+    metadata_path = os.path.join(
+        data_home, saraga.DATA.index['tracks']['carnatic_1']['metadata'][0]
+    )
+    expected_metadata = saraga._load_metadata(metadata_path)
+
+    # built and saved on first load
+    table = saraga.DATA.metadata(data_home)
+    assert sorted(table.keys()) == ['carnatic_1', 'data_home', 'hindustani_1']
+    assert table['carnatic_1'] == expected_metadata
+    assert os.path.exists(table_path)
+
+    assert saraga.build_metadata_table(data_home) == table_path
+    mock_load = mocker.patch.object(saraga, '_load_metadata')
+    track = saraga.Track('carnatic_1', data_home=data_home)
+    mock_load.assert_not_called()
+    assert track._track_metadata == expected_metadata
+
+
+def test_load_tracks_reads_metadata_table(tmpdir, mocker):
+    data_home = str(tmpdir.join('saraga'))
+    shutil.copytree('tests/resources/mir_datasets/saraga', data_home)
+    dataset = mirdata.Dataset('saraga', data_home=data_home)
+
+    mock_open = mocker.patch('builtins.open', side_effect=open)
+    tracks = dataset.load_tracks()
+    for track in tracks.values():
+        track.title
+    assert [call[0][0] for call in mock_open.call_args_list] == [
+        os.path.join(data_home, saraga.METADATA_TABLE)
+    ]
+
+
+def test_metadata_table_without_metadata_files(tmpdir, mocker):
+    data_home = str(tmpdir)
+    mock_build = mocker.spy(saraga, '_build_metadata_table')
+    assert saraga.DATA.metadata(data_home) == {'data_home': data_home}
+    assert saraga.DATA.metadata(data_home) == {'data_home': data_home}
+    # the miss is cached, and no empty table is saved
+    assert mock_build.call_count == 1
+    assert not os.path.exists(os.path.join(data_home, saraga.METADATA_TABLE))
+
+
+def test_track_metadata_is_lazy(mocker):
+    data_home = 'tests/resources/mir_datasets/saraga'
+    mock_metadata = mocker.spy(saraga.DATA, 'metadata')
+    track = saraga.Track('carnatic_1', data_home=data_home)
+    assert track.iam_style == 'carnatic'
+    mock_metadata.assert_not_called()
+    assert track.__dict__ == {}
+
+    assert track.title == 'Bhuvini Dasudane'
+    assert mock_metadata.call_count == 1
+    track.mbid
+    assert mock_metadata.call_count == 1
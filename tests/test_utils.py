@@ -2,9 +2,14 @@
 
 import itertools
 import os
+import sqlite3
 import sys
+import threading
+import time
 import types
 
+import numpy as np
+
 import mirdata
 from mirdata import utils, download_utils
 
@@ -45,7 +50,10 @@ def get_attributes_and_properties(class_instance):
             continue
 
         attr = getattr(class_instance.__class__, val)
-        if isinstance(attr, mirdata.utils.cached_property):
+        if isinstance(attr, mirdata.core.TRACK_ATTRIBUTE_TYPES):
+            # per-track values, listed with the attributes below
+            continue
+        elif isinstance(attr, mirdata.utils.cached_property):
             cached_properties.append(val)
         elif isinstance(attr, property):
             properties.append(val)
@@ -100,6 +108,454 @@ def test_remote_index():
     assert DATA.index == little_index['tracks']
 
 
+def test_large_data_metadata_cache(mocker):
+    load_fn = mocker.Mock(side_effect=lambda data_home: {"data_home": data_home})
+    data = LargeData("beatles_index.json", load_fn, metadata_cache_size=2)
+
+    assert data.metadata("a") == {"data_home": "a"}
+    assert data.metadata("b") == {"data_home": "b"}
+    assert data.metadata("a") == {"data_home": "a"}
+    assert load_fn.call_count == 2
+
+    # "b" is the least recently used entry, so it is dropped
+    data.metadata("c")
+    data.metadata("a")
+    assert load_fn.call_count == 3
+    data.metadata("b")
+    assert load_fn.call_count == 4
+
+    load_fn.side_effect = lambda data_home: None
+    assert data.metadata("d") is None
+    assert data.metadata("d") is None
+    assert load_fn.call_count == 6
+
+    with pytest.raises(NotImplementedError):
+        LargeData("beatles_index.json").metadata("a")
+
+
+def test_large_data_metadata_resolved_key(tmpdir, mocker):
+    load_fn = mocker.Mock(side_effect=lambda data_home: {"data_home": data_home})
+    data = LargeData("beatles_index.json", load_fn)
+
+    data_home = str(tmpdir)
+    data.metadata(data_home)
+    data.metadata(os.path.join(data_home, ".", ""))
+    data.metadata(os.path.join(data_home, "sub", ".."))
+    assert load_fn.call_count == 1
+
+
+def test_large_data_metadata_mtime(tmpdir, mocker):
+    data_home = str(tmpdir)
+    metadata_path = os.path.join(data_home, "dali_metadata.json")
+    with open(metadata_path, "w") as fhandle:
+        fhandle.write("{}")
+
+    load_fn = mocker.Mock(side_effect=lambda data_home: {"data_home": data_home})
+    data = LargeData("dali_index.json", load_fn)
+    data.metadata(data_home)
+    data.metadata(data_home)
+    assert load_fn.call_count == 1
+
+    stat = os.stat(metadata_path)
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    data.metadata(data_home)
+    assert load_fn.call_count == 2
+    data.metadata(data_home)
+    assert load_fn.call_count == 2
+
+
+def test_large_data_metadata_paths_mtime(tmpdir, mocker):
+    data_home = str(tmpdir)
+    metadata_path = os.path.join(data_home, "metadata.json")
+    with open(metadata_path, "w") as fhandle:
+        fhandle.write("{}")
+
+    # the beatles index has no metadata section
+    load_fn = mocker.Mock(side_effect=lambda data_home: {"data_home": data_home})
+    data = LargeData("beatles_index.json", load_fn, metadata_paths=["metadata.json"])
+    data.metadata(data_home)
+    data.metadata(data_home)
+    assert load_fn.call_count == 1
+
+    stat = os.stat(metadata_path)
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    data.metadata(data_home)
+    assert load_fn.call_count == 2
+
+    os.remove(metadata_path)
+    data.metadata(data_home)
+    assert load_fn.call_count == 3
+    data.metadata(data_home)
+    assert load_fn.call_count == 3
+
+
+def test_large_data_metadata_persistent_cache(tmpdir, monkeypatch, mocker):
+    data_home = str(tmpdir.mkdir("data"))
+    cache_dir = str(tmpdir.join("cache"))
+    metadata_path = os.path.join(data_home, "dali_metadata.json")
+    with open(metadata_path, "w") as fhandle:
+        fhandle.write("{}")
+    monkeypatch.setenv(utils.METADATA_CACHE_ENV, cache_dir)
+
+    load_fn = mocker.Mock(side_effect=lambda data_home: {"data_home": data_home})
+    assert LargeData("dali_index.json", load_fn).metadata(data_home) == {
+        "data_home": data_home
+    }
+    assert load_fn.call_count == 1
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1 and cache_files[0].startswith("dali_index-")
+
+    # a new LargeData (e.g. in another process) reads the persisted metadata
+    assert LargeData("dali_index.json", load_fn).metadata(data_home) == {
+        "data_home": data_home
+    }
+    assert load_fn.call_count == 1
+
+    # stale: the source file changed
+    stat = os.stat(metadata_path)
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    LargeData("dali_index.json", load_fn).metadata(data_home)
+    assert load_fn.call_count == 2
+    LargeData("dali_index.json", load_fn).metadata(data_home)
+    assert load_fn.call_count == 2
+
+    # unreadable cache files fall back to the load function
+    with open(os.path.join(cache_dir, cache_files[0]), "wb") as fhandle:
+        fhandle.write(b"not a pickle")
+    LargeData("dali_index.json", load_fn).metadata(data_home)
+    assert load_fn.call_count == 3
+
+    # datasets without metadata files in their index are not persisted
+    LargeData("beatles_index.json", load_fn).metadata(data_home)
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_large_data_metadata_threads(mocker):
+    load_fn = mocker.Mock(side_effect=lambda data_home: {"data_home": data_home})
+    data = LargeData("beatles_index.json", load_fn, metadata_cache_size=3)
+    keys = ["a", "b", "c", "d", "e"]
+    errors = []
+
+    def worker():
+        try:
+            for i in range(200):
+                key = keys[i % len(keys)]
+                assert data.metadata(key)["data_home"] == key
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(data._metadata) == 3
+
+
+def test_single_flight(mocker):
+    calls = []
+
+    def slow_load(*args):
+        calls.append(args)
+        time.sleep(0.05)
+        return {"tracks": {}, "data_home": "asdf"}
+
+    class Track(mirdata.core.Track):
+        def __init__(self, track_id):
+            self.track_id = track_id
+
+        @utils.cached_property
+        def beats(self):
+            return slow_load()
+
+        @utils.cached_annotation
+        def notes(self):
+            return slow_load()
+
+    mocker.patch.object(utils, "load_json_index", side_effect=slow_load)
+    data = LargeData("beatles_index.json", slow_load)
+    track = Track("a")
+    getters = [
+        lambda: data.index,
+        lambda: data.metadata("asdf"),
+        lambda: track.beats,
+        lambda: track.notes,
+    ]
+    n_threads = 16
+    barrier = threading.Barrier(n_threads * len(getters))
+    results = [[] for _ in getters]
+    errors = []
+
+    def worker(i):
+        try:
+            barrier.wait()
+            results[i].append(getters[i]())
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,))
+        for i in range(len(getters))
+        for _ in range(n_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # one call each for the index, the metadata, beats and notes
+    assert len(calls) == len(getters)
+    for values in results:
+        assert len(values) == n_threads
+        assert all(value is values[0] for value in values)
+
+    # an exception is raised in all the waiting threads, and not cached
+    failing = mocker.Mock(side_effect=lambda: time.sleep(0.05) or 1 / 0)
+    flight = utils.SingleFlight()
+    errors = []
+    barrier = threading.Barrier(4)
+
+    def fail():
+        try:
+            barrier.wait()
+            flight.do("key", failing)
+        except ZeroDivisionError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=fail) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 4 and failing.call_count == 1
+    assert flight.do("key", lambda: 2) == 2
+
+
+def test_sqlite_index(tmpdir):
+    index_path = os.path.join(
+        os.path.dirname(utils.__file__), "datasets/indexes", "dali_index.json"
+    )
+    db_path = str(tmpdir.join("dali_index.sqlite"))
+    utils.build_sqlite_index(index_path, db_path)
+    assert os.listdir(str(tmpdir)) == ["dali_index.sqlite"]
+
+    with open(index_path) as fhandle:
+        expected_index = json.load(fhandle)
+    index = utils.SqliteIndex(db_path)
+    assert index == expected_index
+    assert list(index.keys()) == list(expected_index.keys())
+    assert index["version"] == expected_index["version"]
+
+    track_id = list(expected_index["tracks"].keys())[3]
+    assert track_id in index["tracks"]
+    assert "asdf" not in index["tracks"]
+    assert index["tracks"][track_id] == expected_index["tracks"][track_id]
+    assert list(index["tracks"]) == list(expected_index["tracks"])
+    assert len(index["tracks"]) == len(expected_index["tracks"])
+    assert index["metadata"] == expected_index["metadata"]
+    with pytest.raises(KeyError):
+        index["tracks"]["asdf"]
+    with pytest.raises(KeyError):
+        index["multitracks"]
+
+    # connections are per thread
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(index["tracks"][track_id])
+    )
+    thread.start()
+    thread.join()
+    assert results == [expected_index["tracks"][track_id]]
+
+
+def test_large_data_backend(tmpdir, mocker, monkeypatch):
+    index_path = os.path.join(
+        os.path.dirname(utils.__file__), "datasets/indexes", "beatles_index.json"
+    )
+    db_path = str(tmpdir.join("beatles_index.sqlite"))
+    utils.build_sqlite_index(index_path, db_path)
+    mock_load = mocker.patch.object(
+        utils, "load_sqlite_index", return_value=utils.SqliteIndex(db_path)
+    )
+
+    assert isinstance(LargeData("beatles_index.json").index, dict)
+    data = LargeData("beatles_index.json", backend="sqlite")
+    assert isinstance(data.index, utils.SqliteIndex)
+    mock_load.assert_called_once_with("beatles_index.json")
+
+    monkeypatch.setenv(utils.INDEX_BACKEND_ENV, "sqlite")
+    assert LargeData("beatles_index.json").backend == "sqlite"
+
+    mock_load.side_effect = sqlite3.OperationalError
+    assert isinstance(LargeData("beatles_index.json").index, dict)
+
+    with pytest.raises(ValueError):
+        LargeData("beatles_index.json", backend="asdf")
+
+
+def test_load_sqlite_index(tmpdir, monkeypatch):
+    indexes_dir = os.path.join(os.path.dirname(utils.__file__), "datasets/indexes")
+    indexes = sorted(os.listdir(indexes_dir))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+
+    index = utils.load_sqlite_index("beatles_index.json")
+    assert isinstance(index, utils.SqliteIndex)
+    cache_files = os.listdir(str(tmpdir.join("mirdata")))
+    assert len(cache_files) == 1 and cache_files[0].endswith("-beatles_index.sqlite")
+    # nothing is written next to the json indexes
+    assert sorted(os.listdir(indexes_dir)) == indexes
+
+    # the json index is used if the cache directory cannot be created
+    not_a_dir = tmpdir.join("file")
+    not_a_dir.write("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(not_a_dir))
+    with pytest.raises(OSError):
+        utils.load_sqlite_index("beatles_index.json")
+    assert isinstance(LargeData("beatles_index.json", backend="sqlite").index, dict)
+
+
+def test_large_data_query_metadata(mocker):
+    metadata = {
+        "a": {"metadata": {"language": "english"}, "ground-truth": True},
+        "b": {"metadata": {"language": "french"}, "ground-truth": True},
+        "c": {"metadata": {"language": "english"}, "ground-truth": False},
+        "data_home": "asdf",
+    }
+    load_fn = mocker.Mock(return_value=metadata)
+    data = LargeData("beatles_index.json", load_fn)
+
+    where = "json_extract(value, '$.metadata.language') = ?"
+    assert data.query_metadata("asdf", where, ["english"]) == ["a", "c"]
+    assert data.query_metadata(
+        "asdf", where + " AND json_extract(value, '$.ground-truth')", ["english"]
+    ) == ["a"]
+    assert load_fn.call_count == 1
+
+    load_fn.return_value = None
+    assert data.query_metadata("qwer", where, ["english"]) == []
+
+
+def test_nbytes():
+    array = np.zeros(1000)
+    assert utils.nbytes(array) >= 8000
+    f0 = utils.F0Data(array, array, None)
+    assert utils.nbytes(f0) >= 16000
+    assert utils.nbytes({"a": [array, "b"]}) >= 8000
+    assert utils.nbytes("a") == sys.getsizeof("a")
+
+
+def test_annotation_cache():
+    class Track(mirdata.core.Track):
+        __slots__ = ()
+
+        def __init__(self, track_id):
+            self.track_id = track_id
+
+    # not a mock, which would keep references to the tracks
+    def load_fn(track):
+        load_fn.call_count += 1
+        return np.zeros(100)
+
+    load_fn.call_count = 0
+    cache = utils.AnnotationCache(max_bytes=utils.nbytes(np.zeros(100)) * 2)
+    tracks = [Track("a"), Track("b"), Track("c")]
+
+    value = cache.get(tracks[0], "f0", load_fn)
+    assert cache.get(tracks[0], "f0", load_fn) is value
+    cache.get(tracks[1], "f0", load_fn)
+    cache.get(tracks[0], "f0", load_fn)
+    assert load_fn.call_count == 2
+    assert len(cache) == 2
+
+    # over budget: the least recently used entry, b's, is evicted
+    cache.get(tracks[2], "f0", load_fn)
+    assert len(cache) == 2
+    assert cache.nbytes <= cache.max_bytes
+    cache.get(tracks[1], "f0", load_fn)
+    assert load_fn.call_count == 4
+    assert cache.stats() == {"f0": utils.CacheStats(hits=2, misses=4, evictions=2)}
+
+    # entries are released with their track
+    del tracks[1]
+    assert len(cache) == 1
+
+    # too large to be cached
+    cache.get(tracks[0], "notes", lambda track: np.zeros(1000))
+    assert "notes" in cache.stats() and len(cache) == 1
+
+    cache.set_max_bytes(0)
+    assert len(cache) == 0 and cache.nbytes == 0
+    cache.clear()
+    assert cache.stats() == {}
+
+
+def test_cached_annotation(mocker):
+    load_fn = mocker.Mock(return_value=[1, 2, 3])
+
+    class Track(mirdata.core.Track):
+        __slots__ = ()
+
+        def __init__(self, track_id):
+            self.track_id = track_id
+
+        @utils.cached_annotation
+        def notes(self):
+            """list: notes"""
+            return load_fn()
+
+    assert isinstance(Track.notes, utils.cached_property)
+    track = Track("a")
+    assert track.notes is track.notes
+    assert load_fn.call_count == 1
+    assert Track("a").notes == [1, 2, 3]
+    assert load_fn.call_count == 2
+    # nothing is stored in the track
+    assert track.__dict__ == {}
+
+    stats = utils.ANNOTATION_CACHE.stats()
+    name = "tests.test_utils.test_cached_annotation.<locals>.Track.notes"
+    assert stats[name].hits == 1 and stats[name].misses == 2
+
+
+def test_crop_annotation():
+    f0 = utils.F0Data(np.array([0.0, 1.0, 2.0, 3.0]), np.array([1, 2, 3, 4]), None)
+    cropped = utils.crop_annotation(f0, 1.0, 3.0)
+    assert np.allclose(cropped.times, [0.0, 1.0])
+    assert np.allclose(cropped.frequencies, [2, 3])
+    assert cropped.confidence is None
+
+    notes = utils.NoteData(
+        np.array([[0.0, 1.5], [1.5, 2.0], [2.5, 4.0]]), np.array([60, 61, 62]), None
+    )
+    cropped = utils.crop_annotation(notes, 1.0, 3.0)
+    assert np.allclose(cropped.intervals, [[0.0, 0.5], [0.5, 1.0], [1.5, 2.0]])
+    assert np.allclose(cropped.notes, [60, 61, 62])
+
+    chords = utils.ChordData(np.array([[0.0, 1.0], [1.0, 2.0]]), ["A", "B"])
+    cropped = utils.crop_annotation(chords, 1.5, 3.0)
+    assert np.allclose(cropped.intervals, [[0.0, 0.5]])
+    assert cropped.labels == ["B"]
+
+    beats = utils.BeatData(np.array([0.5, 1.5, 2.5]), np.array([1, 2, 3]))
+    cropped = utils.crop_annotation(beats, 1.0, 2.0)
+    assert np.allclose(cropped.beat_times, [0.5])
+    assert np.allclose(cropped.beat_positions, [2])
+
+    events = utils.EventData(np.array([0.0, 2.0]), np.array([1.0, 5.0]), ["a", "b"])
+    cropped = utils.crop_annotation(events, 0.5, 3.0)
+    assert np.allclose(cropped.start_times, [0.0, 1.5])
+    assert np.allclose(cropped.end_times, [0.5, 2.5])
+    assert cropped.event == ["a", "b"]
+
+    tempo = utils.TempoData(np.array([0.0]), np.array([10.0]), np.array([120.0]), None)
+    cropped = utils.crop_annotation(tempo, 2.0, 4.0)
+    assert np.allclose(cropped.time, [0.0]) and np.allclose(cropped.duration, [2.0])
+
+    assert utils.crop_annotation("asdf", 0, 1) == "asdf"
+
+
 def test_md5(mocker):
     audio_file = b"audio1234"
 
@@ -155,3 +611,21 @@ def test_validator(mocker, mock_check_index, missing_files, invalid_checksums):
     assert m == missing_files
     assert c == invalid_checksums
     mock_check_index.assert_called_once_with("foo", "bar", False)
+
+
+def test_index_checksums():
+    index = {
+        "tracks": {
+            "a": {"audio": ["audio/a.wav", "1234"], "f0": [None, None]},
+            "b": {"audio": ["audio/b.wav", "5678"]},
+            "c": {"audio": ["./audio//c.wav", "9012"]},
+        },
+        "metadata": {"meta": ["metadata.csv", "abcd"]},
+    }
+    assert utils.index_checksums(index) == {
+        "audio/a.wav": "1234",
+        "audio/b.wav": "5678",
+        "audio/c.wav": "9012",
+        "metadata.csv": "abcd",
+    }
+    assert utils.index_checksums({"tracks": {}, "metadata": None}) == {}